@@ -9,6 +9,7 @@ from pogit.grid import GridSolver
 from pogit.particle import Particle
 from pogit.plugins import Plugin
 from pogit.writer import WriteAndSubmit
+from pogit.build import BuildCache
 
 # Sizes of the simulation box and grid
 xmax, ymax, zmax = 25e-6, 35e-6, 25e-6
@@ -58,6 +59,8 @@ protons = Particle( name='p', species='proton',
 
 diags = Plugin( period=N_diag, source='E, e_chargeDensity, e_all' )
 
+# Binaries are reused when the scan is repeated with the same param files
+build_cache = BuildCache()
 
 for doping_ratio in [0.01, 0.02, 0.03]:
     ions = Particle( name='N5', species='ion',
@@ -68,4 +71,5 @@ for doping_ratio in [0.01, 0.02, 0.03]:
                      relative_density=doping_ratio )
 
     WriteAndSubmit( (eons, protons, ions, gridSolver, laser, diags),
-      sim_name=f'ioniz-lwfa-{doping_ratio}', output_path='$PIC_SCRATCH' )
+      sim_name=f'ioniz-lwfa-{doping_ratio}', output_path='$PIC_SCRATCH',
+      build_cache=build_cache )
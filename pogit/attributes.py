@@ -0,0 +1,72 @@
+"""
+Attributes of the macroparticles. Each Particle object gets its own
+sequence of attributes in `speciesDefinition.param`: the ones required
+by the species type, and the extras requested for the species (e.g.
+`momentumPrev1` for the radiation plugin or `particleId` for tracking),
+so that the memory of the frames is spent only on the attributes used.
+"""
+# C++ identifiers of the attributes, their numbers of components (None
+# for simDim) and the sizes of a component in bytes (None for float_X)
+particle_attributes = {
+    'position': ( 'position< position_pic >', None, None ),
+    'momentum': ( 'momentum', 3, None ),
+    'weighting': ( 'weighting', 1, None ),
+    'momentumPrev1': ( 'momentumPrev1', 3, None ),
+    'particleId': ( 'particleId', 1, 8 ),
+    'boundElectrons': ( 'boundElectrons', 1, None ),
+    'probeE': ( 'probeE', 3, None ),
+    'probeB': ( 'probeB', 3, None ),
+    'radiationMask': ( 'radiationMask', 1, 1 ),
+    'transitionRadiationMask': ( 'transitionRadiationMask', 1, 1 ),
+}
+
+# attributes needed by the species types: the pusher, current deposition
+# and density initialization use the weighting, and the ionizers use
+# the bound electrons
+_pushed = ( 'position', 'momentum', 'weighting' )
+required_attributes = {
+    'electron': _pushed,
+    'proton': _pushed,
+    'photon': _pushed,
+    'generic_nonionizable': _pushed,
+    'ion': _pushed + ( 'boundElectrons', ),
+    'generic_ionizable': _pushed + ( 'boundElectrons', ),
+    'probe': ( 'position', 'probeB', 'probeE' ),
+}
+
+def SpeciesAttributes( species, attributes=None ):
+    """
+    Returns the list of the attributes of the species type: the required
+    ones followed by the given `attributes` (list of the names of
+    `particle_attributes`)
+    """
+    if species not in required_attributes:
+        raise ValueError(f'Unknown species type {species}')
+
+    result = list(required_attributes[species])
+    for name in attributes or ():
+        if name not in particle_attributes:
+            raise ValueError( f'Unknown particle attribute {name}, '
+                              f'use {tuple(particle_attributes)}' )
+        if name not in result:
+            result.append(name)
+
+    return result
+
+def AttributeBytes( name, dim='3d', float_bytes=4 ):
+    """
+    Returns the number of bytes of the attribute of a macroparticle
+    """
+    identifier, components, size = particle_attributes[name]
+    if components is None:
+        components = int(dim[0])
+    if size is None:
+        size = float_bytes
+    return components * size
+
+def AttributesCode( attributes ):
+    """
+    Returns the C++ list of the attributes for `MakeSeq_t`
+    """
+    return ',\n'.join( [ '    ' + particle_attributes[name][0]
+                         for name in attributes ] )
@@ -0,0 +1,177 @@
+"""
+Autotuning of the supercell size. The variants of the simulation with
+different supercells are rendered, run for a short number of steps by a
+runner, and the supercell with the shortest time per step is selected.
+The default runner builds and runs the variants as a Scan and reads the
+times from the telemetry of the runs; any callable with the same
+interface can be used instead (e.g. a local stub for testing).
+"""
+import itertools
+import math
+
+from .decomposition import ValidateSuperCell, max_supercell_volume
+from .telemetry import TelemetryStore
+
+def SuperCellCandidates( dim='3d', shape_order=1, volumes=(128, 256),
+                         max_aspect=4 ):
+    """
+    Returns the list of the supercells with the sizes of powers of two,
+    the given `volumes`, the ratio of the largest and the smallest size
+    (in 3D) up to `max_aspect`, and a guard large enough for the particle
+    shape of `shape_order`
+    """
+    sizes = [ 2**i for i in range(int(math.log2(max_supercell_volume)) + 1) ]
+    simDim = int(dim[0])
+
+    candidates = []
+    for SuperCell in itertools.product(sizes, repeat=simDim):
+        SuperCell = tuple(SuperCell) + (1, ) * (3 - simDim)
+        if math.prod(SuperCell) not in volumes:
+            continue
+        if max(SuperCell[:simDim]) > max_aspect * min(SuperCell[:simDim]):
+            continue
+        try:
+            ValidateSuperCell(SuperCell, dim, shape_order)
+        except ValueError:
+            continue
+        candidates.append(SuperCell)
+
+    return candidates
+
+class ScanRunner:
+    """
+    Runner of the autotuning, which builds and runs the variants in
+    parallel as a `pogit.scan.Scan`, and returns the times per step
+    parsed from their output (see `pogit.telemetry.ParseRun`)
+
+    Main attributes
+    ---------------
+        `scan` : the Scan object of the last call
+
+        `records` : telemetry records of the last call
+    """
+    def __init__( self, path_input='./', path_scan='./tune',
+                  sim_name='tune', processes=1, max_builds=1, store=None,
+                  **submit_args ):
+        """
+        Initialize the ScanRunner object
+        Parameters
+        ----------
+        path_input, path_scan, sim_name, processes, max_builds :
+            Parameters of `pogit.scan.Scan`
+
+        store : TelemetryStore object or string
+            If given, the records of the runs are added to the store
+            (or to the CSV table with this name)
+
+        submit_args : keyword arguments
+            Passed to `WriteAndSubmit` (e.g. `output_path`, `s`, `t`,
+            `build_command`, `submit_command`)
+        """
+        self.path_input = path_input
+        self.path_scan = path_scan
+        self.sim_name = sim_name
+        self.processes = processes
+        self.max_builds = max_builds
+        self.submit_args = submit_args
+        self.scan = None
+        self.records = []
+
+        if type(store) == str:
+            store = TelemetryStore(store)
+        self.store = store
+
+    def __call__( self, variants ):
+        """
+        Runs the variants, given as a list of (name, objects), and
+        returns the list of their times per step (None if failed)
+        """
+        from .scan import Scan
+
+        self.scan = Scan( lambda index, variant: variants[index][1],
+                          [ {'index': index, 'variant': name}
+                            for index, (name, objs) in enumerate(variants) ],
+                          path_input=self.path_input, path_scan=self.path_scan,
+                          sim_name=self.sim_name, processes=self.processes,
+                          max_builds=self.max_builds, **self.submit_args )
+        self.scan.run()
+        self.records = self.scan.telemetry(self.store)
+
+        times = [None, ] * len(variants)
+        for record in self.records:
+            times[record['index']] = record['time_per_step']
+        return times
+
+def TuneSuperCell( make_objects, candidates=None, runner=None, dim='3d',
+                   shape_order=1, verbose=True ):
+    """
+    Selects the fastest supercell
+
+    Parameters
+    ----------
+    make_objects : callable
+        Function which takes the supercell (tuple of three integers) and
+        returns the list of PoGit objects with `GridSolver(...,
+        super_cell=super_cell)`. The run should be short, e.g. a few
+        hundred steps, and is better done with the production numbers
+        of devices and particles per cell
+
+    candidates : list of tuples
+        Supercells to try. By default, given by `SuperCellCandidates`
+
+    runner : callable
+        Function which takes the list of (name, objects) of the variants
+        and returns the list of their times per step in seconds (None for
+        the failed runs). Default is `ScanRunner()`
+
+    dim : string
+        Dimensionality of the simulation, '3d' or '2d'
+
+    shape_order : integer
+        Largest order of the particle shapes, to select the candidates
+
+    verbose : bool
+        If True, the results are printed
+
+    Returns
+    -------
+    results : list of dictionaries
+        With the 'super_cell' and the 'time_per_step', sorted from the
+        fastest to the slowest (failed runs are at the end)
+    """
+    if candidates is None:
+        candidates = SuperCellCandidates(dim, shape_order)
+
+    variants = []
+    for SuperCell in candidates:
+        SuperCell = ValidateSuperCell(SuperCell, dim, shape_order)
+        name = 'x'.join( [ str(size) for size in SuperCell ] )
+        variants.append( (name, make_objects(SuperCell)) )
+
+    if runner is None:
+        runner = ScanRunner()
+
+    if verbose:
+        print(f'*** TUNE SUPERCELL: {len(variants)} VARIANTS')
+    times = runner(variants)
+    if len(times) != len(candidates):
+        raise ValueError( f'Runner returned {len(times)} times for '
+                          f'{len(candidates)} variants' )
+
+    results = [ { 'super_cell': ValidateSuperCell(SuperCell, dim,
+                                                  shape_order),
+                  'time_per_step': time }
+                for SuperCell, time in zip(candidates, times) ]
+    results.sort( key=lambda result: ( result['time_per_step'] is None,
+                                       result['time_per_step'] or 0.0 ) )
+
+    if verbose:
+        for result in results:
+            time = result['time_per_step']
+            time = f'{1e3*time:10.3f} ms/step' if time is not None \
+                else '    failed'
+            print(f"\t {str(result['super_cell']):14s} {time}")
+        if len(results) > 0 and results[0]['time_per_step'] is not None:
+            print(f"*** SELECTED SUPERCELL {results[0]['super_cell']}")
+
+    return results
@@ -0,0 +1,215 @@
+"""
+Prediction of the macroparticle load per supercell and per device
+from the density profiles, the numbers of particles per cell and the
+domain decomposition of GridSolver. The time of a PIC step is set by the
+most loaded device, so the imbalance metrics show the fraction of the
+compute time lost to waiting.
+"""
+import numbers
+
+import numpy as np
+
+from .grid import GridSolver
+from .particle import Particle
+from .memory import ParticlesPerCell
+from .profiles import IterateDensity, MacroparticlesPerCell
+
+def SupercellLoad( particle, grid, base_density, chunk_cells=2**24,
+                   shift=0 ):
+    """
+    Returns the array of shape (Nsx, Nsy, Nsz) with the numbers of
+    macroparticles of the Particle object created in each supercell
+    (Nsz=1 in 2D), with the reduction of the macroparticles in the low
+    density cells (see `pogit.profiles.MacroparticlesPerCell`)
+
+    Parameters
+    ----------
+    particle : Particle object
+        Species with `density_profile` and `initial_positions`
+
+    grid : GridSolver object
+        Grid of the simulation
+
+    base_density : float (in 1/m^3)
+        Base density of the simulation
+
+    chunk_cells : integer
+        Maximal number of cells evaluated at once
+
+    shift : integer
+        Number of cells by which the moving window has moved along y
+    """
+    simDim = int(grid.dim[0])
+    SuperCell = grid.SuperCell
+    Nppc = ParticlesPerCell(particle, grid.dim)
+
+    Nx, Ny, Nz = grid.N
+    if simDim == 2:
+        Nz = 1
+    Nsx, Nsy, Nsz = Nx // SuperCell[0], Ny // SuperCell[1], Nz // SuperCell[2]
+
+    load = np.zeros( (Nsx, Nsy, Nsz), dtype=np.int64 )
+    if Nppc == 0:
+        return load
+
+    cell_volume = np.prod(grid.cell_size)
+
+    # chunks are aligned to the supercell rows
+    row_cells = Nx * Nz * SuperCell[1]
+    chunk_cells = max(1, chunk_cells // row_cells) * row_cells
+
+    for iy_start, density in IterateDensity( particle, grid, chunk_cells,
+                                             shift * grid.cell_size[1] ):
+        density = np.nan_to_num(density, nan=0.0, posinf=0.0)
+        macroparticles = MacroparticlesPerCell(
+            np.maximum(density, 0.0) * base_density * cell_volume, Nppc )
+
+        rows = macroparticles.shape[1] // SuperCell[1]
+        iys = iy_start // SuperCell[1]
+        load[:, iys:iys+rows, :] = macroparticles.reshape(
+            Nsx, SuperCell[0], rows, SuperCell[1], Nsz, SuperCell[2]
+          ).sum(axis=(1, 3, 5))
+
+    return load
+
+def DeviceLoad( load, decomposition ):
+    """
+    Returns the array of the numbers of macroparticles per device,
+    of shape `decomposition`, from the array of macroparticles
+    per supercell given by `SupercellLoad`
+    """
+    Nsx, Nsy, Nsz = load.shape
+    nx, ny, nz = decomposition
+
+    if Nsx % nx or Nsy % ny or Nsz % nz:
+        raise ValueError( f'Supercells {load.shape} cannot be divided '
+                          f'between devices {tuple(decomposition)}' )
+
+    return load.reshape( nx, Nsx//nx, ny, Nsy//ny, nz, Nsz//nz
+                       ).sum(axis=(1, 3, 5))
+
+def LoadImbalance( load ):
+    """
+    Returns the dictionary of the imbalance metrics of the array
+    of the loads (macroparticles per device or per supercell):
+        'max', 'mean', 'min' : maximal, mean and minimal load
+        'max_to_mean' : ratio of the maximal to the mean load
+        'imbalance' : fraction of the time lost by waiting for the most
+            loaded element (1 - mean/max)
+        'std' : relative standard deviation of the load
+        'empty' : fraction of the elements without particles
+    """
+    load = np.asarray(load, dtype=np.float64)
+    metrics = {}
+    metrics['max'] = load.max()
+    metrics['mean'] = load.mean()
+    metrics['min'] = load.min()
+
+    if metrics['max'] > 0:
+        metrics['max_to_mean'] = metrics['max'] / metrics['mean']
+        metrics['imbalance'] = 1 - metrics['mean'] / metrics['max']
+        metrics['std'] = load.std() / metrics['mean']
+    else:
+        metrics['max_to_mean'] = 1.0
+        metrics['imbalance'] = 0.0
+        metrics['std'] = 0.0
+
+    metrics['empty'] = np.mean(load == 0)
+    return metrics
+
+def PredictLoad( objs, decomposition=None, shift=0, chunk_cells=2**24,
+                 base_density=None, verbose=True ):
+    """
+    Predicts the numbers of macroparticles per supercell and per device
+
+    Parameters
+    ----------
+    objs : list of PoGit objects
+        Objects of the simulation, should contain a GridSolver object
+
+    decomposition : tuple (three integers) or list of tuples
+        Decompositions to evaluate. By default, the one of GridSolver is
+        used. The decompositions should divide the supercells of the grid
+
+    shift : integer or list of integers
+        Numbers of cells by which the moving window has moved along y,
+        e.g. `range(0, Nsteps, 1000)` with the cells moved per step
+
+    chunk_cells : integer
+        Maximal number of cells evaluated at once
+
+    base_density : float (in 1/m^3)
+        By default, taken from the species which defines it
+
+    verbose : bool
+        If True, the imbalance metrics are printed
+
+    Returns
+    -------
+    report : list of dictionaries
+        One per decomposition and shift, with the 'decomposition', 'shift',
+        'supercells' (arrays per species name), 'devices' (total array per
+        device), 'species' (arrays per device and species name), and the
+        metrics of `LoadImbalance` for devices ('device_metrics') and
+        supercells ('supercell_metrics')
+    """
+    grids = [obj for obj in objs if isinstance(obj, GridSolver)]
+    if len(grids) != 1:
+        raise ValueError('Objects should contain one GridSolver')
+    grid = grids[0]
+
+    species = [obj for obj in objs if isinstance(obj, Particle)]
+
+    if base_density is None:
+        base_density = [ particle.base_density for particle in species
+                         if particle.base_density is not None ][0]
+
+    if decomposition is None:
+        decompositions = [grid.decomposition, ]
+    elif type(decomposition[0]) in (list, tuple):
+        decompositions = decomposition
+    else:
+        decompositions = [decomposition, ]
+
+    if isinstance(shift, numbers.Integral):
+        shifts = [int(shift), ]
+    else:
+        shifts = list(shift)
+
+    report = []
+    for shift in shifts:
+        supercells = { particle.name: SupercellLoad( particle, grid,
+                           base_density, chunk_cells, shift )
+                       for particle in species }
+        total = sum(supercells.values())
+
+        for decomposition in decompositions:
+            result = {}
+            result['decomposition'] = tuple(decomposition)
+            result['shift'] = shift
+            result['supercells'] = supercells
+            result['species'] = { name: DeviceLoad(load, decomposition)
+                                  for name, load in supercells.items() }
+            result['devices'] = DeviceLoad(total, decomposition)
+            result['device_metrics'] = LoadImbalance(result['devices'])
+            result['supercell_metrics'] = LoadImbalance(total)
+            report.append(result)
+
+    if verbose:
+        PrintLoad(report)
+
+    return report
+
+def PrintLoad( report ):
+    """
+    Prints the imbalance metrics of the report given by `PredictLoad`
+    """
+    print('*** PREDICTED MACROPARTICLES PER DEVICE')
+    for result in report:
+        metrics = result['device_metrics']
+        print( f"\t {str(result['decomposition']):14s}"
+               f" shift {result['shift']:8d}"
+               f" max {metrics['max']:12.4g}"
+               f" mean {metrics['mean']:12.4g}"
+               f" max/mean {metrics['max_to_mean']:6.2f}"
+               f" imbalance {100*metrics['imbalance']:5.1f}%" )
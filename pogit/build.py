@@ -0,0 +1,166 @@
+import hashlib
+import shutil
+import time
+import os
+
+class BuildCache:
+    """
+    Class that stores the built PIConGPU binaries in a local folder,
+    and allows to reuse them for the simulations with the same
+    compile-time parameters.
+
+    The cache key is a hash of the files in `include/picongpu/param/`,
+    so the runtime settings written to `etc/picongpu/run.cfg` (e.g. number
+    of steps, plugins periods or wall time) do not affect it.
+    The entries are evicted in the least-recently-used order when the
+    total cache size exceeds `max_size`.
+    """
+    def __init__( self, path='~/.cache/pogit/builds', max_size=20*1024**3 ):
+        """
+        Initialize the BuildCache object
+        Parameters
+        ----------
+        path : string
+            Folder where the cache entries are stored
+
+        max_size : integer (in bytes)
+            Maximal total size of the cache
+        """
+        self.path = os.path.abspath( os.path.expanduser(path) )
+        self.max_size = max_size
+
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+    def key( self, path_input='./' ):
+        """
+        Returns the cache key of the simulation input at `path_input`,
+        computed from the names and contents of the compile-time param files
+        and PIConGPU source location (`$PICSRC`)
+        """
+        path_params = os.path.join(path_input, 'include/picongpu/param/')
+
+        key_hash = hashlib.sha256()
+        key_hash.update( os.environ.get('PICSRC', '').encode() )
+
+        for root, dirs, files in os.walk(path_params):
+            dirs.sort()
+            for filename in sorted(files):
+                path_file = os.path.join(root, filename)
+                key_hash.update( os.path.relpath(path_file, path_params)\
+                    .encode() )
+                with open(path_file, mode='rb') as file:
+                    key_hash.update( hashlib.sha256(file.read()).digest() )
+
+        return key_hash.hexdigest()
+
+    def restore( self, key, path_input='./' ):
+        """
+        Copies the cached binaries with the given `key` into the
+        `bin/` folder of the `path_input`.
+        Returns True if the entry was found, and False otherwise
+        """
+        path_entry = os.path.join(self.path, key)
+        if not os.path.exists( os.path.join(path_entry, 'bin') ):
+            return False
+
+        path_bin = os.path.join(path_input, 'bin')
+        if os.path.exists(path_bin):
+            shutil.rmtree(path_bin)
+        try:
+            shutil.copytree( os.path.join(path_entry, 'bin'), path_bin,
+                             symlinks=True )
+            self._touch(path_entry)
+        except (FileNotFoundError, shutil.Error):
+            # the entry was evicted by another process while copying
+            if os.path.exists(path_bin):
+                shutil.rmtree(path_bin)
+            return False
+
+        return True
+
+    def store( self, key, path_input='./' ):
+        """
+        Copies the `bin/` folder of the `path_input` into the cache entry
+        with the given `key`, and evicts the old entries if needed
+        """
+        path_bin = os.path.join(path_input, 'bin')
+        if not os.path.exists( os.path.join(path_bin, 'picongpu') ):
+            raise FileNotFoundError(f'No PIConGPU binary in {path_bin}')
+
+        path_entry = os.path.join(self.path, key)
+        path_tmp = path_entry + f'.tmp{os.getpid()}'
+        if os.path.exists(path_tmp):
+            shutil.rmtree(path_tmp)
+
+        shutil.copytree( path_bin, os.path.join(path_tmp, 'bin'),
+                         symlinks=True )
+
+        # the entry appears at once, so other processes never see it
+        # partial. An existing entry (e.g. stored by another scan worker)
+        # has the same key, i.e. the same inputs, and is kept
+        try:
+            os.rename(path_tmp, path_entry)
+        except OSError:
+            if not os.path.isdir(path_entry):
+                raise
+            shutil.rmtree(path_tmp)
+
+        self._touch(path_entry)
+        self.evict( keep=key )
+
+    def entries( self ):
+        """
+        Returns the list of (key, size, last_used) tuples of the cache
+        entries sorted from the most to the least recently used
+        """
+        entries = []
+        for key in os.listdir(self.path):
+            path_entry = os.path.join(self.path, key)
+            if '.tmp' in key or not os.path.isdir(path_entry):
+                continue
+
+            size = 0
+            for root, dirs, files in os.walk(path_entry):
+                for filename in files:
+                    path_file = os.path.join(root, filename)
+                    if not os.path.islink(path_file):
+                        size += os.path.getsize(path_file)
+
+            entries.append( (key, size, os.path.getmtime(path_entry)) )
+
+        entries.sort(key=lambda entry: entry[2], reverse=True)
+        return entries
+
+    def evict( self, keep=None ):
+        """
+        Removes the least recently used entries until the total size
+        of the cache is below `max_size`. The entry `keep` is not removed
+        """
+        entries = self.entries()
+        total_size = sum( entry[1] for entry in entries )
+
+        for key, size, last_used in entries[::-1]:
+            if total_size <= self.max_size:
+                break
+            if key == keep:
+                continue
+
+            # moved aside at once, so it is not restored while removed
+            path_entry = os.path.join(self.path, key)
+            path_old = path_entry + f'.tmp-evicted{os.getpid()}'
+            try:
+                os.rename(path_entry, path_old)
+            except FileNotFoundError:
+                continue
+            shutil.rmtree(path_old)
+            total_size -= size
+            print( f'*** BUILD CACHE: evicted {key[:12]}',
+                   f'({size/1024**2:.1f} MiB)' )
+
+    def _touch( self, path_entry ):
+        """
+        Marks the entry as recently used
+        """
+        now = time.time()
+        os.utime(path_entry, (now, now))
@@ -0,0 +1,186 @@
+"""
+Planning of the checkpoints. The period is chosen from the predicted
+size of a checkpoint, the bandwidth of the filesystem and the mean time
+between failures (MTBF), as the optimum between the time spent writing
+the checkpoints and the expected work lost at a failure (Young and Daly
+formulas). The latest checkpoint of a previous run is found for the restart.
+"""
+import math
+import os
+import re
+
+from .grid import GridSolver
+from .particle import Particle
+from .output import SourceBytes, Macroparticles, checkpoint_sources, GiB
+
+def CheckpointBytes( objs, float_bytes=None, macroparticles=None ):
+    """
+    Returns the bytes of a checkpoint (fields and all particles)
+    of the simulation given by the list of PoGit objects
+    """
+    grids = [obj for obj in objs if isinstance(obj, GridSolver)]
+    if len(grids) != 1:
+        raise ValueError('Objects should contain one GridSolver')
+    grid = grids[0]
+
+    if float_bytes is None:
+        float_bytes = grid.float_bytes
+
+    species = [obj for obj in objs if isinstance(obj, Particle)]
+    if macroparticles is None:
+        macroparticles = Macroparticles(objs, grid, species)
+
+    return sum( SourceBytes( checkpoint_sources, grid, species,
+                             macroparticles, float_bytes ).values() )
+
+def OptimalCheckpointTime( write_time, mtbf, method='Daly' ):
+    """
+    Returns the compute time between the checkpoints (in seconds),
+    which minimizes the expected total run time
+
+    Parameters
+    ----------
+    write_time : float (in seconds)
+        Time to write one checkpoint
+
+    mtbf : float (in seconds)
+        Mean time between failures of the whole allocation
+
+    method : string
+        'Young' (first order) or 'Daly' (higher order, also valid
+        for the write times comparable to MTBF)
+    """
+    if write_time <= 0 or mtbf <= 0:
+        raise ValueError('`write_time` and `mtbf` should be positive')
+
+    if method == 'Young':
+        return math.sqrt(2 * write_time * mtbf)
+
+    if method == 'Daly':
+        if write_time >= 2 * mtbf:
+            return mtbf
+        ratio = write_time / (2 * mtbf)
+        return math.sqrt(2 * write_time * mtbf) \
+            * ( 1 + math.sqrt(ratio) / 3 + ratio / 9 ) - write_time
+
+    raise ValueError(f"Unknown method {method}, use 'Young' or 'Daly'")
+
+def CheckpointOverhead( period_time, write_time, mtbf, restart_time=0.0 ):
+    """
+    Returns the expected fraction of the run time lost to writing the
+    checkpoints and to the recomputation after the failures (first order)
+    """
+    return write_time / period_time \
+        + ( period_time + write_time + 2 * restart_time ) / (2 * mtbf)
+
+def PlanCheckpoints( objs, step_time, bandwidth, mtbf, restart_time=0.0,
+                     method='Daly', float_bytes=None, macroparticles=None,
+                     verbose=True ):
+    """
+    Chooses the period of the checkpoints
+
+    Parameters
+    ----------
+    objs : list of PoGit objects
+        Objects of the simulation, should contain a GridSolver object
+
+    step_time : float (in seconds)
+        Estimated compute time per step
+
+    bandwidth : float (in bytes per second)
+        Write bandwidth of the filesystem available to the run
+
+    mtbf : float (in seconds)
+        Mean time between failures of the whole allocation, e.g. the MTBF
+        of a node divided by the number of nodes
+
+    restart_time : float (in seconds)
+        Time to restart from a checkpoint, used for the overhead
+
+    method : string
+        'Young' or 'Daly' (see `OptimalCheckpointTime`)
+
+    float_bytes : integer
+        Size of `float_X` in bytes. By default, given by the precision
+        of GridSolver
+
+    macroparticles : dictionary
+        Numbers of macroparticles per species name. By default,
+        they are estimated from the density profiles
+
+    verbose : bool
+        If True, the plan is printed
+
+    Returns
+    -------
+    plan : dictionary
+        'bytes' : bytes of a checkpoint
+        'write_time' : time to write a checkpoint (in seconds)
+        'period_time' : optimal compute time between the checkpoints
+        'period' : period in steps (None if the run is shorter than it)
+        'overhead' : expected fraction of the run time lost with the period
+        'overhead_none' : expected fraction lost without the checkpoints
+    """
+    grid = [obj for obj in objs if isinstance(obj, GridSolver)][0]
+
+    plan = {}
+    plan['bytes'] = CheckpointBytes(objs, float_bytes, macroparticles)
+    plan['write_time'] = plan['bytes'] / bandwidth
+    plan['period_time'] = OptimalCheckpointTime( plan['write_time'], mtbf,
+                                                 method )
+
+    period = max( 1, int(round(plan['period_time'] / step_time)) )
+    if period >= grid.Nsteps:
+        plan['period'] = None
+    else:
+        plan['period'] = period
+
+    run_time = grid.Nsteps * step_time
+    plan['overhead_none'] = ( run_time / 2 + restart_time ) / mtbf
+    if plan['period'] is not None:
+        plan['overhead'] = CheckpointOverhead( period * step_time,
+            plan['write_time'], mtbf, restart_time )
+    else:
+        plan['overhead'] = plan['overhead_none']
+
+    if verbose:
+        print('*** PLANNED CHECKPOINTS')
+        print( f"\t {plan['bytes']/GiB:.2f} GiB per checkpoint,",
+               f"written in {plan['write_time']:.1f} s" )
+        if plan['period'] is not None:
+            print( f"\t period {plan['period']} steps",
+                   f"({plan['period_time']:.0f} s),",
+                   f"expected overhead {100*plan['overhead']:.1f}%" )
+        else:
+            print( '\t run is shorter than the optimal period,',
+                   'checkpoints are not needed' )
+
+    return plan
+
+def LatestCheckpoint( directory ):
+    """
+    Returns the step of the latest checkpoint in the `directory`, from
+    the list `checkpoints.txt` written by PIConGPU or from the file names
+    (None if there are no checkpoints)
+    """
+    directory = os.path.expandvars(directory)
+    if not os.path.isdir(directory):
+        return None
+
+    listing = os.path.join(directory, 'checkpoints.txt')
+    if os.path.exists(listing):
+        with open(listing) as file:
+            steps = [ int(line) for line in file.read().split()
+                      if line.isdigit() ]
+        if len(steps) > 0:
+            return max(steps)
+
+    steps = []
+    for filename in os.listdir(directory):
+        match = re.match(r'checkpoint_0*(\d+)', filename)
+        if match:
+            steps.append( int(match.group(1)) )
+
+    if len(steps) == 0:
+        return None
+    return max(steps)
@@ -15,6 +15,9 @@ densityProfile['Gaussian'] = \
     using densityProfile${name}${profile_index} = GaussianImpl< DensityParameter${name}${profile_index} >;"""
 
 
+# The formula is given as C++ code, which assigns the density to `dens`.
+# The declarations of the used coordinates and the type of the arithmetic
+# (`float_64` or `float_X`) are set by `pogit.particle.Particle`
 densityProfile['FormulaXY'] = \
 """
     struct DensityParameter${name}${profile_index}
@@ -25,35 +28,26 @@ densityProfile['FormulaXY'] = \
             const float3_64& cellSize_SI
         )
         {
-            const float_64 x( position_SI.x() );
-            const float_64 y( position_SI.y() );
-            float_64 dens = 0.0;
+${declarations}
+            ${float_type} dens = 0.0;
 ${Formula}
-            dens *= float_64( dens >= 0.0 );
+            dens *= ${float_type}( dens >= 0.0 );
             return dens;
         }
     };
 
     using densityProfile${name}${profile_index} = FreeFormulaImpl< DensityParameter${name}${profile_index} >;"""
-    
-densityProfile['FormulaXYZ'] = \
+
+densityProfile['FormulaXYZ'] = densityProfile['FormulaXY']
+
+# Table read from the HDF5 file written by `pogit.tabulated`
+densityProfile['Tabulated'] = \
 """
-    struct DensityParameter${name}${profile_index}
-    {
-        HDINLINE float_X
-        operator()(
-            const floatD_64& position_SI,
-            const float3_64& cellSize_SI
-        )
-        {
-            const float_64 x( position_SI.x() );
-            const float_64 y( position_SI.y() );
-            // const float_64 z( position_SI.z() ); //  UNCOMMENT FOR 3D IF NEEDED
-            float_64 dens = 0.0;
-${Formula}
-            dens *= float_64( dens >= 0.0 );
-            return dens;
-        }
-    };
+    PMACC_STRUCT(DensityParameter${name}${profile_index},
+        (PMACC_C_STRING(filename, "${filename}"))
+        (PMACC_C_STRING(datasetName, "${datasetName}"))
+        (PMACC_C_VALUE(uint32_t, iteration, ${iteration}))
+        (PMACC_C_VALUE(float_X, defaultDensity, ${defaultDensity}))
+    );
 
-    using densityProfile${name}${profile_index} = FreeFormulaImpl< DensityParameter${name}${profile_index} >;"""
+    using densityProfile${name}${profile_index} = FromHDF5Impl< DensityParameter${name}${profile_index} >;"""
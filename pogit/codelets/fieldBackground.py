@@ -39,3 +39,96 @@ r2_3d = "const float_64 distance2_SI = float_64(cellIdx.x()-${ix_cntr}) * SI::CE
 laser_profile_2d = "const float_64 laser_profile = math::exp( -r2_norm - temporal_norm*temporal_norm ) * math::sqrt(${w0}) / math::sqrt(math::sqrt(w2_SI));"
 laser_profile_3d = "const float_64 laser_profile = math::exp( -r2_norm - temporal_norm*temporal_norm ) * ${w0} / math::sqrt(w2_SI);"
 
+
+# Gaussian pulse with the step- and cell-independent values precomputed
+# by `pogit.laser.Laser` (see `AntennaConstants`). Only the offsets from
+# the laser axis and the step number are evaluated per cell, in float_X,
+# while the time-dependent phase is reduced to [0, 2*PI) in float_64
+LaserAntennaHoisted = {}
+
+LaserAntennaHoisted["Gaussian"] = \
+"""
+            if (cellIdx.y() == ${iy_antenna}  ){
+
+                static constexpr int32_t pol(${pol});
+                constexpr float_X amplitude( ${amplitude} );
+                constexpr float_X dt_tau( ${dt_tau} );
+                constexpr float_X t0_norm( ${t0_norm} );
+                constexpr float_X curv_time( ${curv_time} );
+                constexpr float_X curv_phase( ${curv_phase} );
+                constexpr float_64 omega_dt( ${omega_dt} );
+                constexpr float_64 phase0( ${phase0} );
+                ${r2_norm}
+                const float_X temporal_norm = float_X(currentStep) * dt_tau + t0_norm - r2_norm * curv_time;
+                const float_64 phase_t = float_64(currentStep) * omega_dt + phase0;
+                const float_X laser_phase = precisionCast<float_X>( phase_t - 2.0 * PI * math::floor( phase_t / (2.0 * PI) ) ) - r2_norm * curv_phase;
+                const float_X laser_profile = amplitude * math::exp( -r2_norm - temporal_norm*temporal_norm );
+
+                if (pol<3) {
+                    current_comp_${pol} += laser_profile * math::cos(laser_phase);
+                }
+
+                if (pol==3) {
+                    current_comp_1 += laser_profile * math::cos(laser_phase);
+                    current_comp_2 += laser_profile * math::sin(laser_phase);
+                }
+            }"""
+
+r2_norm_2d = "const float_X dx_cell = float_X(cellIdx.x()-${ix_cntr});\n                const float_X r2_norm = dx_cell * dx_cell * float_X(${dx2_w2});"
+r2_norm_3d = "const float_X dx_cell = float_X(cellIdx.x()-${ix_cntr});\n                const float_X dz_cell = float_X(cellIdx.z()-${iz_cntr});\n                const float_X r2_norm = dx_cell * dx_cell * float_X(${dx2_w2}) + dz_cell * dz_cell * float_X(${dz2_w2});"
+
+# Fused kernel of several antennas (see `pogit.laser.LaserAntennas`):
+# the cells outside of the antenna planes skip the group (without
+# returning, so that the other antennas are still evaluated), the step
+# phase is computed once per wavelength and the offsets once per laser axis
+AntennaGroup = \
+"""
+            if ( !( ${outside} ) )
+            {
+                const float_X step_X = float_X(currentStep);
+${phases}
+${planes}
+            }"""
+
+AntennaGroupPhase = \
+"""
+            constexpr float_64 omega_dt_${k}( ${omega_dt} );
+            const float_64 phase_t_${k} = float_64(currentStep) * omega_dt_${k};
+            const float_X phase_step_${k} = precisionCast<float_X>( phase_t_${k} - 2.0 * PI * math::floor( phase_t_${k} / (2.0 * PI) ) );"""
+
+AntennaGroupPlane = \
+"""
+            if (cellIdx.y() == ${iy_antenna}  ){
+${centers}
+${sources}
+            }"""
+
+AntennaGroupCenter_2d = \
+"""
+                const float_X dx2_${j} = float_X(cellIdx.x()-${ix_cntr}) * float_X(cellIdx.x()-${ix_cntr});"""
+
+AntennaGroupCenter_3d = AntennaGroupCenter_2d + \
+"""
+                const float_X dz2_${j} = float_X(cellIdx.z()-${iz_cntr}) * float_X(cellIdx.z()-${iz_cntr});"""
+
+AntennaGroupSource = \
+"""
+                {
+                    constexpr float_X amplitude( ${amplitude} );
+                    constexpr float_X dt_tau( ${dt_tau} );
+                    constexpr float_X t0_norm( ${t0_norm} );
+                    constexpr float_X curv_time( ${curv_time} );
+                    constexpr float_X curv_phase( ${curv_phase} );
+                    constexpr float_X phase0( ${phase0} );
+                    const float_X r2_norm = ${r2_norm};
+                    const float_X temporal_norm = step_X * dt_tau + t0_norm - r2_norm * curv_time;
+                    const float_X laser_phase = phase_step_${k} + phase0 - r2_norm * curv_phase;
+                    const float_X laser_profile = amplitude * math::exp( -r2_norm - temporal_norm*temporal_norm );
+${current}
+                }"""
+
+AntennaGroupCurrent = {}
+AntennaGroupCurrent['1'] = "                    current_comp_1 += laser_profile * math::cos(laser_phase);"
+AntennaGroupCurrent['2'] = "                    current_comp_2 += laser_profile * math::cos(laser_phase);"
+AntennaGroupCurrent['3'] = AntennaGroupCurrent['1'] + "\n" + \
+    "                    current_comp_2 += laser_profile * math::sin(laser_phase);"
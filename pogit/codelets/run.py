@@ -22,10 +22,229 @@ Parameters:
 """
 plugins["hdf5"] = \
 """
-TBG_${name}_${period}="--hdf5.period ${period} --hdf5.file ${name} --hdf5.source '${source}'" """
+TBG_${tag}="--hdf5.period ${period} --hdf5.file ${name} --hdf5.source '${source}'" """
 
 
+"""
+OpenPMD data output
+Parameters:
+-----------
+    name, period, source : as for hdf5
+
+    ext : string
+      File backend, 'h5' (HDF5) or 'bp' (ADIOS2). Default is 'h5'
+
+    json : string
+      The `--openPMD.json` argument with the openPMD-api configuration
+      (set by `pogit.plugins.Plugin`, see `pogit.openpmd.OpenPMDConfig`)
+"""
 plugins["openPMD"] = \
 """
-TBG_${name}_${period}="--openPMD.period ${period} --openPMD.file ${name} --openPMD.source '${source}' --openPMD.ext h5" """
+TBG_${tag}="--openPMD.period ${period} --openPMD.file ${name} --openPMD.source '${source}' --openPMD.ext ${ext}${json}" """
+
+
+# Reduced in-situ diagnostics, which write the small aggregated data
+# instead of the full dumps. The per-species plugins need `species`
+# (name of the Particle object). Default values of the optional
+# parameters are given in `plugin_defaults`
+plugin_defaults = {}
+
+plugin_defaults["openPMD"] = { 'ext': 'h5', 'json': '' }
+
+"""
+Energy histogram of the species (keV)
+Parameters:
+-----------
+    species : string
+      Name of the species
+
+    period : integer or string
+      Period of data writing
+
+    filter : string
+      Particle filter. Default is 'all'
+
+    binCount : integer
+      Number of energy bins. Default is 1024
+
+    minEnergy, maxEnergy : float (in keV)
+      Range of the histogram. Default is 0 and 100000 (100 MeV)
+"""
+plugins["energyHistogram"] = \
+"""
+TBG_${tag}="--${species}_energyHistogram.period ${period} --${species}_energyHistogram.filter ${filter} --${species}_energyHistogram.binCount ${binCount} --${species}_energyHistogram.minEnergy ${minEnergy} --${species}_energyHistogram.maxEnergy ${maxEnergy}" """
+
+plugin_defaults["energyHistogram"] = { 'filter': 'all', 'binCount': 1024,
+                                       'minEnergy': 0,
+                                       'maxEnergy': 100000 }
+
+"""
+Phase space of the species in one coordinate and momentum component
+Parameters:
+-----------
+    species : string
+      Name of the species
+
+    period : integer or string
+      Period of data writing
+
+    filter : string
+      Particle filter. Default is 'all'
+
+    space : string
+      Coordinate 'x', 'y' or 'z'. Default is 'y'
+
+    momentum : string
+      Momentum component 'px', 'py' or 'pz'. Default is 'py'
+
+    min, max : float (in m_e*c)
+      Range of the momentum. Default is -1 and 1
+"""
+plugins["phaseSpace"] = \
+"""
+TBG_${tag}="--${species}_phaseSpace.period ${period} --${species}_phaseSpace.filter ${filter} --${species}_phaseSpace.space ${space} --${species}_phaseSpace.momentum ${momentum} --${species}_phaseSpace.min ${min} --${species}_phaseSpace.max ${max}" """
+
+plugin_defaults["phaseSpace"] = { 'filter': 'all', 'space': 'y',
+                                  'momentum': 'py', 'min': -1.0, 'max': 1.0 }
+
+"""
+Total kinetic energy and number of particles of the species
+Parameters:
+-----------
+    species : string
+      Name of the species
+
+    period : integer or string
+      Period of data writing
+
+    filter : string
+      Particle filter. Default is 'all'
+"""
+plugins["energyParticles"] = \
+"""
+TBG_${tag}="--${species}_energy.period ${period} --${species}_energy.filter ${filter}" """
+
+plugin_defaults["energyParticles"] = { 'filter': 'all' }
+
+"""
+Particle calorimeter: angular (and energy) distribution of the
+energy of the species
+Parameters:
+-----------
+    species : string
+      Name of the species
+
+    period : integer or string
+      Period of data writing
+
+    filter : string
+      Particle filter. Default is 'all'
+
+    numBinsYaw, numBinsPitch, numBinsEnergy : integer
+      Numbers of bins. Default are 64, 64 and 1
+
+    minEnergy, maxEnergy : float (in keV)
+      Energy range (used if numBinsEnergy > 1). Default are 0 and 100000
+
+    logScale : integer
+      Logarithmic energy bins if 1. Default is 0
+
+    openingYaw, openingPitch : float (in degrees)
+      Opening angles. Default are 360 and 180
+
+    posYaw, posPitch : float (in degrees)
+      Direction of the calorimeter. Default are 0 and 0
+"""
+plugins["calorimeter"] = \
+"""
+TBG_${tag}="--${species}_calorimeter.period ${period} --${species}_calorimeter.file ${name} --${species}_calorimeter.filter ${filter} --${species}_calorimeter.numBinsYaw ${numBinsYaw} --${species}_calorimeter.numBinsPitch ${numBinsPitch} --${species}_calorimeter.numBinsEnergy ${numBinsEnergy} --${species}_calorimeter.minEnergy ${minEnergy} --${species}_calorimeter.maxEnergy ${maxEnergy} --${species}_calorimeter.logScale ${logScale} --${species}_calorimeter.openingYaw ${openingYaw} --${species}_calorimeter.openingPitch ${openingPitch} --${species}_calorimeter.posYaw ${posYaw} --${species}_calorimeter.posPitch ${posPitch}" """
+
+plugin_defaults["calorimeter"] = { 'filter': 'all', 'numBinsYaw': 64,
+                                   'numBinsPitch': 64, 'numBinsEnergy': 1,
+                                   'minEnergy': 0, 'maxEnergy': 100000,
+                                   'logScale': 0, 'openingYaw': 360,
+                                   'openingPitch': 180, 'posYaw': 0,
+                                   'posPitch': 0 }
+
+"""
+Total energy of the electromagnetic fields
+Parameters:
+-----------
+    period : integer or string
+      Period of data writing
+"""
+plugins["fieldEnergy"] = \
+"""
+TBG_${tag}="--fields_energy.period ${period}" """
+
+plugin_defaults["fieldEnergy"] = {}
+
+"""
+Number of macroparticles of the species per supercell
+Parameters:
+-----------
+    species : string
+      Name of the species
+
+    period : integer or string
+      Period of data writing
+"""
+plugins["macroParticlesPerSuperCell"] = \
+"""
+TBG_${tag}="--${species}_macroParticlesPerSuperCell.period ${period}" """
+
+plugin_defaults["macroParticlesPerSuperCell"] = {}
+
+# Checkpoints and restarts of the simulation
+
+checkpoint_backends = ('openPMD', 'hdf5', 'adios')
+
+"""
+Checkpoints of the simulation state (fields and particles)
+Parameters:
+-----------
+    period : integer or string
+      Period of the checkpoints
+
+    backend : string
+      Checkpoint backend, 'openPMD' (PIConGPU 0.6 and later), or 'hdf5'
+      and 'adios' (older versions). Default is 'openPMD'
+
+    directory : string
+      Directory of the checkpoints, relative to `simOutput`.
+      Default is 'checkpoints'
+
+    ext : string
+      File backend of openPMD, 'h5' (HDF5) or 'bp' (ADIOS2). Default is 'h5'
+
+    options : string
+      Backend specific arguments (set by `pogit.plugins.Plugin`)
+"""
+plugins["checkpoint"] = \
+"""
+TBG_${tag}="--checkpoint.period ${period} --checkpoint.backend ${backend} --checkpoint.directory ${directory}${options}" """
+
+plugin_defaults["checkpoint"] = { 'backend': 'openPMD',
+                                  'directory': 'checkpoints', 'ext': 'h5',
+                                  'options': '' }
+
+"""
+Restart of the simulation from a checkpoint
+Parameters:
+-----------
+    step : integer
+      Step of the checkpoint. Default is None (the latest one)
+
+    backend, directory : as for checkpoint
+
+    options : string
+      The `--checkpoint.restart.step` argument (set by
+      `pogit.plugins.Plugin`)
+"""
+plugins["restart"] = \
+"""
+TBG_${tag}="--checkpoint.restart --checkpoint.restart.backend ${backend} --checkpoint.restart.directory ${directory}${options}" """
 
+plugin_defaults["restart"] = { 'backend': 'openPMD',
+                               'directory': 'checkpoints', 'step': None,
+                               'options': '' }
@@ -6,29 +6,23 @@ value_identifier( float_X, MassRatio${name}, ${MassRatio} );
 value_identifier( float_X, ChargeRatio${name}, ${ChargeRatio} );
 value_identifier( float_X, DensityRatio${name}, ${DensityRatio} );
 
-using ParticleFlags${name} = MakeSeq_t<
+${ParticleAttributes}${ExchangeMemCfg}using ParticleFlags${name} = MakeSeq_t<
     particlePusher< UsedParticlePusher${name} >,
     shape< UsedParticleShape${name} >,
     interpolation< UsedField2Particle${name} >,
     current< UsedParticleCurrentSolver${name} >,
     massRatio< MassRatio${name} >,
     chargeRatio< ChargeRatio${name} >,
-    densityRatio< DensityRatio${name} >,
-    ionizers<
-        MakeSeq_t<
-            particles::ionization::BSIEffectiveZ< PIC_${TargetSpeciesName} >,
-            particles::ionization::ADK${pol}Pol< PIC_${TargetSpeciesName} >
-        >
-    >,
+    densityRatio< DensityRatio${name} >,${Ionizers}
     ionizationEnergies< ionization::energies::AU::${Element}_t >,
     effectiveNuclearCharge< ionization::effectiveNuclearCharge::${Element}_t >,
-    atomicNumbers< ionization::atomicNumbers::${Element}_t >
+    atomicNumbers< ionization::atomicNumbers::${Element}_t >${ExchangeMemFlag}
 >;
 
 using PIC_${name} = Particles<
     PMACC_CSTRING( "${name}" ),
     ParticleFlags${name},
-    IonParticleAttributes
+    ParticleAttributes${name}
 >;"""
 
 speciesDefinition['generic_ionizable'] = speciesDefinition['ion']
@@ -39,20 +33,20 @@ value_identifier( float_X, MassRatio${name}, ${MassRatio} );
 value_identifier( float_X, ChargeRatio${name}, ${ChargeRatio} );
 value_identifier( float_X, DensityRatio${name}, ${DensityRatio} );
 
-using ParticleFlags${name} = MakeSeq_t<
+${ParticleAttributes}${ExchangeMemCfg}using ParticleFlags${name} = MakeSeq_t<
     particlePusher< UsedParticlePusher${name} >,
     shape< UsedParticleShape${name} >,
     interpolation< UsedField2Particle${name} >,
     current< UsedParticleCurrentSolver${name} >,
     massRatio< MassRatio${name} >,
     chargeRatio< ChargeRatio${name} >,
-    densityRatio< DensityRatio${name} >
+    densityRatio< DensityRatio${name} >${ExchangeMemFlag}
 >;
 
 using PIC_${name} = Particles<
     PMACC_CSTRING( "${name}" ),
     ParticleFlags${name},
-    DefaultParticleAttributes
+    ParticleAttributes${name}
 >;"""
 
 speciesDefinition['electron'] = \
@@ -61,21 +55,21 @@ value_identifier( float_X, MassRatio${name}, 1.0 );
 value_identifier( float_X, ChargeRatio${name}, 1.0 );
 value_identifier( float_X, DensityRatio${name}, ${DensityRatio} );
 
-using ParticleFlags${name} = MakeSeq_t<
+${ParticleAttributes}${ExchangeMemCfg}using ParticleFlags${name} = MakeSeq_t<
     particlePusher< UsedParticlePusher${name} >,
     shape< UsedParticleShape${name} >,
     interpolation< UsedField2Particle${name} >,
     current< UsedParticleCurrentSolver${name} >,
     massRatio< MassRatio${name} >,
     chargeRatio< ChargeRatio${name} >,
-    densityRatio< DensityRatio${name} >
+    densityRatio< DensityRatio${name} >${ExchangeMemFlag}
 >;
 
 /* define species electrons */
 using PIC_${name} = Particles<
     PMACC_CSTRING( "${name}" ),
     ParticleFlags${name},
-    DefaultParticleAttributes
+    ParticleAttributes${name}
 >;"""
 
 speciesDefinition['proton'] = \
@@ -84,40 +78,36 @@ value_identifier( float_X, MassRatio${name}, 1836.152672 );
 value_identifier( float_X, ChargeRatio${name}, -1.0 );
 value_identifier( float_X, DensityRatio${name}, ${DensityRatio} );
 
-using ParticleFlags${name} = MakeSeq_t<
+${ParticleAttributes}${ExchangeMemCfg}using ParticleFlags${name} = MakeSeq_t<
     particlePusher< UsedParticlePusher${name} >,
     shape< UsedParticleShape${name} >,
     interpolation< UsedField2Particle${name} >,
     current< UsedParticleCurrentSolver${name} >,
     massRatio< MassRatio${name} >,
     chargeRatio< ChargeRatio${name} >,
-    densityRatio< DensityRatio${name} >
+    densityRatio< DensityRatio${name} >${ExchangeMemFlag}
 >;
 
 /* define species ions */
 using PIC_${name} = Particles<
     PMACC_CSTRING( "${name}" ),
     ParticleFlags${name},
-    DefaultParticleAttributes
+    ParticleAttributes${name}
 >;"""
 
 speciesDefinition['probe'] = \
 """
-using ParticleFlags${name} = MakeSeq_t<
+${ParticleAttributes}${ExchangeMemCfg}using ParticleFlags${name} = MakeSeq_t<
     particlePusher< UsedParticlePusher${name} >,
     shape< UsedParticleShape${name} >,
-    interpolation< UsedField2Particle${name} >
+    interpolation< UsedField2Particle${name} >${ExchangeMemFlag}
 >;
 
 /* define species Probe */
 using PIC_${name} = Particles<
     PMACC_CSTRING( "${name}" ),
     ParticleFlags${name},
-    MakeSeq_t<
-        position< position_pic >,
-        probeB,
-        probeE
-    >
+    ParticleAttributes${name}
 >;"""
 
 speciesDefinition['photon'] = \
@@ -127,17 +117,51 @@ speciesDefinition['photon'] = \
 value_identifier( float_X, MassRatio${name}, 0.0 );
 value_identifier( float_X, ChargeRatio${name}, 0.0 );
 
-using ParticleFlags${name} = MakeSeq_t<
+${ParticleAttributes}${ExchangeMemCfg}using ParticleFlags${name} = MakeSeq_t<
     particlePusher< UsedParticlePusher${name} >,
     shape< UsedParticleShape${name} >,
     interpolation< UsedField2Particle${name} >,
     massRatio< MassRatio${name} >,
-    chargeRatio< ChargeRatio${name} >
+    chargeRatio< ChargeRatio${name} >${ExchangeMemFlag}
 >;
 
 /* define species photons */
 using PIC_${name} = Particles<
     PMACC_CSTRING( "${name}" ),
     ParticleFlags${name},
-    DefaultParticleAttributes
+    ParticleAttributes${name}
 >;"""
+
+
+# Ionizers of the ion species (see `pogit.ionization`)
+Ionizers = """
+    ionizers<
+        MakeSeq_t<
+${ionizers}
+        >
+    >,"""
+
+# Attributes of the species (see `pogit.attributes`)
+ParticleAttributes = \
+"""using ParticleAttributes${name} = MakeSeq_t<
+${attributes}
+>;
+
+"""
+
+# Exchange buffer sizes of the species (see `pogit.memory.ExchangeMemCfg`),
+# used instead of `DefaultExchangeMemCfg` of memory.param
+ExchangeMemCfg = \
+"""struct ExchangeMemCfg${name}
+{
+    static constexpr uint32_t BYTES_EXCHANGE_X = ${BYTES_EXCHANGE_X};
+    static constexpr uint32_t BYTES_EXCHANGE_Y = ${BYTES_EXCHANGE_Y};
+    static constexpr uint32_t BYTES_EXCHANGE_Z = ${BYTES_EXCHANGE_Z};
+    static constexpr uint32_t BYTES_EDGES = ${BYTES_EDGES};
+    static constexpr uint32_t BYTES_CORNER = ${BYTES_CORNER};
+};
+
+"""
+
+ExchangeMemFlag = """,
+    exchangeMemCfg< ExchangeMemCfg${name} >"""
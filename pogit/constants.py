@@ -0,0 +1,25 @@
+# Physical constants in SI units (CODATA 2018, same as `scipy.constants`)
+# Vendored here to avoid importing scipy at start-up
+
+pi = 3.141592653589793
+
+# speed of light in vacuum (m/s)
+c = 299792458.0
+
+# elementary charge (C)
+e = 1.602176634e-19
+
+# electron mass (kg)
+m_e = 9.1093837015e-31
+
+# proton mass (kg)
+m_p = 1.67262192369e-27
+
+# atomic mass constant (kg)
+atomic_mass = 1.6605390666e-27
+
+# vacuum electric permittivity (F/m)
+epsilon_0 = 8.8541878128e-12
+
+# vacuum magnetic permeability (N/A^2)
+mu_0 = 1.25663706212e-06
@@ -0,0 +1,210 @@
+"""
+Selection of the domain decomposition over the devices. The cost model
+counts the cells, which are computed in addition to the requested ones:
+padding of the grid to the multiples of `decomposition * SuperCell`,
+the hidden layer of devices of the moving window, and the guard (halo)
+cells exchanged between the devices.
+"""
+import math
+
+# PIConGPU limit of the supercell volume (threads per block)
+max_supercell_volume = 1024
+
+# supercells used by default
+default_supercells = { '3d': (8, 8, 4), '2d': (16, 16, 1) }
+
+def ShapeMargin( shape_order ):
+    """
+    Returns the number of cells around a cell, which are reached by
+    the current deposition of the particle shape of the given order
+    (including the motion of the particle by up to a cell per step)
+    """
+    return (shape_order + 2) // 2 + 1
+
+def ValidateSuperCell( SuperCell, dim='3d', shape_order=1, GuardSize=1 ):
+    """
+    Checks the supercell and returns it as a tuple of three integers
+    (with 1 along z in 2D). Raises ValueError if the volume exceeds the
+    PIConGPU limit `max_supercell_volume`, or if the guard of `GuardSize`
+    supercells is thinner than the margin of the particle shape
+    """
+    simDim = int(dim[0])
+    SuperCell = tuple( int(size) for size in SuperCell )
+    if len(SuperCell) == 2 and simDim == 2:
+        SuperCell = SuperCell + (1, )
+
+    if len(SuperCell) != 3 or any( size < 1 for size in SuperCell ):
+        raise ValueError( f'SuperCell {SuperCell} should be given '
+                          'by three positive integers' )
+    if simDim == 2 and SuperCell[2] != 1:
+        raise ValueError('SuperCell should have size 1 along z in 2D')
+
+    volume = math.prod(SuperCell)
+    if volume > max_supercell_volume:
+        raise ValueError( f'SuperCell {SuperCell} volume {volume} exceeds '
+                          f'{max_supercell_volume}' )
+
+    margin = ShapeMargin(shape_order)
+    for size in SuperCell[:simDim]:
+        if size * GuardSize < margin:
+            raise ValueError( f'Guard of SuperCell {SuperCell} is thinner '
+                              f'than {margin} cells needed by the shape '
+                              f'of order {shape_order}' )
+
+    return SuperCell
+
+def Factorizations( Ndevices, dim='3d' ):
+    """
+    Returns the list of all decompositions (nx, ny, nz) of
+    `Ndevices` devices (nz=1 for 2D)
+    """
+    candidates = []
+    for nx in range(1, Ndevices+1):
+        if Ndevices % nx:
+            continue
+        for ny in range(1, Ndevices//nx + 1):
+            if (Ndevices//nx) % ny:
+                continue
+            nz = Ndevices // nx // ny
+            if dim == '2d' and nz != 1:
+                continue
+            candidates.append( (nx, ny, nz) )
+
+    return candidates
+
+def PaddedGrid( Nx, Ny, Nz, decomposition, SuperCell, movingWindow=False ):
+    """
+    Returns the numbers of cells (Nx, Ny, Nz) after padding done
+    by GridSolver, including the hidden moving window devices
+    """
+    Nx = math.ceil( 1.*Nx / decomposition[0] / SuperCell[0] ) * \
+                          decomposition[0] * SuperCell[0]
+    Nz = math.ceil( 1.*Nz / decomposition[2] / SuperCell[2] ) * \
+                          decomposition[2] * SuperCell[2]
+
+    if movingWindow:
+        nGPUy = decomposition[1]
+        Ny_loc = int(math.ceil( Ny/(nGPUy-1.) / SuperCell[1]) * SuperCell[1])
+        Ny = Ny_loc * nGPUy
+    else:
+        Ny = math.ceil( 1.*Ny / decomposition[1] / SuperCell[1] ) * \
+                              decomposition[1] * SuperCell[1]
+
+    return int(Nx), int(Ny), int(Nz)
+
+def DecompositionCost( Nx, Ny, Nz, decomposition, dim='3d',
+                       SuperCell=(8, 8, 4), movingWindow=False,
+                       GuardSize=1 ):
+    """
+    Returns the dictionary with the cost model numbers of the
+    decomposition:
+        'grid' : padded numbers of cells
+        'local' : numbers of cells per device
+        'padding' : fraction of the computed cells added by padding
+            and moving window layer relative to the requested cells
+        'halo' : ratio of guard cells to local cells per device
+        'cost' : computed cells including guards per requested cell
+    """
+    simDim = int(dim[0])
+
+    grid = PaddedGrid(Nx, Ny, Nz, decomposition, SuperCell, movingWindow)
+    local = [ grid[i] // decomposition[i] for i in range(simDim) ]
+
+    cells_requested = math.prod( (Nx, Ny, Nz)[:simDim] )
+    cells_grid = math.prod( grid[:simDim] )
+
+    cells_local = math.prod(local)
+    cells_guard = math.prod( [ local[i] + 2 * GuardSize * SuperCell[i]
+                               for i in range(simDim) ] )
+
+    cost = {}
+    cost['decomposition'] = tuple(decomposition)
+    cost['grid'] = grid
+    cost['local'] = tuple(local)
+    cost['padding'] = cells_grid / cells_requested - 1
+    cost['halo'] = (cells_guard - cells_local) / cells_local
+    cost['cost'] = cells_guard * math.prod(decomposition) / cells_requested
+    cost['cells_per_device'] = cells_guard
+
+    return cost
+
+def OptimizeDecomposition( Nx, Ny, Nz, Ndevices, dim='3d',
+                           SuperCell=(8, 8, 4), movingWindow=False,
+                           device_memory=None, bytes_per_cell=None,
+                           reserved_memory=350*1024**2, verbose=True ):
+    """
+    Searches the decompositions of `Ndevices` devices, and returns
+    the list of their costs (see `DecompositionCost`) sorted from the best
+    to the worst, i.e. by the total computed cells, and then by the halo
+    surface-to-volume ratio
+
+    Parameters
+    ----------
+    Nx, Ny, Nz : integer
+        Requested numbers of gridpoints in x, y and z directions
+
+    Ndevices : integer
+        Total number of devices
+
+    dim : string
+        Dimensionality of the simulation. Can be '3d' or '2d'
+
+    SuperCell : tuple (three integers)
+        Size of the supercell
+
+    movingWindow : bool
+        If True, an extra layer of devices along y is accounted
+
+    device_memory : float (in bytes)
+        If given with `bytes_per_cell`, decompositions that do not fit
+        into the device memory are rejected
+
+    bytes_per_cell : float (in bytes)
+        Estimated memory used per cell (fields and particles)
+
+    reserved_memory : float (in bytes)
+        Memory reserved on each device by PIConGPU
+
+    verbose : bool
+        If True, the table of candidates is printed
+    """
+    candidates = []
+    for decomposition in Factorizations(Ndevices, dim):
+        if movingWindow and decomposition[1] < 2:
+            continue
+
+        cost = DecompositionCost( Nx, Ny, Nz, decomposition, dim,
+                                  SuperCell, movingWindow )
+
+        if device_memory is not None and bytes_per_cell is not None:
+            cost['memory'] = cost['cells_per_device'] * bytes_per_cell \
+                + reserved_memory
+            cost['fits'] = cost['memory'] <= device_memory
+        else:
+            cost['memory'] = None
+            cost['fits'] = True
+
+        candidates.append(cost)
+
+    candidates.sort( key=lambda cost: (not cost['fits'], cost['cost'],
+                                       cost['halo']) )
+
+    if len(candidates) == 0:
+        raise ValueError(f'No valid decomposition of {Ndevices} devices')
+
+    if verbose:
+        print(f'*** DECOMPOSITIONS OF {Ndevices} DEVICES')
+        for cost in candidates:
+            line = f"\t {str(cost['decomposition']):14s}" \
+                + f" grid {str(cost['grid']):20s}" \
+                + f" padding {100*cost['padding']:6.1f}%" \
+                + f" halo {100*cost['halo']:6.1f}%" \
+                + f" cost {cost['cost']:6.3f}"
+            if not cost['fits']:
+                line += ' (exceeds memory)'
+            print(line)
+
+    if not candidates[0]['fits']:
+        raise ValueError('No decomposition fits into the device memory')
+
+    return candidates
@@ -0,0 +1,930 @@
+"""
+Offline periodic table used for the ion species. The elements can be
+looked up by name, symbol or atomic number, and `mendeleev` is only
+queried for the entries that are not in the table
+"""
+
+# Periodic table snapshot: atomic number, symbol, name, atomic mass (in
+# atomic mass units) and ionization energies (in eV) of the successive
+# charge states. Generated from the `mendeleev` database (v1.0.0), so that
+# the ion species can be created without querying it.
+
+_table = (
+    (1, 'H', 'Hydrogen', 1.008, (13.598434599702,)),
+    (2, 'He', 'Helium', 4.002602, (24.587389011, 54.4177655282)),
+    (3, 'Li', 'Lithium', 6.94, (5.391714996, 75.640097, 122.45435913)),
+    (4, 'Be', 'Beryllium', 9.0121831, (
+        9.322699, 18.21115, 153.896205, 217.71858459
+    )),
+    (5, 'B', 'Boron', 10.81, (
+        8.298019, 25.15483, 37.93059, 259.374379, 340.2260225
+    )),
+    (6, 'C', 'Carbon', 12.011, (
+        11.260288, 24.383143, 47.88778, 64.49352, 392.09056, 489.99320779
+    )),
+    (7, 'N', 'Nitrogen', 14.007, (
+        14.53413, 29.60125, 47.4453, 77.4735, 97.8901, 552.06741, 667.0461377
+    )),
+    (8, 'O', 'Oxygen', 15.999, (
+        13.618055, 35.12112, 54.93554, 77.4135, 113.899, 138.1189, 739.32697,
+        871.4099138
+    )),
+    (9, 'F', 'Fluorine', 18.998403163, (
+        17.42282, 34.97081, 62.70798, 87.175, 114.249, 157.16311, 185.1868,
+        953.8983, 1103.1175302
+    )),
+    (10, 'Ne', 'Neon', 20.1797, (
+        21.564541, 40.96297, 63.4233, 97.19, 126.247, 157.934, 207.271,
+        239.097, 1195.8082, 1362.199256
+    )),
+    (11, 'Na', 'Sodium', 22.98976928, (
+        5.13907696, 47.28636, 71.62, 98.936, 138.404, 172.23, 208.504, 264.192,
+        299.856, 1465.0992, 1648.702285
+    )),
+    (12, 'Mg', 'Magnesium', 24.305, (
+        7.646236, 15.035271, 80.1436, 109.2654, 141.33, 186.76, 225.02,
+        265.924, 327.99, 367.489, 1761.8049, 1962.663889
+    )),
+    (13, 'Al', 'Aluminum', 26.9815385, (
+        5.985769, 18.82855, 28.447642, 119.9924, 153.8252, 190.49, 241.76,
+        284.64, 330.21, 398.65, 442.005, 2085.97693, 2304.140359
+    )),
+    (14, 'Si', 'Silicon', 28.085, (
+        8.15168, 16.34585, 33.493, 45.14179, 166.767, 205.279, 246.57, 303.59,
+        351.28, 401.38, 476.273, 523.415, 2437.65805, 2673.177958
+    )),
+    (15, 'P', 'Phosphorus', 30.973761998, (
+        10.486686, 19.76949, 30.20264, 51.44387, 65.02511, 220.43, 263.57,
+        309.6, 372.31, 424.4, 479.44, 560.62, 611.741, 2816.90868, 3069.842145
+    )),
+    (16, 'S', 'Sulfur', 32.06, (
+        10.36001, 23.33788, 34.86, 47.222, 72.5945, 88.0529, 280.954, 328.794,
+        379.84, 447.7, 504.55, 564.41, 651.96, 706.994, 3223.78057, 3494.188518
+    )),
+    (17, 'Cl', 'Chlorine', 35.45, (
+        12.967633, 23.81364, 39.8, 53.24, 67.68, 96.94, 114.2013, 348.306,
+        400.851, 456.7, 530.0, 591.58, 656.3, 750.23, 809.198, 3658.34366,
+        3946.29179
+    )),
+    (18, 'Ar', 'Argon', 39.948, (
+        15.7596119, 27.62967, 40.735, 59.58, 74.84, 91.29, 124.41, 143.4567,
+        422.6, 479.76, 540.4, 619.0, 685.5, 755.13, 855.5, 918.375, 4120.66559,
+        4426.22407
+    )),
+    (19, 'K', 'Potassium', 39.0983, (
+        4.34066373, 31.625, 45.8031, 60.917, 82.66, 99.44, 117.56, 154.87,
+        175.8174, 503.67, 565.6, 631.1, 714.7, 786.3, 860.92, 967.7, 1034.542,
+        4610.80714, 4934.04979
+    )),
+    (20, 'Ca', 'Calcium', 40.078, (
+        6.11315547, 11.871719, 50.91316, 67.2732, 84.34, 108.78, 127.21,
+        147.24, 188.54, 211.275, 591.6, 658.2, 728.6, 817.2, 894.0, 973.7,
+        1086.8, 1157.726, 5128.8576, 5469.86358
+    )),
+    (21, 'Sc', 'Scandium', 44.955908, (
+        6.56149, 12.79977, 24.756839, 73.4894, 91.95, 110.68, 137.99, 158.08,
+        180.03, 225.18, 249.798, 687.36, 757.7, 833.2, 926.5, 1008.6, 1093.5,
+        1213.1, 1287.957, 5674.9036, 6033.75643
+    )),
+    (22, 'Ti', 'Titanium', 47.867, (
+        6.82812, 13.5755, 27.49171, 43.26717, 99.299, 119.533, 140.68, 170.5,
+        192.1, 215.92, 265.07, 291.5, 787.67, 864.0, 944.5, 1042.5, 1130.2,
+        1220.3, 1346.3, 1425.257, 6249.0226, 6625.81023
+    )),
+    (23, 'V', 'Vanadium', 50.9415, (
+        6.746187, 14.634, 29.3111, 46.709, 65.28165, 128.125, 150.72, 173.55,
+        206.0, 230.5, 254.8, 308.5, 336.274, 896.0, 977.2, 1062.9, 1165.2,
+        1258.9, 1354.2, 1486.7, 1569.656, 6851.3112, 7246.12624
+    )),
+    (24, 'Cr', 'Chromium', 51.9961, (
+        6.76651, 16.486305, 30.959, 49.16, 69.46, 90.6349, 160.29, 184.76,
+        209.5, 244.5, 270.8, 296.7, 354.7, 384.163, 1011.6, 1097.2, 1188.0,
+        1294.8, 1394.5, 1495.1, 1634.1, 1721.183, 7481.8624, 7894.80289
+    )),
+    (25, 'Mn', 'Manganese', 54.938044, (
+        7.434038, 15.63999, 33.668, 51.21, 72.41, 95.604, 119.203, 195.5,
+        221.89, 248.6, 286.1, 314.4, 343.6, 402.95, 435.172, 1133.7, 1224.1,
+        1320.3, 1430.9, 1537.2, 1643.2, 1788.7, 1879.873, 8140.7864, 8571.95438
+    )),
+    (26, 'Fe', 'Iron', 55.845, (
+        7.9024681, 16.19921, 30.651, 54.91, 75.0, 98.985, 124.9671, 151.06,
+        233.6, 262.1, 290.9, 330.8, 361.0, 392.2, 456.2, 489.312, 1262.7,
+        1357.8, 1460.0, 1575.6, 1687.0, 1798.4, 1950.4, 2045.759, 8828.1864,
+        9277.6886
+    )),
+    (27, 'Co', 'Cobalt', 58.933194, (
+        7.88101, 17.0844, 33.5, 51.27, 79.5, 102.0, 128.9, 157.8, 186.14,
+        275.4, 305.32, 336.1, 378.5, 410.0, 441.1, 511.96, 546.588, 1397.2,
+        1504.5, 1606.0, 1724.0, 1844.0, 1960.8, 2119.4, 2218.876, 9544.1817,
+        10012.1297
+    )),
+    (28, 'Ni', 'Nickel', 58.6934, (
+        7.639878, 18.168838, 35.187, 54.92, 76.06, 108.0, 132.0, 162.0, 193.2,
+        224.7, 319.5, 351.6, 384.5, 429.3, 462.8, 495.4, 571.07, 607.02,
+        1540.1, 1646.0, 1758.0, 1880.0, 2008.1, 2130.5, 2295.6, 2399.259,
+        10288.8848, 10775.3948
+    )),
+    (29, 'Cu', 'Copper', 63.546, (
+        7.72638, 20.29239, 36.841, 57.38, 79.8, 103.0, 139.0, 166.0, 198.0,
+        232.2, 265.33, 367.0, 401.0, 436.0, 483.1, 518.7, 552.8, 632.5,
+        670.608, 1690.5, 1800.0, 1918.0, 2044.0, 2179.4, 2307.3, 2479.1,
+        2586.954, 11062.4309, 11567.6237
+    )),
+    (30, 'Zn', 'Zinc', 65.38, (
+        9.394197, 17.96439, 39.7233, 59.573, 82.6, 108.0, 133.9, 173.9, 203.0,
+        238.0, 274.4, 310.8, 417.6, 453.4, 490.6, 540.0, 577.8, 613.3, 697.5,
+        737.366, 1846.8, 1961.0, 2085.0, 2214.0, 2358.0, 2491.5, 2669.9,
+        2781.996, 11864.9401, 12388.9427
+    )),
+    (31, 'Ga', 'Gallium', 69.723, (
+        5.999302, 20.51514, 30.72576, 63.241, 86.01, 112.7, 140.8, 169.9,
+        211.0, 244.0, 280.0, 319.0, 356.0, 471.2, 508.8, 548.3, 599.8, 640.0,
+        677.0, 765.7, 807.308, 2010.0, 2129.0, 2258.0, 2391.0, 2543.9, 2683.0,
+        2868.0, 2984.426, 12696.5581, 13239.5029
+    )),
+    (32, 'Ge', 'Germanium', 72.63, (
+        7.899435, 15.93461, 34.0576, 45.7155, 90.5, 115.9, 144.9, 176.4, 212.5,
+        252.1, 286.0, 326.0, 367.0, 407.0, 527.9, 567.3, 609.1, 662.8, 706.7,
+        744.0, 837.1, 880.44, 2178.2, 2304.0, 2439.0, 2575.0, 2737.1, 2881.9,
+        3074.0, 3194.293, 13557.4218, 14119.4457
+    )),
+    (33, 'As', 'Arsenic', 74.921595, (
+        9.78855, 18.5892, 28.349, 50.15, 62.77, 121.19, 147.0, 180.0, 213.0,
+        247.0, 296.0, 333.0, 375.0, 418.0, 460.0, 587.6, 628.8, 672.9, 728.9,
+        774.0, 814.0, 911.7, 956.79, 2356.9, 2486.0, 2626.0, 2766.0, 2938.0,
+        3088.1, 3287.0, 3411.643, 14447.6799, 15028.9251
+    )),
+    (34, 'Se', 'Selenium', 78.971, (
+        9.752368, 21.196, 31.697, 42.947, 68.3, 81.83, 155.327, 184.0, 219.0,
+        255.0, 291.0, 342.9, 383.0, 426.0, 473.0, 517.0, 650.5, 693.4, 739.8,
+        798.0, 845.8, 887.0, 989.6, 1036.36, 2540.7, 2674.0, 2820.0, 2964.0,
+        3146.0, 3301.8, 3507.0, 3636.526, 15367.493, 15968.1075
+    )),
+    (35, 'Br', 'Bromine', 79.904, (
+        11.81381, 21.591, 34.871, 47.782, 59.595, 87.39, 103.03, 192.61, 224.0,
+        261.0, 301.0, 338.0, 393.0, 436.0, 481.0, 530.0, 577.0, 716.3, 761.0,
+        809.8, 870.0, 920.8, 963.0, 1070.6, 1119.17, 2731.4, 2869.0, 3021.0,
+        3169.0, 3361.0, 3523.1, 3735.0, 3868.986, 16317.014, 16937.1497
+    )),
+    (36, 'Kr', 'Krypton', 83.798, (
+        13.9996055, 24.35984, 35.838, 50.85, 64.69, 78.49, 109.13, 125.802,
+        233.0, 268.0, 308.0, 350.0, 391.0, 446.0, 492.0, 540.0, 591.0, 640.0,
+        785.316, 831.6, 882.8, 945.0, 999.0, 1042.0, 1155.0, 1205.23, 2928.9,
+        3072.0, 3228.0, 3380.0, 3584.0, 3752.0, 3971.0, 4109.083, 17296.424,
+        17936.2405
+    )),
+    (37, 'Rb', 'Rubidium', 85.4678, (
+        4.1771281, 27.28954, 39.247, 52.2, 68.44, 82.9, 98.67, 132.79, 150.628,
+        277.12, 313.1, 356.0, 400.0, 443.0, 502.0, 550.0, 601.0, 654.0, 706.0,
+        857.0, 905.3, 958.9, 1024.0, 1080.0, 1125.0, 1242.5, 1294.57, 3133.3,
+        3281.0, 3443.0, 3600.0, 3815.0, 3988.0, 4214.0, 4356.865, 18305.886,
+        18965.5484
+    )),
+    (38, 'Sr', 'Strontium', 87.62, (
+        5.69486745, 11.0302765, 42.88353, 56.28, 70.7, 88.0, 104.0, 121.21,
+        158.33, 177.3, 324.07, 362.0, 408.0, 454.0, 499.0, 562.0, 612.0, 665.0,
+        722.0, 774.0, 932.0, 982.1, 1038.0, 1105.0, 1165.0, 1211.0, 1333.4,
+        1387.19, 3344.7, 3497.0, 3664.0, 3830.0, 4053.0, 4232.0, 4465.0,
+        4612.397, 19345.59, 20025.2673
+    )),
+    (39, 'Y', 'Yttrium', 88.90584, (
+        6.21726, 12.2236, 20.52441, 60.6072, 75.35, 91.39, 110.02, 128.12,
+        145.64, 185.7, 205.814, 374.04, 414.0, 463.0, 512.0, 559.0, 624.0,
+        677.0, 733.0, 790.0, 847.0, 1010.0, 1061.9, 1120.2, 1190.0, 1253.0,
+        1300.0, 1427.6, 1483.12, 3562.9, 3720.0, 3892.0, 4060.0, 4299.0,
+        4484.0, 4724.0, 4875.731, 20415.719, 21115.588
+    )),
+    (40, 'Zr', 'Zirconium', 91.224, (
+        6.634126, 13.13, 23.17, 34.41836, 80.348, 96.38, 112.0, 133.7, 153.0,
+        172.02, 214.9, 236.252, 426.0, 470.0, 520.0, 573.0, 622.0, 690.0,
+        745.0, 803.0, 863.0, 922.0, 1092.0, 1144.7, 1205.4, 1277.0, 1344.0,
+        1392.0, 1525.1, 1582.37, 3788.0, 3950.0, 4127.0, 4300.0, 4553.0,
+        4744.0, 4991.0, 5146.935, 21516.471, 22236.712
+    )),
+    (41, 'Nb', 'Niobium', 92.90637, (
+        6.75885, 14.32, 25.04, 37.611, 50.5728, 102.069, 119.1, 136.0, 159.2,
+        180.0, 200.28, 246.1, 268.59, 482.5, 530.0, 581.0, 636.0, 688.0, 758.0,
+        816.0, 877.0, 940.0, 1000.0, 1176.0, 1230.6, 1293.7, 1368.0, 1439.0,
+        1488.0, 1625.9, 1684.97, 4020.1, 4187.0, 4369.0, 4540.0, 4815.0,
+        5011.0, 5265.0, 5426.066, 22648.046, 23388.85
+    )),
+    (42, 'Mo', 'Molybdenum', 95.95, (
+        7.09243, 16.16, 27.13, 40.33, 54.417, 68.82704, 125.638, 143.6, 164.12,
+        186.3, 209.3, 230.28, 279.1, 302.6, 544.0, 591.0, 646.0, 702.0, 758.0,
+        829.0, 890.0, 953.0, 1019.0, 1082.0, 1263.0, 1319.6, 1385.1, 1462.0,
+        1537.0, 1587.0, 1730.1, 1790.93, 4259.0, 4430.0, 4618.0, 4800.0,
+        5084.0, 5287.0, 5548.0, 5713.194, 23810.653, 24572.213
+    )),
+    (43, 'Tc', 'Technetium', 97.90721, (
+        7.11938, 15.26, 29.55, 41.0, 57.0, 72.0, 88.0, 150.0, 169.0, 189.9,
+        214.0, 239.0, 262.08, 311.0, 338.55, 604.0, 655.0, 713.0, 773.0, 829.0,
+        904.0, 968.0, 1032.0, 1102.0, 1166.0, 1354.0, 1411.6, 1479.5, 1559.0,
+        1638.0, 1689.0, 1838.0, 1900.28, 4505.0, 4681.0, 4874.0, 5060.0,
+        5361.0, 5570.0, 5838.0, 6008.391, 25004.531, 25787.047
+    )),
+    (44, 'Ru', 'Ruthenium', 101.07, (
+        7.3605, 16.76, 28.47, 45.0, 59.0, 76.0, 93.0, 110.0, 178.41, 198.0,
+        219.9, 245.0, 271.0, 295.9, 348.0, 376.25, 670.0, 723.0, 784.0, 845.0,
+        905.0, 981.0, 1048.0, 1115.0, 1187.0, 1253.0, 1447.0, 1506.7, 1577.0,
+        1659.0, 1743.0, 1794.0, 1949.0, 2013.04, 4758.0, 4939.0, 5136.0,
+        5330.0, 5647.0, 5861.0, 6137.0, 6311.721, 26229.888, 27033.564
+    )),
+    (45, 'Rh', 'Rhodium', 102.9055, (
+        7.4589, 18.08, 31.06, 42.0, 63.0, 80.0, 97.0, 115.1, 135.0, 207.51,
+        228.0, 252.1, 277.0, 306.0, 331.58, 389.3, 415.97, 739.0, 794.0, 857.0,
+        921.0, 984.0, 1061.0, 1131.0, 1202.0, 1274.0, 1344.0, 1544.0, 1604.9,
+        1677.6, 1763.0, 1851.0, 1903.0, 2063.0, 2129.22, 5018.0, 5203.0,
+        5406.0, 5600.0, 5940.0, 6161.0, 6444.0, 6623.262, 27486.979, 28312.031
+    )),
+    (46, 'Pd', 'Palladium', 106.42, (
+        8.336839, 19.43, 32.93, 46.0, 61.0, 84.1, 101.0, 120.0, 141.0, 159.9,
+        238.57, 260.0, 286.0, 311.0, 342.0, 369.1, 427.0, 457.5, 810.0, 869.0,
+        933.0, 1000.0, 1065.0, 1145.0, 1218.0, 1290.0, 1366.0, 1438.0, 1644.0,
+        1706.2, 1781.3, 1869.0, 1962.0, 2016.0, 2181.0, 2248.87, 5284.0,
+        5475.0, 5683.0, 5880.0, 6242.0, 6469.0, 6759.0, 6943.097, 28776.032,
+        29622.678
+    )),
+    (47, 'Ag', 'Silver', 107.8682, (
+        7.576234, 21.4844, 34.8, 49.0, 65.0, 82.0, 106.0, 125.0, 145.1, 167.0,
+        188.0, 271.46, 294.0, 321.0, 347.0, 381.0, 408.43, 469.0, 500.87,
+        885.0, 946.0, 1013.0, 1082.0, 1149.0, 1231.0, 1308.0, 1382.0, 1460.0,
+        1535.0, 1747.0, 1810.5, 1888.0, 1979.0, 2077.0, 2131.0, 2302.0,
+        2371.99, 5558.0, 5753.0, 5966.0, 6170.0, 6551.0, 6785.0, 7082.0,
+        7271.298, 30097.314, 30965.78
+    )),
+    (48, 'Cd', 'Cadmium', 112.414, (
+        8.99382, 16.908313, 37.468, 51.0, 67.9, 87.0, 105.0, 130.1, 150.0,
+        173.0, 195.0, 218.0, 305.0, 329.0, 358.0, 385.0, 421.0, 452.6, 513.0,
+        546.19, 963.0, 1026.0, 1095.0, 1167.0, 1237.0, 1320.0, 1401.0, 1477.0,
+        1558.0, 1635.0, 1852.0, 1917.9, 1998.0, 2091.0, 2195.0, 2250.0, 2427.0,
+        2498.62, 5839.0, 6039.0, 6257.0, 6460.0, 6869.0, 7109.0, 7414.0,
+        7607.95, 31451.07, 32341.587
+    )),
+    (49, 'In', 'Indium', 114.818, (
+        5.7863558, 18.87041, 28.04415, 55.45, 69.3, 90.0, 109.0, 130.1, 156.0,
+        178.0, 201.0, 226.0, 249.0, 341.0, 368.0, 396.0, 425.0, 462.0, 497.1,
+        560.0, 593.38, 1043.0, 1109.0, 1181.0, 1255.0, 1328.0, 1413.0, 1496.0,
+        1575.0, 1659.0, 1738.0, 1961.0, 2028.5, 2111.0, 2207.0, 2317.0, 2373.0,
+        2555.0, 2628.77, 6126.0, 6331.0, 6554.0, 6770.0, 7196.0, 7442.0,
+        7754.0, 7953.14, 32837.593, 33750.404
+    )),
+    (50, 'Sn', 'Tin', 118.71, (
+        7.343918, 14.63307, 30.506, 40.74, 77.03, 94.0, 112.9, 135.0, 156.0,
+        184.0, 208.0, 232.0, 258.0, 282.0, 379.0, 407.0, 437.0, 466.0, 506.0,
+        537.0, 608.0, 642.35, 1127.0, 1195.0, 1269.0, 1347.0, 1421.0, 1508.0,
+        1596.0, 1676.0, 1763.0, 1844.0, 2074.0, 2142.1, 2227.0, 2326.0, 2443.0,
+        2499.0, 2687.0, 2762.49, 6421.0, 6631.0, 6859.0, 7080.0, 7531.0,
+        7790.0, 8103.0, 8306.95, 34257.148, 35192.501
+    )),
+    (51, 'Sb', 'Antimony', 121.76, (
+        8.608389, 16.626, 25.3235, 43.804, 55.0, 99.51, 117.0, 139.0, 162.0,
+        185.0, 214.0, 238.0, 265.0, 292.0, 317.0, 420.0, 447.0, 479.0, 510.0,
+        552.0, 584.0, 657.0, 693.26, 1214.0, 1285.0, 1360.0, 1441.0, 1518.0,
+        1606.0, 1698.0, 1781.0, 1869.0, 1954.0, 2190.0, 2266.0, 2349.0, 2428.0,
+        2567.0, 2654.0, 2815.0, 2900.0, 6714.0, 6929.0, 7167.0, 7390.0, 7887.0,
+        8140.0, 8455.0, 8669.48, 35710.03, 36668.183
+    )),
+    (52, 'Te', 'Tellurium', 127.6, (
+        9.009808, 18.6, 27.84, 37.4155, 59.3, 69.1, 124.2, 143.0, 167.0, 191.1,
+        215.0, 245.0, 272.0, 299.0, 328.0, 354.0, 461.0, 491.0, 522.0, 555.0,
+        599.0, 633.0, 709.0, 746.12, 1304.0, 1377.0, 1455.0, 1538.0, 1618.0,
+        1707.0, 1803.0, 1889.0, 1979.0, 2066.0, 2309.0, 2386.0, 2472.0, 2552.0,
+        2700.0, 2788.0, 2954.0, 3041.0, 7022.0, 7243.0, 7485.0, 7714.0, 8240.0,
+        8499.0, 8821.0, 9040.83, 37196.52, 38177.74
+    )),
+    (53, 'I', 'Iodine', 126.90447, (
+        10.451236, 19.13126, 29.57, 40.357, 51.52, 74.4, 87.61, 150.81, 171.0,
+        197.0, 220.9, 247.0, 279.0, 307.0, 335.0, 365.0, 393.0, 505.0, 535.0,
+        569.0, 601.0, 649.0, 683.0, 762.0, 800.8, 1397.0, 1472.0, 1553.0,
+        1639.0, 1720.0, 1812.0, 1911.0, 1999.0, 2093.0, 2181.0, 2431.0, 2510.0,
+        2598.0, 2680.0, 2836.0, 2926.0, 3096.0, 3185.5, 7337.0, 7563.0, 7811.0,
+        8044.0, 8601.0, 8867.0, 9196.0, 9421.1, 38717.0, 39721.549
+    )),
+    (54, 'Xe', 'Xenon', 131.293, (
+        12.1298437, 20.975, 31.05, 42.2, 54.1, 66.703, 91.6, 105.9778, 179.84,
+        202.0, 229.02, 255.0, 281.0, 314.0, 343.0, 374.0, 404.0, 434.0, 549.0,
+        582.0, 616.0, 650.0, 700.0, 736.0, 818.0, 857.0, 1493.0, 1571.0,
+        1653.0, 1742.0, 1826.0, 1919.0, 2023.0, 2113.0, 2209.0, 2300.0, 2556.0,
+        2637.0, 2726.0, 2811.0, 2975.0, 3068.0, 3243.0, 3333.8, 7660.0, 7889.0,
+        8144.0, 8382.0, 8971.0, 9243.0, 9581.0, 9810.37, 40271.73, 41299.892
+    )),
+    (55, 'Cs', 'Cesium', 132.90545196, (
+        3.89390572743, 23.15745, 33.195, 43.0, 56.0, 69.1, 82.9, 110.1, 125.61,
+        213.3, 233.0, 261.0, 289.0, 316.0, 352.0, 382.0, 413.0, 445.0, 476.0,
+        597.0, 629.0, 666.0, 700.0, 753.0, 791.0, 875.0, 916.1, 1592.0, 1672.0,
+        1757.0, 1848.0, 1936.0, 2029.0, 2137.0, 2230.0, 2329.0, 2422.0, 2683.0,
+        2767.0, 2859.0, 2945.0, 3118.0, 3214.0, 3392.0, 3485.0, 7989.0, 8224.0,
+        8484.0, 8726.0, 9350.0, 9629.0, 9974.0, 10208.78, 41861.08, 42913.144
+    )),
+    (56, 'Ba', 'Barium', 137.327, (
+        5.2116646, 10.003826, 35.8438, 47.0, 58.0, 71.0, 86.0, 101.0, 130.5,
+        146.52, 241.0, 267.1, 296.0, 325.0, 354.0, 390.0, 422.0, 455.0, 488.0,
+        520.0, 646.0, 679.0, 717.0, 752.0, 809.0, 846.0, 935.0, 976.62, 1695.0,
+        1776.0, 1864.0, 1958.0, 2047.0, 2142.0, 2256.0, 2349.0, 2452.0, 2547.0,
+        2814.0, 2901.0, 2994.0, 3081.0, 3266.0, 3363.0, 3546.0, 3640.0, 8326.0,
+        8565.0, 8831.0, 9077.0, 9739.0, 10023.0, 10376.0, 10616.42, 43485.37,
+        44561.633
+    )),
+    (57, 'La', 'Lanthanum', 138.90547, (
+        5.5769, 11.18496, 19.1773, 49.95, 61.6, 74.0, 88.0, 105.0, 119.0,
+        151.4, 168.77, 275.0, 303.0, 332.0, 364.0, 393.0, 431.0, 464.0, 498.0,
+        533.0, 566.0, 696.0, 731.0, 770.0, 806.0, 865.0, 906.0, 995.0, 1039.09,
+        1800.0, 1884.0, 1974.0, 2069.0, 2162.0, 2259.0, 2377.0, 2473.0, 2577.0,
+        2674.0, 2950.0, 3036.0, 3133.0, 3222.0, 3416.0, 3515.0, 3704.0, 3800.0,
+        8669.0, 8914.0, 9184.0, 9437.0, 10136.0, 10426.0, 10789.0, 11033.4,
+        45145.0, 46245.77
+    )),
+    (58, 'Ce', 'Cerium', 140.116, (
+        5.5386, 10.956, 20.1974, 36.906, 65.55, 77.6, 91.0, 106.0, 125.0,
+        140.0, 172.0, 192.24, 312.0, 340.0, 371.0, 403.0, 435.0, 472.0, 509.0,
+        543.0, 579.0, 613.0, 749.0, 785.0, 824.0, 862.0, 924.0, 965.0, 1060.0,
+        1103.5, 1908.0, 1994.0, 2087.0, 2185.0, 2280.0, 2378.0, 2500.0, 2600.0,
+        2706.0, 2806.0, 3087.0, 3176.0, 3274.0, 3366.0, 3570.0, 3672.0, 3865.0,
+        3963.0, 9020.0, 9269.0, 9545.0, 9803.0, 10542.0, 10840.0, 11210.0,
+        11459.85, 46840.31, 47965.89
+    )),
+    (59, 'Pr', 'Praseodymium', 140.90766, (
+        5.4702, 10.631, 21.6237, 38.981, 57.53, 82.0, 97.0, 112.0, 131.0,
+        148.0, 162.0, 196.0, 217.02, 350.0, 378.0, 412.0, 445.0, 478.0, 516.0,
+        554.0, 590.0, 627.0, 663.0, 803.0, 840.0, 880.0, 920.0, 985.0, 1028.0,
+        1124.0, 1169.9, 2019.0, 2108.0, 2202.0, 2304.0, 2400.0, 2501.0, 2628.0,
+        2729.0, 2838.0, 2941.0, 3227.0, 3319.0, 3419.0, 3512.0, 3729.0, 3832.0,
+        4030.0, 4130.0, 9378.0, 9632.0, 9913.0, 10175.0, 10959.0, 11262.0,
+        11641.0, 11895.89, 48571.71, 49722.44
+    )),
+    (60, 'Nd', 'Neodymium', 144.242, (
+        5.525, 10.783, 22.09, 40.6, 60.0, 84.0, 99.0, 114.0, 136.0, 152.0,
+        168.0, 195.0, 221.0, 243.0, 389.0, 420.0, 453.0, 489.0, 522.0, 562.0,
+        602.0, 638.0, 678.0, 714.0, 859.0, 896.0, 939.0, 978.0, 1049.0, 1092.0,
+        1191.0, 1238.42, 2134.0, 2224.0, 2321.0, 2425.0, 2525.0, 2627.0,
+        2758.0, 2861.0, 2974.0, 3078.0, 3371.0, 3465.0, 3567.0, 3662.0, 3891.0,
+        3997.0, 4198.0, 4302.0, 9742.0, 10002.0, 10288.0, 10555.0, 11384.0,
+        11694.0, 12082.0, 12341.66, 50339.59, 51515.78
+    )),
+    (61, 'Pm', 'Promethium', 144.91276, (
+        5.58187, 10.938, 22.44, 41.17, 61.7, 85.0, 101.0, 116.0, 138.0, 155.0,
+        174.0, 202.0, 229.0, 248.0, 269.0, 430.0, 462.0, 497.0, 534.0, 569.0,
+        609.0, 651.0, 689.0, 730.0, 767.0, 916.0, 956.0, 998.0, 1040.0, 1113.0,
+        1158.0, 1261.0, 1308.7, 2251.0, 2344.0, 2443.0, 2549.0, 2652.0, 2755.0,
+        2892.0, 2997.0, 3112.0, 3219.0, 3519.0, 3613.0, 3718.0, 3816.0, 4056.0,
+        4166.0, 4371.0, 4476.0, 10115.0, 10378.0, 10671.0, 10942.0, 11819.0,
+        12136.0, 12532.0, 12797.26, 52144.29, 53346.31
+    )),
+    (62, 'Sm', 'Samarium', 150.36, (
+        5.643722, 11.078, 23.55, 41.64, 62.7, 87.0, 103.0, 118.0, 141.0, 158.0,
+        179.0, 208.0, 237.0, 257.0, 276.0, 306.5, 474.0, 506.0, 543.0, 581.0,
+        617.0, 658.0, 702.0, 742.0, 782.0, 822.0, 976.0, 1016.0, 1060.0,
+        1103.0, 1180.0, 1226.0, 1332.0, 1381.56, 2371.0, 2466.0, 2569.0,
+        2676.0, 2782.0, 2887.0, 3028.0, 3137.0, 3253.0, 3363.0, 3669.0, 3766.0,
+        3873.0, 3971.0, 4227.0, 4337.0, 4548.0, 4655.0, 10494.0, 10762.0,
+        11060.0, 11337.0, 12264.0, 12588.0, 12992.0, 13262.85, 53986.12,
+        55214.3
+    )),
+    (63, 'Eu', 'Europium', 151.964, (
+        5.670385, 11.24, 24.84, 42.94, 63.2, 89.0, 105.0, 120.0, 144.0, 161.0,
+        183.0, 213.0, 243.0, 263.0, 281.0, 311.0, 344.4, 518.0, 553.0, 590.0,
+        630.0, 667.0, 709.0, 755.0, 795.0, 838.0, 879.0, 1037.0, 1078.0,
+        1124.0, 1167.0, 1249.0, 1296.0, 1406.0, 1456.06, 2495.0, 2591.0,
+        2697.0, 2807.0, 2914.0, 3022.0, 3168.0, 3279.0, 3398.0, 3510.0, 3823.0,
+        3921.0, 4031.0, 4131.0, 4400.0, 4513.0, 4729.0, 4838.0, 10880.0,
+        11153.0, 11457.0, 11739.0, 12718.0, 13050.0, 13462.0, 13738.58,
+        55865.93, 57120.64
+    )),
+    (64, 'Gd', 'Gadolinium', 157.25, (
+        6.1498, 12.076, 20.54, 44.44, 64.8, 89.0, 106.0, 123.0, 144.0, 165.0,
+        183.0, 213.0, 246.0, 268.0, 288.0, 319.0, 352.0, 384.4, 565.0, 601.0,
+        639.0, 680.0, 719.0, 761.0, 810.0, 851.0, 895.0, 937.0, 1100.0, 1142.0,
+        1189.0, 1233.0, 1321.0, 1368.0, 1481.0, 1532.3, 2621.0, 2720.0, 2827.0,
+        2941.0, 3050.0, 3160.0, 3312.0, 3424.0, 3546.0, 3660.0, 3980.0, 4080.0,
+        4191.0, 4294.0, 4578.0, 4693.0, 4914.0, 5025.0, 11273.0, 11552.0,
+        11861.0, 12147.0, 13183.0, 13521.0, 13943.0, 14224.57, 57783.91,
+        59065.54
+    )),
+    (65, 'Tb', 'Terbium', 158.92535, (
+        5.8638, 11.513, 21.82, 39.33, 66.5, 90.0, 108.0, 125.0, 143.0, 168.0,
+        186.0, 216.0, 250.0, 273.0, 294.0, 325.0, 358.0, 393.0, 426.6, 613.0,
+        651.0, 690.0, 732.0, 772.0, 816.0, 866.0, 909.0, 954.0, 997.0, 1165.0,
+        1208.0, 1256.0, 1301.0, 1393.0, 1443.0, 1559.0, 1610.4, 2750.0, 2852.0,
+        2961.0, 3078.0, 3189.0, 3300.0, 3458.0, 3573.0, 3698.0, 3814.0, 4139.0,
+        4242.0, 4355.0, 4460.0, 4760.0, 4877.0, 5103.0, 5217.0, 11673.0,
+        11957.0, 12272.0, 12563.0, 13658.0, 14003.0, 14434.0, 14721.02,
+        59741.12, 61050.1
+    )),
+    (66, 'Dy', 'Dysprosium', 162.5, (
+        5.939061, 11.647, 22.89, 41.23, 62.1, 93.0, 110.0, 127.0, 152.0, 170.0,
+        192.0, 224.0, 259.0, 279.0, 300.0, 332.0, 366.0, 399.0, 431.0, 464.9,
+        664.0, 702.0, 743.0, 786.0, 827.0, 872.0, 924.0, 969.0, 1014.0, 1059.0,
+        1232.0, 1275.0, 1325.0, 1371.0, 1468.0, 1520.0, 1638.0, 1691.7, 2882.0,
+        2987.0, 3098.0, 3217.0, 3331.0, 3445.0, 3607.0, 3725.0, 3852.0, 3970.0,
+        4303.0, 4407.0, 4523.0, 4629.0, 4945.0, 5066.0, 5296.0, 5412.0,
+        12081.0, 12370.0, 12690.0, 12986.0, 14144.0, 14495.0, 14936.0,
+        15228.06, 61736.62, 63073.23
+    )),
+    (67, 'Ho', 'Holmium', 164.93033, (
+        6.0215, 11.781, 22.79, 42.52, 63.9, 95.0, 112.0, 129.0, 155.0, 173.0,
+        197.0, 229.0, 263.0, 284.0, 305.0, 340.0, 373.0, 408.0, 441.0, 475.0,
+        510.0, 715.0, 755.0, 797.0, 842.0, 885.0, 929.0, 985.0, 1029.0, 1077.0,
+        1122.0, 1300.0, 1346.0, 1395.0, 1443.0, 1545.0, 1598.0, 1719.0, 1773.6,
+        3018.0, 3125.0, 3238.0, 3359.0, 3476.0, 3592.0, 3760.0, 3880.0, 4009.0,
+        4131.0, 4469.0, 4576.0, 4693.0, 4802.0, 5135.0, 5258.0, 5494.0, 5611.0,
+        12495.0, 12790.0, 13116.0, 13417.0, 14639.0, 14998.0, 15448.0,
+        15745.77, 63772.42, 65137.13
+    )),
+    (68, 'Er', 'Erbium', 167.259, (
+        6.1077, 11.916, 22.7, 42.42, 65.1, 96.0, 114.0, 131.0, 158.0, 177.0,
+        201.0, 235.0, 268.0, 290.0, 311.0, 345.0, 381.0, 415.0, 450.0, 486.0,
+        520.0, 555.0, 770.0, 810.0, 853.0, 899.0, 943.0, 989.0, 1046.0, 1092.0,
+        1142.0, 1188.0, 1370.0, 1416.0, 1468.0, 1516.0, 1625.0, 1678.0, 1803.0,
+        1858.5, 3157.0, 3265.0, 3381.0, 3505.0, 3624.0, 3742.0, 3916.0, 4038.0,
+        4170.0, 4294.0, 4639.0, 4748.0, 4866.0, 4978.0, 5329.0, 5455.0, 5695.0,
+        5815.0, 12918.0, 13217.0, 13548.0, 13855.0, 15146.0, 15511.0, 15971.0,
+        16274.56, 65848.24, 67241.48
+    )),
+    (69, 'Tm', 'Thulium', 168.93422, (
+        6.184402, 12.065, 23.66, 42.41, 65.4, 98.0, 116.0, 133.0, 160.0, 180.0,
+        205.0, 239.0, 274.0, 295.0, 317.0, 352.0, 387.0, 424.0, 460.0, 496.0,
+        530.0, 570.0, 603.0, 825.0, 866.0, 911.0, 958.0, 1004.0, 1050.0,
+        1110.0, 1157.0, 1207.0, 1255.0, 1442.0, 1490.0, 1542.0, 1591.0, 1706.0,
+        1761.0, 1889.0, 1945.2, 3298.0, 3409.0, 3528.0, 3653.0, 3775.0, 3895.0,
+        4075.0, 4199.0, 4335.0, 4461.0, 4812.0, 4922.0, 5044.0, 5157.0, 5527.0,
+        5656.0, 5901.0, 6023.0, 13347.0, 13651.0, 13988.0, 14300.0, 15663.0,
+        16036.0, 16510.0, 16814.34, 67965.25, 69387.45
+    )),
+    (70, 'Yb', 'Ytterbium', 173.045, (
+        6.25416, 12.179185, 25.053, 43.61, 65.6, 99.0, 117.0, 135.0, 163.0,
+        182.0, 209.0, 244.0, 279.0, 301.0, 324.0, 360.0, 396.0, 431.0, 469.0,
+        505.0, 540.0, 580.0, 610.0, 651.0, 882.0, 924.0, 971.0, 1019.0, 1065.0,
+        1114.0, 1175.0, 1224.0, 1275.0, 1324.0, 1516.0, 1564.0, 1618.0, 1668.0,
+        1789.0, 1845.0, 1978.0, 2036.4, 3443.0, 3555.0, 3677.0, 3805.0, 3929.0,
+        4051.0, 4238.0, 4364.0, 4502.0, 4630.0, 4988.0, 5101.0, 5224.0, 5339.0,
+        5731.0, 5860.0, 6111.0, 6236.0, 13784.0, 14093.0, 14435.0, 14752.0,
+        16191.0, 16570.0, 17050.0, 17365.44, 70123.04, 71574.63
+    )),
+    (71, 'Lu', 'Lutetium', 174.9668, (
+        5.425871, 14.13, 20.9594, 45.249, 66.8, 98.0, 117.0, 136.0, 159.0,
+        185.0, 205.0, 238.0, 276.0, 305.0, 328.0, 361.0, 399.0, 438.0, 476.0,
+        520.0, 560.0, 600.0, 630.0, 670.0, 713.0, 941.0, 985.0, 1032.0, 1081.0,
+        1130.0, 1178.0, 1242.0, 1292.0, 1345.0, 1395.0, 1591.0, 1641.0, 1696.0,
+        1747.0, 1875.0, 1933.0, 2067.0, 2125.5, 3590.0, 3706.0, 3828.0, 3960.0,
+        4086.0, 4211.0, 4403.0, 4532.0, 4673.0, 4803.0, 5168.0, 5282.0, 5408.0,
+        5525.0, 5937.0, 6070.0, 6326.0, 6452.0, 14228.0, 14542.0, 14890.0,
+        15211.0, 16730.0, 17120.0, 17610.0, 17928.05, 72322.87, 73804.35
+    )),
+    (72, 'Hf', 'Hafnium', 178.49, (
+        6.82507, 14.61, 22.55, 33.37, 68.37, 98.0, 118.0, 137.0, 157.0, 187.0,
+        209.0, 230.0, 270.0, 310.0, 334.0, 359.0, 399.0, 440.0, 481.0, 520.0,
+        570.0, 610.0, 650.0, 690.0, 730.0, 772.0, 1002.0, 1047.0, 1094.0,
+        1146.0, 1195.0, 1245.0, 1311.0, 1362.0, 1417.0, 1467.0, 1669.0, 1719.0,
+        1776.0, 1827.0, 1963.0, 2022.0, 2159.0, 2218.9, 3741.0, 3858.0, 3984.0,
+        4118.0, 4246.0, 4372.0, 4573.0, 4703.0, 4846.0, 4980.0, 5350.0, 5468.0,
+        5595.0, 5713.0, 6149.0, 6284.0, 6545.0, 6674.0, 14678.0, 14999.0,
+        15351.0, 15680.0, 17280.0, 17680.0, 18180.0, 18502.32, 74565.91,
+        76077.7
+    )),
+    (73, 'Ta', 'Tantalum', 180.94788, (
+        7.549571, 16.2, 23.1, 35.0, 48.272, 94.01, 119.0, 139.0, 159.0, 180.0,
+        213.0, 235.0, 262.0, 304.0, 338.0, 363.0, 396.0, 439.0, 482.0, 530.0,
+        570.0, 610.0, 660.0, 700.0, 750.0, 790.0, 832.0, 1064.0, 1110.0,
+        1160.0, 1211.0, 1262.0, 1313.0, 1382.0, 1434.0, 1490.0, 1542.0, 1748.0,
+        1799.0, 1857.0, 1910.0, 2053.0, 2113.0, 2254.0, 2314.7, 3898.7, 4014.0,
+        4143.0, 4278.0, 4410.0, 4537.0, 4745.0, 4877.0, 5024.0, 5159.0, 5537.0,
+        5655.0, 5785.0, 5907.0, 6364.0, 6502.0, 6769.0, 6900.0, 15137.0,
+        15461.0, 15820.0, 16150.0, 17840.0, 18250.0, 18760.0, 19088.51,
+        76852.0, 78394.63
+    )),
+    (74, 'W', 'Tungsten', 183.84, (
+        7.86403, 16.37, 26.0, 38.2, 51.6, 64.77, 122.01, 141.2, 160.2, 179.0,
+        208.9, 231.6, 258.3, 290.7, 325.3, 361.9, 387.9, 420.7, 462.1, 502.6,
+        543.4, 594.5, 640.6, 685.6, 734.1, 784.4, 833.4, 881.4, 1132.2, 1180.0,
+        1230.4, 1283.4, 1335.1, 1386.8, 1459.9, 1512.4, 1569.1, 1621.7, 1829.8,
+        1882.9, 1940.6, 1994.8, 2149.1, 2210.0, 2354.5, 2414.1, 4057.0, 4180.0,
+        4309.0, 4446.0, 4578.0, 4709.0, 4927.0, 5063.0, 5209.0, 5348.0, 5719.0,
+        5840.0, 5970.0, 6093.0, 6596.0, 6735.0, 7000.0, 7130.0, 15566.0,
+        15896.0, 16252.0, 16588.0, 18476.0, 18872.0, 19362.0, 19686.74,
+        79181.94, 80755.91
+    )),
+    (75, 'Re', 'Rhenium', 186.207, (
+        7.83352, 16.6, 27.0, 39.1, 51.9, 67.0, 82.71, 144.4, 165.0, 187.0,
+        208.0, 236.0, 268.0, 291.0, 330.0, 377.0, 403.0, 429.0, 476.0, 520.0,
+        570.0, 620.0, 670.0, 720.0, 760.0, 810.0, 860.0, 910.0, 953.0, 1194.0,
+        1242.0, 1294.0, 1349.0, 1402.0, 1454.0, 1530.0, 1583.0, 1641.0, 1696.0,
+        1912.0, 1966.0, 2025.0, 2080.0, 2240.0, 2302.0, 2450.0, 2514.5, 4214.0,
+        4335.0, 4468.0, 4609.0, 4745.0, 4877.0, 5099.0, 5236.0, 5388.0, 5528.0,
+        5919.0, 6042.0, 6176.0, 6300.0, 6810.0, 6952.0, 7230.0, 7366.0,
+        16080.0, 16410.0, 16780.0, 17120.0, 19000.0, 19420.0, 19950.0, 20297.4,
+        81556.58, 83162.41
+    )),
+    (76, 'Os', 'Osmium', 190.23, (
+        8.43823, 17.0, 25.0, 41.0, 55.0, 70.1, 85.1, 102.02, 168.7, 190.0,
+        213.0, 235.0, 269.0, 298.0, 322.0, 367.0, 410.0, 436.0, 470.0, 520.0,
+        570.0, 620.0, 670.0, 720.0, 770.0, 820.0, 870.0, 920.0, 970.0, 1015.0,
+        1262.0, 1311.0, 1364.0, 1420.0, 1474.0, 1528.0, 1606.0, 1660.0, 1720.0,
+        1776.0, 1996.0, 2052.0, 2112.0, 2168.0, 2336.0, 2400.0, 2552.0, 2615.5,
+        4374.0, 4501.0, 4635.0, 4779.0, 4917.0, 5052.0, 5280.0, 5421.0, 5575.0,
+        5717.0, 6115.0, 6240.0, 6376.0, 6503.0, 7039.0, 7185.0, 7468.0, 7610.0,
+        16560.0, 16900.0, 17270.0, 17620.0, 19600.0, 20030.0, 20570.0, 20920.6,
+        83976.18, 85614.42
+    )),
+    (77, 'Ir', 'Iridium', 192.217, (
+        8.96702, 17.0, 28.0, 40.0, 57.0, 72.0, 89.0, 105.0, 122.7, 194.8,
+        217.0, 240.0, 264.0, 303.0, 329.0, 356.0, 407.0, 445.0, 472.0, 510.0,
+        560.0, 610.0, 670.0, 720.0, 770.0, 820.0, 870.0, 920.0, 980.0, 1030.0,
+        1080.0, 1331.0, 1381.0, 1436.0, 1493.0, 1548.0, 1603.0, 1684.0, 1739.0,
+        1801.0, 1857.0, 2083.0, 2139.0, 2201.0, 2258.0, 2435.0, 2500.0, 2656.0,
+        2720.4, 4540.0, 4668.0, 4806.0, 4952.0, 5092.0, 5229.0, 5466.0, 5609.0,
+        5765.0, 5910.0, 6315.0, 6441.0, 6580.0, 6708.0, 7274.0, 7421.0, 7710.0,
+        7850.0, 17040.0, 17390.0, 17770.0, 18120.0, 20210.0, 20650.0, 21200.0,
+        21556.6, 86442.44, 88113.6
+    )),
+    (78, 'Pt', 'Platinum', 195.084, (
+        8.95883, 18.56, 29.0, 43.0, 56.0, 75.0, 91.0, 109.0, 126.0, 144.9,
+        220.4, 245.0, 269.0, 293.0, 332.0, 358.0, 392.0, 445.0, 479.0, 507.0,
+        550.0, 610.0, 660.0, 710.0, 760.0, 820.0, 870.0, 930.0, 980.0, 1040.0,
+        1090.0, 1140.0, 1402.0, 1454.0, 1509.0, 1567.0, 1624.0, 1680.0, 1763.0,
+        1821.0, 1883.0, 1941.0, 2171.0, 2228.0, 2291.0, 2350.0, 2536.0, 2603.0,
+        2762.0, 2827.8, 4715.0, 4839.0, 4980.0, 5128.0, 5270.0, 5410.0, 5654.0,
+        5800.0, 5959.0, 6106.0, 6517.0, 6646.0, 6787.0, 6918.0, 7512.0, 7660.0,
+        7960.0, 8100.0, 17540.0, 17890.0, 18280.0, 18630.0, 20840.0, 21280.0,
+        21840.0, 22205.7, 88955.1, 90659.84
+    )),
+    (79, 'Au', 'Gold', 196.966569, (
+        9.225554, 20.203, 30.0, 45.0, 60.0, 74.0, 94.0, 112.0, 130.1, 149.0,
+        168.2, 248.0, 275.0, 299.0, 324.0, 365.0, 392.0, 433.0, 487.0, 520.0,
+        550.0, 600.0, 650.0, 710.0, 760.0, 820.0, 870.0, 930.0, 990.0, 1040.0,
+        1100.0, 1150.0, 1210.0, 1475.0, 1527.0, 1584.0, 1644.0, 1702.0, 1758.0,
+        1845.0, 1904.0, 1967.0, 2026.0, 2261.0, 2320.0, 2383.0, 2443.0, 2640.0,
+        2708.0, 2870.0, 2941.0, 4888.0, 5013.0, 5156.0, 5307.0, 5452.0, 5594.0,
+        5846.0, 5994.0, 6156.0, 6305.0, 6724.0, 6854.0, 6997.0, 7130.0, 7760.0,
+        7910.0, 8210.0, 8360.0, 18040.0, 18400.0, 18790.0, 19150.0, 21470.0,
+        21920.0, 22500.0, 22868.1, 91515.8, 93254.62
+    )),
+    (80, 'Hg', 'Mercury', 200.592, (
+        10.437504, 18.75688, 34.49, 48.55, 61.2, 76.6, 93.0, 113.9, 134.0,
+        153.0, 173.0, 192.7, 276.9, 307.0, 332.0, 357.0, 402.0, 429.0, 477.0,
+        530.0, 560.0, 590.0, 650.0, 710.0, 760.0, 820.0, 880.0, 930.0, 990.0,
+        1050.0, 1110.0, 1160.0, 1220.0, 1280.0, 1549.0, 1603.0, 1661.0, 1723.0,
+        1780.0, 1839.0, 1928.0, 1989.0, 2052.0, 2113.0, 2354.0, 2412.0, 2478.0,
+        2539.0, 2745.0, 2815.0, 2981.0, 3049.9, 5055.0, 5191.0, 5335.0, 5490.0,
+        5636.0, 5780.0, 6041.0, 6192.0, 6356.0, 6508.0, 6933.0, 7066.0, 7211.0,
+        7350.0, 8010.0, 8160.0, 8470.0, 8620.0, 18550.0, 18910.0, 19310.0,
+        19680.0, 22120.0, 22580.0, 23170.0, 23544.1, 94124.7, 95898.19
+    )),
+    (81, 'Tl', 'Thallium', 204.38, (
+        6.1082873, 20.4283, 29.852, 51.14, 62.6, 80.0, 97.9, 116.0, 135.0,
+        158.0, 177.0, 198.0, 218.3, 306.9, 340.0, 366.0, 392.0, 439.0, 467.0,
+        520.0, 570.0, 600.0, 640.0, 700.0, 760.0, 820.0, 880.0, 930.0, 990.0,
+        1060.0, 1110.0, 1170.0, 1230.0, 1290.0, 1350.0, 1625.0, 1681.0, 1740.0,
+        1802.0, 1862.0, 1920.0, 2014.0, 2075.0, 2140.0, 2202.0, 2447.0, 2508.0,
+        2574.0, 2635.0, 2854.0, 2925.0, 3094.0, 3164.7, 5234.0, 5371.0, 5518.0,
+        5674.0, 5824.0, 5969.0, 6241.0, 6392.0, 6560.0, 6714.0, 7146.0, 7281.0,
+        7430.0, 7570.0, 8260.0, 8420.0, 8730.0, 8880.0, 19070.0, 19440.0,
+        19840.0, 20210.0, 22780.0, 23250.0, 23850.0, 24234.1, 96783.2, 98592.12
+    )),
+    (82, 'Pb', 'Lead', 207.2, (
+        7.4166799, 15.032499, 31.9373, 42.33256, 68.8, 82.9, 100.1, 120.0,
+        138.0, 158.0, 182.0, 203.0, 224.0, 245.1, 338.1, 374.0, 401.0, 427.0,
+        478.0, 507.0, 570.0, 610.0, 650.0, 690.0, 750.0, 810.0, 870.0, 930.0,
+        990.0, 1050.0, 1120.0, 1180.0, 1240.0, 1300.0, 1360.0, 1430.0, 1704.0,
+        1760.0, 1819.0, 1884.0, 1945.0, 2004.0, 2101.0, 2163.0, 2230.0, 2292.0,
+        2543.0, 2605.0, 2671.0, 2735.0, 2965.0, 3036.0, 3211.0, 3282.1, 5414.0,
+        5555.0, 5703.0, 5862.0, 6015.0, 6162.0, 6442.0, 6597.0, 6767.0, 6924.0,
+        7362.0, 7500.0, 7650.0, 7790.0, 8520.0, 8680.0, 9000.0, 9150.0,
+        19590.0, 19970.0, 20380.0, 20750.0, 23460.0, 23940.0, 24550.0, 24938.2,
+        99491.8, 101336.7
+    )),
+    (83, 'Bi', 'Bismuth', 208.9804, (
+        7.285516, 16.703, 25.57075, 45.37, 54.856, 88.4, 103.0, 122.0, 143.0,
+        161.1, 183.0, 208.0, 229.0, 252.0, 272.6, 370.2, 409.0, 436.0, 464.0,
+        520.0, 550.0, 620.0, 660.0, 690.0, 750.0, 810.0, 870.0, 930.0, 990.0,
+        1060.0, 1120.0, 1180.0, 1250.0, 1310.0, 1380.0, 1440.0, 1500.0, 1784.0,
+        1840.0, 1902.0, 1967.0, 2029.0, 2090.0, 2190.0, 2253.0, 2321.0, 2385.0,
+        2641.0, 2703.0, 2771.0, 2835.0, 3078.0, 3151.0, 3329.0, 3401.8, 5599.0,
+        5740.0, 5892.0, 6054.0, 6208.0, 6358.0, 6648.0, 6804.0, 6977.0, 7137.0,
+        7580.0, 7720.0, 7870.0, 8010.0, 8780.0, 8950.0, 9270.0, 9430.0,
+        20130.0, 20500.0, 20920.0, 21300.0, 24150.0, 24640.0, 25260.0, 25656.9,
+        102251.8, 104133.4
+    )),
+    (84, 'Po', 'Polonium', 209.0, (
+        8.41807, 19.3, 27.3, 36.0, 57.0, 69.1, 108.0, 125.0, 146.1, 166.0,
+        186.0, 209.0, 235.0, 257.0, 281.0, 304.0, 416.0, 444.0, 473.0, 502.0,
+        560.0, 590.0, 670.0, 700.0, 740.0, 800.0, 870.0, 930.0, 990.0, 1060.0,
+        1120.0, 1180.0, 1250.0, 1320.0, 1380.0, 1440.0, 1510.0, 1570.0, 1865.0,
+        1923.0, 1986.0, 2052.0, 2115.0, 2177.0, 2281.0, 2345.0, 2414.0, 2480.0,
+        2740.0, 2803.0, 2873.0, 2938.0, 3194.0, 3268.0, 3450.0, 3524.2, 5785.0,
+        5930.0, 6084.0, 6248.0, 6405.0, 6557.0, 6856.0, 7015.0, 7191.0, 7350.0,
+        7810.0, 7950.0, 8100.0, 8240.0, 9050.0, 9220.0, 9550.0, 9710.0,
+        20670.0, 21050.0, 21470.0, 21860.0, 24860.0, 25360.0, 25990.0, 26390.4,
+        105064.3, 106983.4
+    )),
+    (85, 'At', 'Astatine', 210.0, (
+        9.31751, 17.88, 26.58, 39.65, 50.39, 72.0, 85.1, 130.1, 149.0, 169.0,
+        192.1, 212.0, 236.0, 263.0, 287.0, 311.0, 335.0, 452.0, 481.0, 510.0,
+        540.0, 600.0, 630.0, 720.0, 750.0, 790.0, 860.0, 920.0, 990.0, 1050.0,
+        1120.0, 1180.0, 1250.0, 1320.0, 1380.0, 1450.0, 1510.0, 1590.0, 1650.0,
+        1948.0, 2007.0, 2071.0, 2139.0, 2203.0, 2266.0, 2373.0, 2439.0, 2510.0,
+        2576.0, 2841.0, 2905.0, 2977.0, 3042.0, 3312.0, 3388.0, 3573.0, 3649.0,
+        5976.0, 6122.0, 6279.0, 6445.0, 6604.0, 6759.0, 7068.0, 7230.0, 7410.0,
+        7570.0, 8030.0, 8180.0, 8330.0, 8480.0, 9330.0, 9500.0, 9830.0, 9990.0,
+        21210.0, 21600.0, 22030.0, 22420.0, 25580.0, 26090.0, 26730.0, 27139.0,
+        107930.0, 109887.2
+    )),
+    (86, 'Rn', 'Radon', 222.0, (
+        10.7485, 18.99, 29.4, 36.9, 52.9, 64.0, 88.0, 102.0, 154.0, 173.9,
+        195.0, 218.0, 240.0, 264.0, 293.0, 317.0, 342.0, 367.0, 488.0, 520.0,
+        550.0, 580.0, 640.0, 680.0, 760.0, 800.0, 850.0, 920.0, 980.0, 1050.0,
+        1110.0, 1180.0, 1250.0, 1310.0, 1390.0, 1460.0, 1520.0, 1590.0, 1660.0,
+        1720.0, 2033.0, 2094.0, 2158.0, 2227.0, 2293.0, 2357.0, 2467.0, 2535.0,
+        2606.0, 2674.0, 2944.0, 3010.0, 3082.0, 3149.0, 3433.0, 3510.0, 3699.0,
+        3777.0, 6169.0, 6318.0, 6476.0, 6646.0, 6807.0, 6964.0, 7283.0, 7450.0,
+        7630.0, 7800.0, 8260.0, 8410.0, 8570.0, 8710.0, 9610.0, 9780.0,
+        10120.0, 10290.0, 21770.0, 22160.0, 22600.0, 22990.0, 26310.0, 26830.0,
+        27490.0, 27903.1, 110846.3, 112842.2
+    )),
+    (87, 'Fr', 'Francium', 223.0, (
+        4.0727411, 22.4, 33.5, 39.1, 50.0, 67.0, 80.0, 106.0, 120.0, 179.0,
+        200.0, 222.1, 245.0, 269.0, 293.0, 324.0, 349.0, 375.0, 400.0, 530.0,
+        560.0, 590.0, 620.0, 690.0, 720.0, 810.0, 850.0, 910.0, 980.0, 1040.0,
+        1110.0, 1180.0, 1250.0, 1320.0, 1380.0, 1460.0, 1530.0, 1600.0, 1670.0,
+        1740.0, 1810.0, 2119.0, 2182.0, 2247.0, 2317.0, 2384.0, 2450.0, 2564.0,
+        2631.0, 2706.0, 2774.0, 3049.0, 3115.0, 3190.0, 3257.0, 3556.0, 3635.0,
+        3828.0, 3907.0, 6365.0, 6516.0, 6678.0, 6849.0, 7013.0, 7172.0, 7500.0,
+        7670.0, 7850.0, 8020.0, 8500.0, 8640.0, 8800.0, 8950.0, 9890.0,
+        10070.0, 10420.0, 10590.0, 22330.0, 22730.0, 23170.0, 23570.0, 27060.0,
+        27590.0, 28260.0, 28683.4, 113821.9, 115857.5
+    )),
+    (88, 'Ra', 'Radium', 226.0, (
+        5.2784239, 10.14718, 31.0, 41.0, 52.9, 64.0, 82.0, 97.0, 124.0, 140.0,
+        204.9, 227.0, 250.0, 274.0, 299.0, 324.0, 356.0, 382.0, 409.0, 435.0,
+        570.0, 600.0, 630.0, 660.0, 740.0, 770.0, 860.0, 900.0, 970.0, 1040.0,
+        1110.0, 1180.0, 1250.0, 1320.0, 1390.0, 1460.0, 1530.0, 1610.0, 1680.0,
+        1750.0, 1820.0, 1880.0, 2208.0, 2271.0, 2338.0, 2409.0, 2477.0, 2544.0,
+        2662.0, 2731.0, 2806.0, 2876.0, 3155.0, 3224.0, 3298.0, 3368.0, 3682.0,
+        3762.0, 3959.0, 4040.0, 6565.0, 6718.0, 6881.0, 7056.0, 7222.0, 7380.0,
+        7720.0, 7890.0, 8080.0, 8250.0, 8730.0, 8880.0, 9040.0, 9200.0,
+        10190.0, 10360.0, 10720.0, 10890.0, 22900.0, 23300.0, 23750.0, 24160.0,
+        27830.0, 28370.0, 29050.0, 29479.8, 116853.5, 118929.5
+    )),
+    (89, 'Ac', 'Actinium', 227.0, (
+        5.380235, 11.75, 17.436, 44.8, 55.0, 67.0, 79.0, 98.9, 113.9, 143.9,
+        161.1, 233.0, 255.0, 279.0, 305.0, 330.0, 355.0, 390.0, 416.0, 444.0,
+        470.0, 610.0, 640.0, 670.0, 710.0, 780.0, 820.0, 920.0, 950.0, 1030.0,
+        1100.0, 1170.0, 1240.0, 1310.0, 1380.0, 1460.0, 1530.0, 1610.0, 1680.0,
+        1750.0, 1820.0, 1900.0, 1970.0, 2298.0, 2362.0, 2430.0, 2503.0, 2572.0,
+        2639.0, 2762.0, 2833.0, 2908.0, 2980.0, 3264.0, 3334.0, 3409.0, 3479.0,
+        3811.0, 3893.0, 4093.0, 4175.0, 6767.0, 6923.0, 7088.0, 7265.0, 7430.0,
+        7600.0, 7950.0, 8120.0, 8310.0, 8480.0, 8970.0, 9120.0, 9290.0, 9440.0,
+        10480.0, 10660.0, 11030.0, 11200.0, 23480.0, 23890.0, 24340.0, 24760.0,
+        28610.0, 29160.0, 29850.0, 30293.1, 119945.7, 122063.1
+    )),
+    (90, 'Th', 'Thorium', 232.0377, (
+        6.3067, 12.1, 18.32, 28.648, 58.0, 69.1, 82.0, 95.0, 118.0, 133.0,
+        165.0, 181.0, 262.0, 285.0, 310.0, 336.0, 362.0, 389.0, 424.0, 451.0,
+        480.0, 508.0, 650.0, 680.0, 720.0, 750.0, 830.0, 870.0, 970.0, 1010.0,
+        1090.0, 1160.0, 1240.0, 1310.0, 1380.0, 1460.0, 1530.0, 1600.0, 1680.0,
+        1760.0, 1830.0, 1910.0, 1980.0, 2060.0, 2390.0, 2455.0, 2524.0, 2598.0,
+        2669.0, 2737.0, 2864.0, 2935.0, 3013.0, 3086.0, 3375.0, 3445.0, 3522.0,
+        3593.0, 3943.0, 4025.0, 4230.0, 4313.0, 6972.0, 7130.0, 7299.0, 7480.0,
+        7650.0, 7810.0, 8180.0, 8350.0, 8550.0, 8720.0, 9220.0, 9370.0, 9540.0,
+        9690.0, 10790.0, 10970.0, 11340.0, 11510.0, 24060.0, 24480.0, 24940.0,
+        25360.0, 29410.0, 29970.0, 30680.0, 31122.8, 123091.0, 125250.3
+    )),
+    (91, 'Pa', 'Protactinium', 231.03588, (
+        5.89, 11.9, 18.6, 30.9, 44.3, 72.0, 85.1, 98.9, 111.0, 137.0, 153.0,
+        187.0, 203.0, 292.0, 316.0, 342.0, 369.0, 395.0, 423.0, 460.0, 488.0,
+        518.0, 546.0, 690.0, 720.0, 760.0, 790.0, 880.0, 920.0, 1020.0, 1060.0,
+        1150.0, 1220.0, 1300.0, 1370.0, 1450.0, 1520.0, 1600.0, 1670.0, 1760.0,
+        1830.0, 1910.0, 1980.0, 2060.0, 2130.0, 2483.0, 2550.0, 2620.0, 2696.0,
+        2766.0, 2837.0, 2968.0, 3040.0, 3119.0, 3193.0, 3488.0, 3558.0, 3637.0,
+        3709.0, 4077.0, 4161.0, 4370.0, 4454.0, 7181.0, 7341.0, 7510.0, 7690.0,
+        7870.0, 8040.0, 8410.0, 8590.0, 8780.0, 8960.0, 9460.0, 9620.0, 9790.0,
+        9950.0, 11100.0, 11290.0, 11660.0, 11840.0, 24660.0, 25080.0, 25540.0,
+        25970.0, 30230.0, 30800.0, 31520.0, 31971.6, 126304.8, 128507.0
+    )),
+    (92, 'U', 'Uranium', 238.02891, (
+        6.19405, 11.6, 19.8, 36.7, 46.0, 62.0, 89.0, 101.0, 116.0, 128.9,
+        158.0, 173.0, 210.0, 227.0, 323.0, 348.0, 375.0, 402.0, 431.0, 458.0,
+        497.0, 525.0, 557.0, 585.0, 730.0, 770.0, 800.0, 840.0, 930.0, 970.0,
+        1070.0, 1110.0, 1210.0, 1290.0, 1370.0, 1440.0, 1520.0, 1590.0, 1670.0,
+        1750.0, 1830.0, 1910.0, 1990.0, 2070.0, 2140.0, 2220.0, 2578.0, 2646.0,
+        2718.0, 2794.0, 2867.0, 2938.0, 3073.0, 3147.0, 3228.0, 3301.0, 3602.0,
+        3675.0, 3753.0, 3827.0, 4214.0, 4299.0, 4513.0, 4598.0, 7393.0, 7550.0,
+        7730.0, 7910.0, 8090.0, 8260.0, 8650.0, 8830.0, 9030.0, 9210.0, 9720.0,
+        9870.0, 10040.0, 10200.0, 11410.0, 11600.0, 11990.0, 12160.0, 25260.0,
+        25680.0, 26150.0, 26590.0, 31060.0, 31640.0, 32400.0, 32836.5,
+        129569.9, 131816.2
+    )),
+    (93, 'Np', 'Neptunium', 237.0, (
+        6.26554, 11.5, 19.7, 33.8, 48.0, 65.0, 92.0, 107.0, 121.0, 136.0,
+        151.0, 179.0, 196.0, 233.0, 252.0, 355.0, 382.0, 408.0, 438.0, 466.0,
+        495.0, 535.0, 565.0, 596.0, 626.0, 770.0, 810.0, 850.0, 880.0, 980.0,
+        1020.0, 1130.0, 1170.0, 1280.0, 1360.0, 1430.0, 1510.0, 1590.0, 1670.0,
+        1740.0, 1820.0, 1910.0, 1990.0, 2070.0, 2140.0, 2230.0, 2310.0, 2675.0,
+        2745.0, 2817.0, 2894.0, 2969.0, 3041.0, 3181.0, 3255.0, 3338.0, 3413.0,
+        3718.0, 3792.0, 3872.0, 3947.0, 4353.0, 4441.0, 4658.0, 4744.0, 7610.0,
+        7770.0, 7950.0, 8130.0, 8310.0, 8480.0, 8890.0, 9070.0, 9270.0, 9450.0,
+        9970.0, 10130.0, 10300.0, 10470.0, 11730.0, 11930.0, 12320.0, 12500.0,
+        25870.0, 26300.0, 26770.0, 27210.0, 31910.0, 32500.0, 33300.0, 33722.2,
+        132911.0, 135202.0
+    )),
+    (94, 'Pu', 'Plutonium', 244.0, (
+        6.02576, 11.5, 21.1, 35.0, 49.0, 80.0, 95.0, 109.0, 124.0, 139.0,
+        159.0, 179.0, 200.0, 219.0, 258.0, 278.0, 389.0, 416.0, 444.0, 474.0,
+        503.0, 532.0, 575.0, 605.0, 637.0, 668.0, 820.0, 850.0, 890.0, 930.0,
+        1030.0, 1070.0, 1180.0, 1220.0, 1340.0, 1420.0, 1500.0, 1580.0, 1660.0,
+        1740.0, 1820.0, 1890.0, 1990.0, 2070.0, 2150.0, 2230.0, 2310.0, 2390.0,
+        2774.0, 2844.0, 2918.0, 2997.0, 3072.0, 3146.0, 3290.0, 3366.0, 3449.0,
+        3527.0, 3836.0, 3911.0, 3993.0, 4068.0, 4496.0, 4585.0, 4807.0, 4890.0,
+        7830.0, 7990.0, 8170.0, 8360.0, 8540.0, 8710.0, 9130.0, 9310.0, 9520.0,
+        9700.0, 10230.0, 10390.0, 10570.0, 10730.0, 12060.0, 12260.0, 12660.0,
+        12840.0, 26480.0, 26920.0, 27400.0, 27840.0, 32800.0, 33400.0, 34100.0,
+        34625.8, 136305.1, 138640.2
+    )),
+    (95, 'Am', 'Americium', 243.0, (
+        5.97381, 11.7, 21.7, 36.8, 50.0, 67.9, 95.0, 110.0, 125.0, 141.0,
+        163.0, 184.0, 206.0, 225.0, 242.0, 284.0, 305.0, 424.0, 451.0, 481.0,
+        511.0, 541.0, 571.0, 616.0, 646.0, 680.0, 711.0, 870.0, 900.0, 940.0,
+        980.0, 1090.0, 1130.0, 1240.0, 1280.0, 1410.0, 1490.0, 1570.0, 1650.0,
+        1730.0, 1820.0, 1900.0, 1980.0, 2070.0, 2160.0, 2240.0, 2320.0, 2410.0,
+        2480.0, 2874.0, 2946.0, 3021.0, 3101.0, 3178.0, 3251.0, 3402.0, 3479.0,
+        3563.0, 3641.0, 3956.0, 4033.0, 4115.0, 4191.0, 4642.0, 4733.0, 4960.0,
+        5050.0, 8040.0, 8210.0, 8390.0, 8590.0, 8770.0, 8950.0, 9380.0, 9560.0,
+        9770.0, 9960.0, 10490.0, 10650.0, 10830.0, 11000.0, 12400.0, 12600.0,
+        13000.0, 13190.0, 27110.0, 27550.0, 28040.0, 28500.0, 33700.0, 34300.0,
+        35100.0, 35549.4, 139769.5, 142153.5
+    )),
+    (96, 'Cm', 'Curium', 247.0, (
+        5.992241, 12.4, 20.1, 37.7, 51.0, 69.1, 97.0, 112.0, 128.0, 144.0,
+        167.0, 190.0, 213.0, 235.0, 253.0, 272.0, 311.0, 332.0, 460.0, 489.0,
+        518.0, 550.0, 580.0, 611.0, 657.0, 689.0, 723.0, 755.0, 910.0, 950.0,
+        990.0, 1030.0, 1140.0, 1180.0, 1300.0, 1340.0, 1480.0, 1560.0, 1650.0,
+        1730.0, 1810.0, 1890.0, 1980.0, 2060.0, 2160.0, 2240.0, 2320.0, 2410.0,
+        2490.0, 2580.0, 2976.0, 3050.0, 3125.0, 3207.0, 3284.0, 3360.0, 3515.0,
+        3593.0, 3679.0, 3758.0, 4078.0, 4156.0, 4239.0, 4317.0, 4791.0, 4880.0,
+        5110.0, 5200.0, 8270.0, 8440.0, 8620.0, 8820.0, 9000.0, 9180.0, 9630.0,
+        9820.0, 10020.0, 10220.0, 10760.0, 10920.0, 11100.0, 11270.0, 12740.0,
+        12950.0, 13350.0, 13550.0, 27740.0, 28180.0, 28700.0, 29100.0, 34600.0,
+        35200.0, 36000.0, 36493.0, 143311.0, 145740.1
+    )),
+    (97, 'Bk', 'Berkelium', 247.0, (
+        6.19785, 11.9, 21.6, 36.0, 56.0, 70.1, 90.0, 114.0, 130.0, 147.0,
+        171.0, 195.0, 218.0, 240.0, 259.0, 279.0, 303.0, 339.0, 361.0, 497.0,
+        526.0, 557.0, 590.0, 621.0, 652.0, 700.0, 733.0, 768.0, 800.0, 960.0,
+        1000.0, 1040.0, 1080.0, 1200.0, 1240.0, 1360.0, 1410.0, 1550.0, 1630.0,
+        1720.0, 1800.0, 1890.0, 1970.0, 2050.0, 2140.0, 2240.0, 2320.0, 2410.0,
+        2490.0, 2580.0, 2670.0, 3080.0, 3154.0, 3232.0, 3315.0, 3393.0, 3469.0,
+        3630.0, 3709.0, 3797.0, 3877.0, 4202.0, 4281.0, 4365.0, 4445.0, 4940.0,
+        5040.0, 5270.0, 5360.0, 8500.0, 8670.0, 8850.0, 9050.0, 9240.0, 9420.0,
+        9880.0, 10070.0, 10280.0, 10480.0, 11020.0, 11190.0, 11380.0, 11550.0,
+        13090.0, 13300.0, 13720.0, 13910.0, 28380.0, 28800.0, 29300.0, 29800.0,
+        35500.0, 36200.0, 37000.0, 37457.6, 146917.0, 149398.0
+    )),
+    (98, 'Cf', 'Californium', 251.0, (
+        6.281878, 12.0, 22.4, 37.7, 51.9, 75.0, 91.0, 112.9, 133.0, 152.0,
+        178.0, 201.0, 225.0, 247.0, 265.0, 286.0, 310.0, 334.0, 368.0, 390.0,
+        536.0, 566.0, 597.0, 630.0, 662.0, 695.0, 744.0, 778.0, 814.0, 847.0,
+        1010.0, 1050.0, 1090.0, 1120.0, 1250.0, 1300.0, 1420.0, 1470.0, 1620.0,
+        1700.0, 1790.0, 1880.0, 1960.0, 2050.0, 2130.0, 2220.0, 2320.0, 2410.0,
+        2490.0, 2580.0, 2670.0, 2750.0, 3186.0, 3261.0, 3340.0, 3424.0, 3503.0,
+        3581.0, 3747.0, 3828.0, 3915.0, 3998.0, 4329.0, 4407.0, 4494.0, 4570.0,
+        5100.0, 5190.0, 5430.0, 5520.0, 8730.0, 8900.0, 9090.0, 9290.0, 9480.0,
+        9660.0, 10140.0, 10330.0, 10550.0, 10740.0, 11300.0, 11470.0, 11650.0,
+        11820.0, 13450.0, 13660.0, 14080.0, 14280.0, 29000.0, 29500.0, 30000.0,
+        30500.0, 36500.0, 37100.0, 37900.0, 38443.5, 150593.0, 153124.0
+    )),
+    (99, 'Es', 'Einsteinium', 252.0, (
+        6.3684, 12.2, 22.7, 38.8, 54.1, 71.0, 97.0, 112.9, 137.0, 157.0, 180.0,
+        206.0, 231.0, 252.0, 270.0, 294.0, 317.0, 342.0, 367.0, 398.0, 421.0,
+        576.0, 606.0, 638.0, 672.0, 705.0, 738.0, 790.0, 824.0, 861.0, 895.0,
+        1060.0, 1100.0, 1140.0, 1180.0, 1310.0, 1360.0, 1480.0, 1530.0, 1690.0,
+        1780.0, 1870.0, 1950.0, 2040.0, 2130.0, 2220.0, 2300.0, 2410.0, 2490.0,
+        2580.0, 2680.0, 2760.0, 2850.0, 3294.0, 3370.0, 3449.0, 3535.0, 3616.0,
+        3694.0, 3866.0, 3947.0, 4038.0, 4120.0, 4456.0, 4537.0, 4620.0, 4700.0,
+        5260.0, 5350.0, 5600.0, 5690.0, 8960.0, 9140.0, 9330.0, 9530.0, 9720.0,
+        9910.0, 10400.0, 10590.0, 10810.0, 11010.0, 11570.0, 11740.0, 11930.0,
+        12110.0, 13810.0, 14030.0, 14460.0, 14700.0, 29700.0, 30100.0, 30700.0,
+        31100.0, 37400.0, 38100.0, 38900.0, 39451.4, 154344.0, 156927.0
+    )),
+    (100, 'Fm', 'Fermium', 257.0, (
+        6.5, 12.4, 23.2, 39.3, 55.0, 74.0, 93.0, 120.0, 136.0, 162.0, 185.0,
+        209.0, 237.0, 257.0, 276.0, 300.0, 326.0, 351.0, 377.0, 402.0, 430.0,
+        453.0, 616.0, 647.0, 680.0, 716.0, 749.0, 782.0, 837.0, 871.0, 909.0,
+        944.0, 1110.0, 1150.0, 1190.0, 1230.0, 1370.0, 1420.0, 1550.0, 1600.0,
+        1770.0, 1850.0, 1940.0, 2030.0, 2120.0, 2210.0, 2300.0, 2390.0, 2490.0,
+        2590.0, 2680.0, 2760.0, 2850.0, 2950.0, 3403.0, 3480.0, 3561.0, 3647.0,
+        3730.0, 3810.0, 3986.0, 4070.0, 4160.0, 4245.0, 4586.0, 4670.0, 4760.0,
+        4840.0, 5420.0, 5510.0, 5760.0, 5860.0, 9200.0, 9370.0, 9570.0, 9770.0,
+        9970.0, 10160.0, 10660.0, 10860.0, 11080.0, 11280.0, 11850.0, 12020.0,
+        12220.0, 12390.0, 14180.0, 14400.0, 14800.0, 15000.0, 30300.0, 30800.0,
+        31300.0, 31800.0, 38400.0, 39100.0, 40000.0, 40482.2, 158171.0,
+        160808.0
+    )),
+    (101, 'Md', 'Mendelevium', 258.0, (
+        6.58, 12.4, 24.3, 40.0, 54.1, 76.0, 96.0, 115.1, 143.9, 162.0, 187.0,
+        215.0, 240.0, 260.0, 282.0, 307.0, 334.0, 360.0, 386.0, 412.0, 438.0,
+        462.0, 486.0, 659.0, 690.0, 723.0, 760.0, 794.0, 828.0, 885.0, 920.0,
+        958.0, 994.0, 1160.0, 1210.0, 1250.0, 1290.0, 1430.0, 1480.0, 1620.0,
+        1660.0, 1840.0, 1930.0, 2020.0, 2110.0, 2200.0, 2290.0, 2390.0, 2480.0,
+        2580.0, 2680.0, 2760.0, 2860.0, 2950.0, 3050.0, 3513.0, 3592.0, 3675.0,
+        3762.0, 3845.0, 3926.0, 4109.0, 4194.0, 4286.0, 4371.0, 4720.0, 4800.0,
+        4890.0, 4970.0, 5580.0, 5680.0, 5930.0, 6030.0, 9430.0, 9620.0, 9810.0,
+        10020.0, 10220.0, 10410.0, 10930.0, 11130.0, 11350.0, 11560.0, 12130.0,
+        12310.0, 12500.0, 12680.0, 14560.0, 14800.0, 15200.0, 15400.0, 31000.0,
+        31500.0, 32000.0, 32500.0, 39500.0, 40100.0, 41000.0, 41548.0,
+        162066.0, 164764.0
+    )),
+    (102, 'No', 'Nobelium', 259.0, (
+        6.62621, 12.93, 25.8, 41.5, 60.0, 74.0, 97.0, 119.0, 140.0, 170.0,
+        187.0, 216.0, 246.0, 267.0, 285.0, 312.0, 341.0, 367.0, 394.0, 422.0,
+        448.0, 475.0, 496.0, 520.0, 701.0, 734.0, 768.0, 805.0, 840.0, 875.0,
+        934.0, 969.0, 1010.0, 1045.0, 1220.0, 1260.0, 1300.0, 1350.0, 1500.0,
+        1550.0, 1680.0, 1730.0, 1920.0, 2010.0, 2110.0, 2200.0, 2290.0, 2380.0,
+        2470.0, 2570.0, 2680.0, 2760.0, 2860.0, 2950.0, 3050.0, 3140.0, 3627.0,
+        3705.0, 3790.0, 3878.0, 3962.0, 4045.0, 4234.0, 4320.0, 4413.0, 4500.0,
+        4850.0, 4930.0, 5030.0, 5110.0, 5750.0, 5850.0, 6110.0, 6210.0, 9680.0,
+        9860.0, 10060.0, 10270.0, 10470.0, 10660.0, 11200.0, 11410.0, 11630.0,
+        11840.0, 12420.0, 12600.0, 12800.0, 12980.0, 15000.0, 15200.0, 15600.0,
+        15800.0, 31700.0, 32200.0, 32700.0, 33200.0, 40500.0, 41200.0, 42100.0,
+        42632.0, 166050.0, 168804.0
+    )),
+    (103, 'Lr', 'Lawrencium', 262.0, (
+        4.96, 14.54, 21.8, 43.6, 56.0, 80.0, 96.0, 121.0, 143.0, 165.0, 197.0,
+        216.0, 244.0, 269.0, 290.0, 322.0, 344.0, 374.0, 403.0, 431.0, 459.0,
+        487.0, 510.0, 540.0, 560.0, 745.0, 779.0, 814.0, 852.0, 888.0, 922.0,
+        985.0, 1020.0, 1061.0, 1098.0, 1280.0, 1320.0, 1360.0, 1410.0, 1570.0,
+        1620.0, 1760.0, 1810.0, 2010.0, 2100.0, 2190.0, 2290.0, 2380.0, 2470.0,
+        2570.0, 2670.0, 2780.0, 2860.0, 2960.0, 3060.0, 3150.0, 3250.0, 3741.0,
+        3821.0, 3906.0, 3996.0, 4082.0, 4165.0, 4360.0, 4448.0, 4540.0, 4630.0,
+        4990.0, 5070.0, 5160.0, 5250.0, 5920.0, 6030.0, 6290.0, 6390.0, 9920.0,
+        10110.0, 10310.0, 10520.0, 10720.0, 10920.0, 11470.0, 11680.0, 11910.0,
+        12120.0, 12710.0, 12890.0, 13090.0, 13300.0, 15300.0, 15600.0, 16000.0,
+        16200.0, 32400.0, 32900.0, 33400.0, 33900.0, 41600.0, 42300.0, 43200.0,
+        43759.0, 170116.0, 172928.0
+    )),
+    (104, 'Rf', 'Rutherfordium', 267.0, (
+        6.02, 14.35, 23.84, 31.87, 64.0, 77.0, 102.0, 119.0, 146.1, 169.0,
+        193.0, 225.0, 244.0, 275.0
+    )),
+    (105, 'Db', 'Dubnium', 268.0, (
+        6.8, 14.0, 23.1, 33.0, 43.0, 86.0, 98.9, 126.0, 145.1, 172.0, 196.0,
+        220.9, 254.0, 274.0, 307.0
+    )),
+    (106, 'Sg', 'Seaborgium', 271.0, (
+        7.8, 17.1, 25.8, 35.5, 47.2, 59.3, 109.0, 122.0, 152.0, 170.0, 200.0,
+        224.0, 251.0, 285.0, 306.0, 339.0
+    )),
+    (107, 'Bh', 'Bohrium', 274.0, (
+        7.7, 17.5, 26.7, 37.3, 49.0, 62.1, 74.9, 134.0, 148.0, 178.0, 198.0,
+        228.0, 255.0, 281.0, 318.0, 337.0, 374.0
+    )),
+    (108, 'Hs', 'Hassium', 269.0, (
+        7.6, 18.2, 29.3, 37.7, 51.2, 64.0, 78.1, 91.7, 159.9, 173.9, 206.1,
+        227.0, 258.0, 285.0, 314.0, 351.0, 371.0, 409.0
+    )),
+    (109, 'Mt', 'Meitnerium', 276.0, ()),
+    (110, 'Ds', 'Darmstadtium', 281.0, ()),
+    (111, 'Rg', 'Roentgenium', 281.0, ()),
+    (112, 'Cn', 'Copernicium', 285.0, ()),
+    (113, 'Nh', 'Nihonium', 286.0, ()),
+    (114, 'Fl', 'Flerovium', 289.0, ()),
+    (115, 'Mc', 'Moscovium', 288.0, ()),
+    (116, 'Lv', 'Livermorium', 293.0, ()),
+    (117, 'Ts', 'Tennessine', 294.0, ()),
+    (118, 'Og', 'Oganesson', 294.0, ()),
+)
+
+# Lookup index by lower-case name, symbol and atomic number
+_index = {}
+for _entry in _table:
+    _index[_entry[0]] = _entry
+    _index[_entry[1].lower()] = _entry
+    _index[_entry[2].lower()] = _entry
+
+def GetElement( element ):
+    """
+    Returns the dictionary with `name`, `symbol`, `atomic_number`,
+    `mass` (in atomic mass units) and `ionization_energies`
+    (list, in eV) of the element
+
+    Parameters
+    ----------
+    element : string or integer
+        Name or symbol of the element, or its atomic number
+    """
+    key = element.lower() if type(element) == str else element
+
+    if key in _index:
+        Z, symbol, name, mass, ionization_energies = _index[key]
+    else:
+        # fall back to the full database for the unknown entries
+        try:
+            from mendeleev import element as table_element
+        except ImportError:
+            raise ValueError(f'Element {element} is not found')
+
+        el = table_element(element)
+        Z, symbol, name, mass = el.atomic_number, el.symbol, el.name, el.mass
+        ionization_energies = tuple( el.ionenergies[k]
+                                     for k in sorted(el.ionenergies) )
+
+    return { 'name': name, 'symbol': symbol, 'atomic_number': Z,
+             'mass': mass, 'ionization_energies': list(ionization_energies) }
@@ -0,0 +1,523 @@
+"""
+Translation of the C++ density formulas (used by the 'FormulaXY' and
+'FormulaXYZ' density profiles) into Python syntax trees. Only simple
+assignments with arithmetic, comparisons and math functions are accepted,
+and the trees are validated before evaluation, so that no arbitrary
+code can be executed.
+"""
+import ast
+import copy
+import re
+
+# C++ math functions and their NumPy equivalents
+functions = { 'exp': 'exp', 'log': 'log', 'log10': 'log10',
+              'sqrt': 'sqrt', 'cbrt': 'cbrt', 'pow': 'power',
+              'sin': 'sin', 'cos': 'cos', 'tan': 'tan',
+              'asin': 'arcsin', 'acos': 'arccos', 'atan': 'arctan',
+              'atan2': 'arctan2', 'sinh': 'sinh', 'cosh': 'cosh',
+              'tanh': 'tanh', 'abs': 'abs', 'fabs': 'abs',
+              'floor': 'floor', 'ceil': 'ceil',
+              'fmin': 'minimum', 'min': 'minimum',
+              'fmax': 'maximum', 'max': 'maximum' }
+
+# Named constants
+constants = { 'PI': 3.141592653589793 }
+
+# Name of the identity function which replaces the C++ casts
+_cast = '_cast'
+
+_declaration_types = r'(?:float_64|float_X|float_32|double|float|auto)'
+
+_allowed_nodes = ( ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare,
+                   ast.Call, ast.Name, ast.Load, ast.Constant,
+                   ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod,
+                   ast.USub, ast.UAdd, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+                   ast.Eq, ast.NotEq )
+
+def _strip_comments( text ):
+    """
+    Removes C++ comments from the text
+    """
+    text = re.sub(r'/\*.*?\*/', ' ', text, flags=re.DOTALL)
+    return re.sub(r'//[^\n]*', ' ', text)
+
+def CppToPython( expr ):
+    """
+    Converts C++ expression into Python syntax: removes the namespaces
+    of math functions, casts and literal suffixes
+    """
+    expr = expr.strip()
+
+    # math namespaces
+    expr = re.sub( r'\b(?:pmacc\s*::\s*|algorithms\s*::\s*)*' \
+                   r'(?:math|std)\s*::\s*', '', expr )
+
+    # casts are replaced by identity function
+    expr = re.sub( r'\b(?:static_cast|precisionCast)\s*<\s*\w+\s*>\s*\(',
+                   _cast + '(', expr )
+    expr = re.sub( r'\b(?:float_64|float_X|float_32|double|float)\s*\(',
+                   _cast + '(', expr )
+
+    # numeric literal suffixes, e.g. 1.0f, 2._X, 3u
+    expr = re.sub( r'(?<![\w.])((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)' \
+                   r'(?:_X|[fFuUlL]+)(?!\w)', r'\1', expr )
+    # trailing dot literals, e.g. 2.
+    expr = re.sub(r'(\d)\.(?![\d\w])', r'\1.0', expr)
+
+    if '&&' in expr or '||' in expr or '?' in expr:
+        raise ValueError( 'Logical operators and conditional expressions '
+                          f'are not supported in formula: {expr}' )
+
+    return expr
+
+def _validate( tree, names ):
+    """
+    Checks that the syntax tree contains only the allowed operations,
+    and only known functions and variables
+    """
+    for node in ast.walk(tree):
+        if not isinstance(node, _allowed_nodes):
+            raise ValueError( 'Unsupported construct in formula: '
+                              f'{type(node).__name__}' )
+
+        if isinstance(node, ast.Constant) and \
+          type(node.value) not in (int, float):
+            raise ValueError(f'Unsupported constant in formula: {node.value}')
+
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.keywords or \
+              (node.func.id not in functions and node.func.id != _cast):
+                raise ValueError( 'Unsupported function in formula: '
+                                  f'{ast.unparse(node.func)}' )
+            if node.func.id == _cast and len(node.args) != 1:
+                raise ValueError('Cast takes one argument')
+
+        if isinstance(node, ast.Name) and node.id not in names and \
+          node.id not in functions and node.id not in constants and \
+          node.id != _cast:
+            raise ValueError(f'Unknown variable in formula: {node.id}')
+
+def _is_integer( node ):
+    return isinstance(node, ast.Constant) and type(node.value) == int
+
+class _IntegerArithmetic( ast.NodeTransformer ):
+    """
+    Evaluates the arithmetic of the integer literals with the rules of
+    C++, in which `/` truncates towards zero (`1/2` is 0) and `%` has the
+    sign of the dividend, so that the evaluation of the formula in Python
+    matches the compiled one
+    """
+    def visit_UnaryOp( self, node ):
+        self.generic_visit(node)
+        if _is_integer(node.operand):
+            sign = -1 if isinstance(node.op, ast.USub) else 1
+            return ast.Constant(value=sign * node.operand.value)
+        return node
+
+    def visit_BinOp( self, node ):
+        self.generic_visit(node)
+        if not ( _is_integer(node.left) and _is_integer(node.right) ) or \
+          isinstance(node.op, ast.Pow):
+            return node
+
+        left, right = node.left.value, node.right.value
+        if isinstance(node.op, (ast.Div, ast.Mod)) and right == 0:
+            raise ValueError('Integer division by zero in formula')
+
+        if isinstance(node.op, ast.Add):
+            value = left + right
+        elif isinstance(node.op, ast.Sub):
+            value = left - right
+        elif isinstance(node.op, ast.Mult):
+            value = left * right
+        else:
+            quotient = abs(left) // abs(right)
+            if (left < 0) != (right < 0):
+                quotient = -quotient
+            if isinstance(node.op, ast.Div):
+                value = quotient
+            else:
+                value = left - right * quotient
+
+        return ast.Constant(value=value)
+
+def ParseFormula( text, variables=('x', 'y', 'z') ):
+    """
+    Parses the C++ formula body into a list of statements
+    (target, operator, tree), where operator is one of '=', '+=',
+    '-=', '*=' or '/=', and tree is a validated `ast.Expression`.
+
+    The formula may declare local variables, e.g.
+    `const float_64 r2 = x*x + z*z;`, and should assign the
+    density to the variable `dens`. The operations on the integer
+    literals are evaluated as in C++ (e.g. `1/2` is 0)
+    """
+    names = set(variables) | {'dens'}
+    statements = []
+
+    for statement in _strip_comments(text).split(';'):
+        statement = ' '.join(statement.split())
+        if statement == '':
+            continue
+
+        if '{' in statement or '}' in statement or \
+          re.match(r'(if|else|for|while|return)\b', statement):
+            raise ValueError( 'Only assignments are supported in '
+                              f'formula: {statement}' )
+
+        # declaration with constructor syntax, e.g. `const float_64 a( b )`
+        match = re.match( r'(?:const\s+)?' + _declaration_types + \
+                          r'\s+([A-Za-z_]\w*)\s*\((.*)\)$', statement )
+        if match:
+            target, op, expr = match.group(1), '=', match.group(2)
+        else:
+            match = re.match( r'(?:(?:const\s+)?' + _declaration_types + \
+                              r'\s+)?([A-Za-z_]\w*)\s*([+\-*/]?=)(?!=)\s*(.*)$',
+                              statement )
+            if match is None:
+                raise ValueError(f'Cannot parse formula statement: {statement}')
+            target, op, expr = match.groups()
+
+        if target in variables or target in functions or target in constants:
+            raise ValueError(f'Cannot assign to {target} in formula')
+
+        if op != '=' and target not in names:
+            raise ValueError(f'Variable {target} is used before assignment')
+
+        try:
+            tree = ast.parse(CppToPython(expr), mode='eval')
+        except SyntaxError:
+            raise ValueError(f'Cannot parse formula expression: {expr}')
+
+        _validate(tree, names)
+        tree = ast.fix_missing_locations( _IntegerArithmetic().visit(tree) )
+
+        if re.match(r'(?:const\s+)?auto\b', statement) and \
+          _is_integer(tree.body):
+            raise ValueError( 'Integer `auto` variables are not supported '
+                              f'in formula: {statement}' )
+
+        names.add(target)
+        statements.append( (target, op, tree) )
+
+    return statements
+
+def UsedVariables( statements ):
+    """
+    Returns the set of the names used in the expressions
+    of the parsed formula
+    """
+    used = set()
+    for target, op, tree in statements:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and node.id not in functions \
+              and node.id not in constants and node.id != _cast:
+                used.add(node.id)
+        if op != '=':
+            used.add(target)
+
+    return used
+
+def FormulaFunction( text, variables=('x', 'y', 'z'), dtype=None,
+                     statements=None ):
+    """
+    Returns the function, which evaluates the formula with NumPy.
+    The function takes the `variables` as keyword arguments (scalars or
+    arrays broadcastable to each other) and returns `dens`, with negative
+    values set to zero (as in the density codelets)
+
+    If `dtype` is given (e.g. `numpy.float32`), the coordinates and
+    constants are converted to it, to emulate the evaluation precision.
+    If `statements` (given by `ParseFormula`) are given, the `text`
+    is not parsed
+    """
+    import numpy as np
+
+    if statements is None:
+        statements = ParseFormula(text, variables)
+    codes = [ (target, op, compile(tree, '<formula>', 'eval'))
+              for target, op, tree in statements ]
+
+    if dtype is None:
+        cast = lambda value: value
+    else:
+        cast = lambda value: np.asarray(value, dtype=dtype)
+
+    namespace = { name: getattr(np, functions[name]) for name in functions }
+    namespace.update( { name: cast(constants[name]) for name in constants } )
+    namespace[_cast] = lambda value: value
+    namespace['__builtins__'] = {}
+
+    def formula( **coordinates ):
+        local = { name: cast(coordinates[name]) for name in variables }
+        shape = np.broadcast(*[local[name] for name in variables]).shape
+        local['dens'] = np.zeros(shape, dtype=dtype or np.float64)
+
+        with np.errstate(all='ignore'):
+            for target, op, code in codes:
+                value = eval(code, namespace, local)
+                if op == '=':
+                    local[target] = value
+                elif op == '+=':
+                    local[target] = local[target] + value
+                elif op == '-=':
+                    local[target] = local[target] - value
+                elif op == '*=':
+                    local[target] = local[target] * value
+                elif op == '/=':
+                    local[target] = local[target] / value
+
+        dens = np.broadcast_to(local['dens'], shape)
+        return np.where(dens >= 0.0, dens, 0.0)
+
+    return formula
+
+def _numpy_namespace():
+    """
+    Returns the namespace of the NumPy functions for evaluation
+    """
+    import numpy as np
+
+    namespace = { name: getattr(np, functions[name]) for name in functions }
+    namespace[_cast] = lambda value: value
+    namespace['__builtins__'] = {}
+    return namespace
+
+class _ConstantFolder( ast.NodeTransformer ):
+    """
+    Replaces the constant subexpressions by their values. The chains of
+    products and divisions are reordered to collect the constant factors
+    """
+    def __init__( self, known=None ):
+        self.namespace = _numpy_namespace()
+        self.known = known or {}
+
+    def _evaluate( self, node ):
+        code = compile( ast.fix_missing_locations(ast.Expression(body=node)),
+                        '<formula>', 'eval' )
+        import numpy as np
+
+        with np.errstate(all='ignore'):
+            value = float( eval(code, self.namespace) )
+
+        if value != value or value in (float('inf'), -float('inf')):
+            return node
+        return ast.Constant(value=value)
+
+    def _factors( self, node, inverse=False ):
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+            return self._factors(node.left, inverse) \
+                + self._factors(node.right, inverse)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+            return self._factors(node.left, inverse) \
+                + self._factors(node.right, not inverse)
+        return [ (node, inverse), ]
+
+    def visit_Name( self, node ):
+        if node.id in constants:
+            return ast.Constant(value=constants[node.id])
+        if node.id in self.known:
+            return ast.Constant(value=self.known[node.id])
+        return node
+
+    def visit_UnaryOp( self, node ):
+        self.generic_visit(node)
+        if isinstance(node.operand, ast.Constant):
+            return self._evaluate(node)
+        return node
+
+    def visit_Compare( self, node ):
+        self.generic_visit(node)
+        if isinstance(node.left, ast.Constant) and \
+          all( isinstance(item, ast.Constant) for item in node.comparators ):
+            return self._evaluate(node)
+        return node
+
+    def visit_Call( self, node ):
+        self.generic_visit(node)
+        if node.func.id == _cast:
+            return node.args[0]
+        if all( isinstance(arg, ast.Constant) for arg in node.args ):
+            return self._evaluate(node)
+        return node
+
+    def visit_BinOp( self, node ):
+        self.generic_visit(node)
+
+        if isinstance(node.left, ast.Constant) and \
+          isinstance(node.right, ast.Constant):
+            return self._evaluate(node)
+
+        if not isinstance(node.op, (ast.Mult, ast.Div)):
+            return node
+
+        factors = self._factors(node)
+        value = 1.0
+        numerators, denominators = [], []
+        for factor, inverse in factors:
+            if isinstance(factor, ast.Constant) and factor.value != 0:
+                value = value / factor.value if inverse \
+                    else value * factor.value
+            elif inverse:
+                denominators.append(factor)
+            else:
+                numerators.append(factor)
+
+        if len(numerators) + len(denominators) == len(factors):
+            return node
+
+        result = None
+        if value != 1.0 or len(numerators) == 0:
+            result = ast.Constant(value=value)
+        for factor in numerators:
+            result = factor if result is None \
+                else ast.BinOp(left=result, op=ast.Mult(), right=factor)
+        for factor in denominators:
+            result = ast.BinOp(left=result, op=ast.Div(), right=factor)
+
+        return result
+
+def FoldConstants( statements ):
+    """
+    Returns the copy of the parsed formula (given by `ParseFormula`),
+    in which the constant subexpressions are evaluated in double precision
+    and the named constants and casts are replaced. The local variables
+    assigned once with a constant value are substituted
+    """
+    assignments = {}
+    for target, op, tree in statements:
+        assignments[target] = assignments.get(target, 0) + 1
+
+    known = {}
+    folded = []
+    for target, op, tree in statements:
+        tree = _ConstantFolder(known).visit( copy.deepcopy(tree) )
+        tree = ast.fix_missing_locations(tree)
+
+        if target != 'dens' and assignments[target] == 1 and \
+          isinstance(tree.body, ast.Constant):
+            known[target] = tree.body.value
+            continue
+
+        folded.append( (target, op, tree) )
+
+    return folded
+
+# C++ names of the math functions
+_cpp_functions = { 'fabs': 'abs', 'fmin': 'min', 'fmax': 'max' }
+
+_cpp_operators = { ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/',
+                   ast.Mod: '%', ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>',
+                   ast.GtE: '>=', ast.Eq: '==', ast.NotEq: '!=' }
+
+def _cpp_literal( value, float_type ):
+    """
+    Returns the floating point literal of `value` in C++
+    """
+    text = repr( float(value) )
+    if float_type == 'float_64':
+        return text
+    return f'{float_type}({text})'
+
+def _cpp_expression( node, float_type ):
+    """
+    Returns the C++ code of the expression tree, where all
+    values are of `float_type`
+    """
+    if isinstance(node, ast.Expression):
+        return _cpp_expression(node.body, float_type)
+
+    if isinstance(node, ast.Constant):
+        return _cpp_literal(node.value, float_type)
+
+    if isinstance(node, ast.Name):
+        if node.id in constants:
+            return _cpp_literal(constants[node.id], float_type)
+        return node.id
+
+    if isinstance(node, ast.UnaryOp):
+        sign = { ast.USub: '-', ast.UAdd: '+' }[type(node.op)]
+        return f'({sign}{_cpp_expression(node.operand, float_type)})'
+
+    if isinstance(node, ast.BinOp):
+        left = _cpp_expression(node.left, float_type)
+        right = _cpp_expression(node.right, float_type)
+        if isinstance(node.op, ast.Pow):
+            return f'math::pow({left}, {right})'
+        return f'({left} {_cpp_operators[type(node.op)]} {right})'
+
+    if isinstance(node, ast.Compare):
+        if len(node.ops) != 1:
+            raise ValueError('Chained comparisons are not supported')
+        left = _cpp_expression(node.left, float_type)
+        right = _cpp_expression(node.comparators[0], float_type)
+        return f'{float_type}({left} {_cpp_operators[type(node.ops[0])]}' \
+            + f' {right})'
+
+    if isinstance(node, ast.Call):
+        args = ', '.join( [ _cpp_expression(arg, float_type)
+                            for arg in node.args ] )
+        if node.func.id == _cast:
+            return f'{float_type}({args})'
+        name = _cpp_functions.get(node.func.id, node.func.id)
+        return f'math::{name}({args})'
+
+    raise ValueError( 'Unsupported construct in formula: '
+                      f'{type(node).__name__}' )
+
+def FormulaToCpp( statements, float_type='float_64', indent=12 ):
+    """
+    Returns the C++ code of the parsed formula (given by `ParseFormula`
+    or `FoldConstants`), with the local variables declared as `float_type`
+    (`const` if they are assigned once)
+    """
+    assignments = {}
+    for target, op, tree in statements:
+        assignments[target] = assignments.get(target, 0) + 1
+
+    lines = []
+    declared = {'dens'}
+    for target, op, tree in statements:
+        expr = _cpp_expression(tree, float_type)
+        if target in declared:
+            lines.append(f'{target} {op} {expr};')
+        elif assignments[target] == 1:
+            lines.append(f'const {float_type} {target} = {expr};')
+        else:
+            lines.append(f'{float_type} {target} = {expr};')
+        declared.add(target)
+
+    return '\n'.join( [ ' ' * indent + line for line in lines ] )
+
+def FormulaPrecision( statements, coordinates, dtype=None,
+                      reference_statements=None ):
+    """
+    Returns the maximal error of the formula (given by `FoldConstants`)
+    evaluated with `dtype` (by default `numpy.float32`) relative to the
+    maximal value of the reference evaluation in double precision of
+    `reference_statements` (by default the same formula).
+    `coordinates` is the dictionary of the coordinate arrays
+    """
+    import numpy as np
+
+    if dtype is None:
+        dtype = np.float32
+
+    variables = tuple( coordinates.keys() )
+    if reference_statements is None:
+        reference_statements = statements
+
+    reference = FormulaFunction( None, variables, None,
+                                 reference_statements )
+    emulated = FormulaFunction( None, variables, dtype, statements )
+
+    value_ref = reference(**coordinates)
+    value = emulated(**coordinates).astype(np.float64)
+
+    scale = np.max( np.abs(value_ref) )
+    if not np.isfinite(scale):
+        return np.inf
+    if scale == 0:
+        return float( np.max(np.abs(value)) )
+
+    return float( np.max(np.abs(value - value_ref)) / scale )
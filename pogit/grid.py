@@ -1,6 +1,9 @@
-from mako.template import Template
-from scipy.constants import c
-import numpy as np
+from .constants import c
+from .decomposition import OptimizeDecomposition, ValidateSuperCell
+from .decomposition import default_supercells
+from .precision import PrecisionParams, FloatBytes, GridWarnings
+import numbers
+import math
 
 class GridSolver:
     """
@@ -12,6 +15,8 @@ class GridSolver:
             include/picongpu/param/grid.param
             include/picongpu/param/dimension.param
             include/picongpu/param/fieldSolver.param
+            include/picongpu/param/memory.param
+            include/picongpu/param/precision.param
             etc/picongpu/run.cfg
     Notes
     -----
@@ -24,7 +29,9 @@ class GridSolver:
                   Nsteps, decomposition, dim='3d',
                   dt_fromCFL=0.995, dt=None, absorber=None,
                   solver_scheme='Yee', J_smoothing=None,
-                  movingWindow=False, movePoint=1.0, wallTime=120.
+                  movingWindow=False, movePoint=1.0, wallTime=120.,
+                  device_memory=None, bytes_per_cell=None,
+                  precision='single', super_cell=None
                 ):
         """
         Initialize the GridSolver object
@@ -39,8 +46,11 @@ class GridSolver:
         Nsteps : integer
             Number of simulation steps to perform
 
-        decomposition: tuple (three integers)
-            Number of devices used in x, y and z directions
+        decomposition: tuple (three integers) or integer
+            Number of devices used in x, y and z directions. If integer,
+            it is the total number of devices, and the decomposition with
+            the least padding and halo overhead is selected (see
+            `pogit.decomposition.OptimizeDecomposition`)
 
         dim : string
             Dimensionality of the simulation. Can be '3d' or '2d'
@@ -81,27 +91,61 @@ class GridSolver:
         wallTime : float
             Wall time for the simulation in minutes passed to the submission
             system in `run.cfg`
+
+        device_memory : float (in bytes)
+            Memory of each device used to reject the automatic
+            decompositions (needs `bytes_per_cell`)
+
+        bytes_per_cell : float (in bytes)
+            Estimated memory used per cell for automatic decomposition
+
+        precision : string
+            Precision of `float_X` written to `precision.param`. Can be:
+                "single": 32 bit (default of PIConGPU)
+                "double": 64 bit
+                "mixed": 32 bit with the square roots, exponents and
+                  trigonometric functions in 64 bit
+            For "single" and "mixed", the parameters of the other objects
+            can be checked with `pogit.precision.PrecisionWarnings`
+
+        super_cell : tuple (three integers)
+            Size of the supercell. Default is (8, 8, 4) in 3D and
+            (16, 16, 1) in 2D. Its volume should not exceed 1024 cells, and
+            should be a multiple of 32 for the efficient use of GPUs
+            (see `pogit.autotune.TuneSuperCell` to select it)
         """
         params = {}
 
         params['simDim'] = dim[0]
+        params.update( PrecisionParams(precision) )
+
+        if super_cell is None:
+            SuperCell = default_supercells[dim]
+        else:
+            SuperCell = ValidateSuperCell(super_cell, dim)
+            if math.prod(SuperCell) % 32:
+                print( f"*** SuperCell {SuperCell} volume is not a multiple",
+                       "of 32, some GPU threads are idle" )
+
+        params['SuperCellSize'] = ', '\
+            .join([str(s) for s in SuperCell[:int(dim[0])]])
+
+        # the device count may be a NumPy integer, e.g. from a scan grid
+        if isinstance(decomposition, numbers.Integral):
+            self.decomposition_candidates = OptimizeDecomposition(
+                Nx, Ny, Nz, int(decomposition), dim=dim, SuperCell=SuperCell,
+                movingWindow=movingWindow, device_memory=device_memory,
+                bytes_per_cell=bytes_per_cell )
+            decomposition = self.decomposition_candidates[0]['decomposition']
+            print(f"*** SELECTED DECOMPOSITION {decomposition}")
 
         params['nGPUx'] = decomposition[0]
         params['nGPUy'] = decomposition[1]
         params['nGPUz'] = decomposition[2]
 
-        if dim=='3d':
-            SuperCell = (8, 8, 4)
-            params['SuperCellSize'] = ', '.join([str(s) for s in SuperCell])
-
-        elif dim=='2d':
-            SuperCell = (16, 16, 1)
-            params['SuperCellSize'] = ', '\
-                .join([str(s) for s in SuperCell[:2]])
-
-        Nx = np.ceil( 1.*Nx / decomposition[0] / SuperCell[0] ) * \
+        Nx = math.ceil( 1.*Nx / decomposition[0] / SuperCell[0] ) * \
                               decomposition[0] * SuperCell[0]
-        Nz = np.ceil( 1.*Nz / decomposition[2] / SuperCell[2] ) * \
+        Nz = math.ceil( 1.*Nz / decomposition[2] / SuperCell[2] ) * \
                               decomposition[2] * SuperCell[2]
         dx = xmax/Nx
         dz = zmax/Nz
@@ -115,7 +159,7 @@ class GridSolver:
                 raise ValueError("Add extra GPU along Y for movingWindow")
             Ny_loc = Ny/(nGPUy-1.)
             Ly_loc = ymax/(nGPUy-1.)
-            Ny_loc = np.int(np.ceil(Ny_loc/SuperCell[1]) * SuperCell[1])
+            Ny_loc = int(math.ceil(Ny_loc/SuperCell[1]) * SuperCell[1])
             dy = Ly_loc/Ny_loc
             Ny = Ny_loc * nGPUy
             ymax = Ly_loc * nGPUy
@@ -123,15 +167,15 @@ class GridSolver:
                 f"to {ymax:.2e} ({Ny} cells)" )
         else:
             params['movingWindow'] =  ""
-            Ny = np.ceil( 1.*Ny / decomposition[1] / SuperCell[1] ) * \
+            Ny = math.ceil( 1.*Ny / decomposition[1] / SuperCell[1] ) * \
                                   decomposition[1] * SuperCell[1]
             dy = ymax/Ny
 
         params['movePoint'] = movePoint
 
-        params['Nx'] = np.int(Nx)
-        params['Ny'] = np.int(Ny)
-        params['Nz'] = np.int(Nz)
+        params['Nx'] = int(Nx)
+        params['Ny'] = int(Ny)
+        params['Nz'] = int(Nz)
         params['Nsteps'] = Nsteps
         params['CELL_WIDTH_SI'] = dx
         params['CELL_HEIGHT_SI'] = dy
@@ -184,6 +228,22 @@ class GridSolver:
         params['wallTimeM'] = str(wallM).zfill(2)
         params['wallTimeS'] = str(wallS).zfill(2)
 
+        # Keep the numerical parameters (used by the estimators)
+        self.dim = dim
+        self.decomposition = tuple(decomposition)
+        self.SuperCell = SuperCell
+        self.N = (params['Nx'], params['Ny'], params['Nz'])
+        self.cell_size = (dx, dy, dz)
+        self.dt = params['DELTA_T_SI']
+        self.Nsteps = Nsteps
+        self.movingWindow = movingWindow
+        self.precision = precision
+        self.float_bytes = FloatBytes(precision)
+
+        if precision != 'double':
+            for warning in GridWarnings(self):
+                print(f'*** WARNING ({precision} precision): {warning}')
+
         # Converting float and integer arguments to strings
         for arg in params.keys():
             if type(params[arg]) == float:
@@ -212,10 +272,15 @@ class GridSolver:
         template_memory['filename'] = 'memory.template'
         template_memory['Main'] = params
 
+        # Precision template
+        template_precision = {}
+        template_precision['filename'] = 'precision.template'
+        template_precision['Main'] = params
+
         # Run script template
         template_run = {}
         template_run['filename'] = 'run.template'
         template_run['Main'] = params
 
         self.templates = [ template_grid, template_dim, template_solver,
-                           template_memory, template_run ]
+                           template_memory, template_precision, template_run ]
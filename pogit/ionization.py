@@ -0,0 +1,108 @@
+"""
+Ionization models of the ion species. The ionizers of PIConGPU are
+selected per species, and the charge states reachable by the field of
+a laser are estimated with the barrier suppression ionization (BSI)
+threshold, so that the species, which cannot be ionized further, are
+created without the (expensive) ionizers.
+"""
+import math
+
+from .constants import c, e, m_e, epsilon_0
+from .elements import GetElement
+
+# ionizers of PIConGPU (`${pol}` is the polarization, 'Lin' or 'Circ')
+ionizer_models = { 'BSI': 'BSI',
+                   'BSIEffectiveZ': 'BSIEffectiveZ',
+                   'BSIStarkShifted': 'BSIStarkShifted',
+                   'ADK': 'ADK${pol}Pol',
+                   'Keldysh': 'Keldysh',
+                   'ThomasFermi': 'ThomasFermi' }
+
+# ionizers driven by the electric field (the others are collisional)
+field_ionizers = ( 'BSI', 'BSIEffectiveZ', 'BSIStarkShifted', 'ADK',
+                   'Keldysh' )
+
+default_ionizers = ( 'BSIEffectiveZ', 'ADK' )
+
+# the tunnel ionization is counted from this fraction of the BSI field
+tunnel_margin = 0.5
+
+def ValidateIonizers( ionizers ):
+    """
+    Returns the list of the ionizer names, checked for `ionizer_models`
+    (None gives `default_ionizers`)
+    """
+    if ionizers is None:
+        return list(default_ionizers)
+
+    if type(ionizers) == str:
+        ionizers = [ionizers, ]
+
+    for name in ionizers:
+        if name not in ionizer_models:
+            raise ValueError( f'Unknown ionizer {name}, '
+                              f'use {tuple(ionizer_models)}' )
+
+    return list(dict.fromkeys(ionizers))
+
+def IonizersCode( ionizers, target_name, pol='Lin' ):
+    """
+    Returns the C++ list of the ionizers for `MakeSeq_t`
+    """
+    return ',\n'.join( [ '            particles::ionization::'
+                         + ionizer_models[name].replace('${pol}', pol)
+                         + f'< PIC_{target_name} >' for name in ionizers ] )
+
+def LaserField( a0, wavelength=0.8e-6, pol='x' ):
+    """
+    Returns the peak electric field of the laser (in V/m), for the
+    circular polarization the amplitude is shared by two components
+    """
+    field = a0 * m_e * c * 2 * math.pi * c / ( e * wavelength )
+    if pol == 'circ':
+        field /= math.sqrt(2)
+    return field
+
+def BSIField( ionization_energy, charge ):
+    """
+    Returns the BSI threshold field (in V/m) to create the ion with the
+    `charge` from the one with `charge - 1`, whose ionization energy
+    is given in eV
+    """
+    return math.pi * epsilon_0 * ionization_energy**2 / ( e * charge )
+
+def ChargeStates( element, field ):
+    """
+    Returns the list of (charge, ionization energy in eV, BSI threshold
+    field in V/m, reachable) of the charge states of the `element`
+    for the peak electric `field` (in V/m)
+    """
+    energies = GetElement(element)['ionization_energies']
+
+    states = []
+    for index, energy in enumerate(energies):
+        threshold = BSIField(energy, index + 1)
+        states.append( (index + 1, energy, threshold, threshold <= field) )
+    return states
+
+def ReachableCharge( element, field, initial_charge=0 ):
+    """
+    Returns the highest charge state of the `element` reachable in the
+    peak electric `field` (in V/m) by the successive BSI from
+    `initial_charge`
+    """
+    charge = initial_charge
+    for state, energy, threshold, reachable in ChargeStates(element, field):
+        if state == charge + 1 and reachable:
+            charge = state
+    return charge
+
+def LaserReachableCharge( laser, element, initial_charge=0,
+                          margin=tunnel_margin ):
+    """
+    Returns the highest charge state of the `element` reachable in the
+    peak field of the Laser object, with the tunnel ionization counted
+    for the BSI thresholds up to the field divided by `margin`
+    """
+    field = LaserField(laser.a0, laser.wavelength, laser.pol)
+    return ReachableCharge(element, field / margin, initial_charge)
@@ -1,11 +1,65 @@
-from mako.template import Template
-import numpy as np
-from scipy.constants import c
+import math
+import textwrap
+
+from .templating import GetTemplate
+from .constants import c, e, m_e, mu_0
+from .precision import LaserWarnings
 
 from .codelets.laser import LaserProfile
 from .codelets.fieldBackground import LaserAntenna
 from .codelets.fieldBackground import r2_2d, r2_3d
 from .codelets.fieldBackground import laser_profile_2d, laser_profile_3d
+from .codelets.fieldBackground import LaserAntennaHoisted
+from .codelets.fieldBackground import r2_norm_2d, r2_norm_3d
+from .codelets.fieldBackground import AntennaGroup, AntennaGroupPhase
+from .codelets.fieldBackground import AntennaGroupPlane, AntennaGroupSource
+from .codelets.fieldBackground import AntennaGroupCurrent
+from .codelets.fieldBackground import AntennaGroupCenter_2d
+from .codelets.fieldBackground import AntennaGroupCenter_3d
+
+def AntennaConstants( a0, ctau, waist, cdelay, iy_antenna, y_foc, CEP,
+                      wavelength, dim, cell_size, dt ):
+    """
+    Returns the dictionary of the step- and cell-independent values of
+    the Gaussian antenna, which are evaluated in PIConGPU per cell and step
+    otherwise. The transverse distance is normalized to the squared
+    waist at the antenna plane `w2`, so that the values are of order one
+    and can be used in single precision:
+        'amplitude' : peak current density (in A/m^2)
+        'dx2_w2', 'dz2_w2' : squared cell sizes over `w2`
+        'dt_tau', 't0_norm' : time step and initial time over duration
+        'curv_time', 'curv_phase' : wavefront curvature terms per `w2`
+        'omega_dt', 'phase0' : phase advance per step and initial phase
+    """
+    dx, dy, dz = cell_size
+    tau = ctau / c
+
+    y_relpos = y_foc - iy_antenna * dy
+    Rayleigh = math.pi * waist**2 / wavelength
+    w2 = waist**2 * (1 + y_relpos**2 / Rayleigh**2)
+    Ry_inverse = -y_relpos / (y_relpos**2 + Rayleigh**2)
+    Gouy_phase = math.atan(-y_relpos / Rayleigh)
+    A0_to_J = -4 * math.pi * m_e / wavelength * c / e / mu_0 / dy
+
+    if dim == '3d':
+        profile_norm = waist / math.sqrt(w2)
+    else:
+        profile_norm = math.sqrt( waist / math.sqrt(w2) )
+
+    constants = {}
+    constants['amplitude'] = a0 * A0_to_J * profile_norm
+    constants['dx2_w2'] = dx**2 / w2
+    constants['dz2_w2'] = dz**2 / w2
+    constants['dt_tau'] = dt / tau
+    constants['t0_norm'] = ( -cdelay / c + Gouy_phase / 2 / math.pi
+                             / c * wavelength ) / tau
+    constants['curv_time'] = w2 * Ry_inverse / 2 / c / tau
+    constants['curv_phase'] = math.pi / wavelength * w2 * Ry_inverse
+    constants['omega_dt'] = 2 * math.pi / wavelength * c * dt
+    constants['phase0'] = -2 * math.pi / wavelength * cdelay \
+        + Gouy_phase + CEP
+
+    return constants
 
 class Laser:
     """
@@ -23,7 +77,7 @@ class Laser:
     def __init__( self, a0, ctau, waist, cdelay, iy_antenna=0,
                   y_foc=0.0, profile='Gaussian', pol='x', CEP=0.0,
                   wavelength=0.8e-6, method='native', LMNum=0, LM=[1.,],
-                  dim='3d', center_ij=(0,0) ):
+                  dim='3d', center_ij=(0,0), gridSolver=None ):
 
         """
         Initialize the Laser object
@@ -81,7 +135,24 @@ class Laser:
         center_ij : tuple (2 integers)
             X and Z indicies of the laser axis on the simulation grid.
             Should be set, for example to `(Nx//2,Nz//2)` (used by 'antenna')
+
+        gridSolver : GridSolver object
+            If given, the values of the 'antenna' method, which do not
+            depend on the cell and step, are computed here and written
+            as constants, and the per-cell terms use `float_X`
+            (only 'Gaussian' profile). The parameters are checked for
+            the precision of the grid
         """
+        self.a0 = a0
+        self.ctau = ctau
+        self.wavelength = wavelength
+        self.pol = pol
+        self.method = method
+        self.iy_antenna = iy_antenna
+        self.center_ij = tuple(center_ij)
+        self.dim = dim
+        self.antenna_constants = None
+
         params = {}
 
         params['a0'] = a0
@@ -105,13 +176,18 @@ class Laser:
             params['pol'] = { 'x':'1', 'z':'2', 'circ':'3' }[pol]
             params['ix_cntr'] = center_ij[0]
             params['iz_cntr'] = center_ij[1]
-            if dim=='3d':
-               params['r2'] = Template(r2_3d).render(**params)
-               params['laser_profile'] = Template(laser_profile_3d).render(**params)
+            if gridSolver is not None and profile in LaserAntennaHoisted:
+                self.antenna_constants = AntennaConstants( a0, ctau, waist,
+                    cdelay, iy_antenna, y_foc, CEP, wavelength, dim,
+                    gridSolver.cell_size, gridSolver.dt )
+                params.update(self.antenna_constants)
+            elif dim=='3d':
+               params['r2'] = GetTemplate(r2_3d).render(**params)
+               params['laser_profile'] = GetTemplate(laser_profile_3d).render(**params)
             elif dim=='2d':
-               params['r2'] = Template(r2_2d).render(**params)
-               params['laser_profile'] = Template(laser_profile_2d).render(**params)
-            
+               params['r2'] = GetTemplate(r2_2d).render(**params)
+               params['laser_profile'] = GetTemplate(laser_profile_2d).render(**params)
+
         # Converting float and integer arguments to strings
         for arg in params.keys():
             if type(params[arg]) == float:
@@ -124,7 +200,7 @@ class Laser:
         if method=='native':
             template['filename'] = 'laser.template'
             template['Main'] = {}
-            template['Main']["laserProfile"] = Template( \
+            template['Main']["laserProfile"] = GetTemplate( \
                 LaserProfile[profile] ).render(**params)
 
         elif method=='antenna':
@@ -132,7 +208,128 @@ class Laser:
 
             template['Appendable'] = {}
             template['Appendable']['\n'] = {}
-            template['Appendable']['\n']['Antenna'] = Template( \
-               LaserAntenna[profile] ).render(**params)
+            if self.antenna_constants is None:
+                antenna = LaserAntenna[profile]
+            else:
+                antenna = LaserAntennaHoisted[profile]
+                r2_norm = { '2d': r2_norm_2d, '3d': r2_norm_3d }[dim]
+                params['r2_norm'] = GetTemplate(r2_norm).render(**params)
+
+            template['Appendable']['\n']['Antenna'] = GetTemplate( \
+               antenna ).render(**params)
+
+        self.templates = [template,]
+
+        if gridSolver is not None and gridSolver.precision != 'double':
+            for warning in LaserWarnings(self, gridSolver):
+                print( f'*** WARNING ({gridSolver.precision} precision):',
+                       warning )
+
+class LaserAntennas:
+    """
+    Class that combines several antenna lasers into one current
+    kernel. The sources are grouped by the antenna plane, the cells outside
+    of all planes skip the group, and the step phase and the offsets from
+    the laser axes are shared between the sources. Should be used instead
+    of the combined Laser objects (not in addition to them).
+
+    Main attributes
+    ---------------
+        List of `templates`, which are to be rendered in the
+        following files:
+            include/picongpu/param/fieldBackground.param
+    """
+    def __init__( self, lasers ):
+        """
+        Initialize the LaserAntennas object
+        Parameters
+        ----------
+        lasers : list of Laser objects
+            Lasers defined with `method='antenna'` and `gridSolver`
+            (Gaussian profile) and the same dimensionality
+        """
+        for laser in lasers:
+            if laser.method != 'antenna' or laser.antenna_constants is None:
+                raise ValueError( 'Only antenna lasers defined with '
+                                  '`gridSolver` can be combined' )
+
+        dims = set(laser.dim for laser in lasers)
+        if len(dims) != 1:
+            raise ValueError('Lasers should have the same dimensionality')
+        dim = dims.pop()
+
+        self.lasers = list(lasers)
+
+        # the step phase is shared by the lasers of the same frequency
+        omegas = []
+        for laser in lasers:
+            if laser.antenna_constants['omega_dt'] not in omegas:
+                omegas.append(laser.antenna_constants['omega_dt'])
+
+        phases = [ GetTemplate(AntennaGroupPhase).render(
+                     k=k, omega_dt=f"{omega_dt:.15e}" )
+                   for k, omega_dt in enumerate(omegas) ]
+
+        planes_iy = []
+        for laser in lasers:
+            if laser.iy_antenna not in planes_iy:
+                planes_iy.append(laser.iy_antenna)
+
+        AntennaGroupCenter = { '2d': AntennaGroupCenter_2d,
+                               '3d': AntennaGroupCenter_3d }[dim]
+
+        planes = []
+        for iy_antenna in planes_iy:
+            plane_lasers = [ laser for laser in lasers
+                             if laser.iy_antenna == iy_antenna ]
+
+            centers_ij = []
+            for laser in plane_lasers:
+                if laser.center_ij not in centers_ij:
+                    centers_ij.append(laser.center_ij)
+
+            centers = [ GetTemplate(AntennaGroupCenter).render(
+                          j=j, ix_cntr=center_ij[0], iz_cntr=center_ij[1] )
+                        for j, center_ij in enumerate(centers_ij) ]
+
+            sources = []
+            for laser in plane_lasers:
+                params = {}
+                for arg, value in laser.antenna_constants.items():
+                    params[arg] = f"{value:.15e}"
+
+                # the initial phase is reduced to [0, 2*PI) for float_X
+                phase0 = laser.antenna_constants['phase0'] % (2 * math.pi)
+                params['phase0'] = f"{phase0:.15e}"
+
+                j = centers_ij.index(laser.center_ij)
+                params['r2_norm'] = f"dx2_{j} * float_X({params['dx2_w2']})"
+                if dim == '3d':
+                    params['r2_norm'] += \
+                        f" + dz2_{j} * float_X({params['dz2_w2']})"
+
+                params['k'] = omegas.index(laser.antenna_constants['omega_dt'])
+                params['current'] = AntennaGroupCurrent[
+                    { 'x':'1', 'z':'2', 'circ':'3' }[laser.pol] ]
+
+                sources.append( GetTemplate(AntennaGroupSource)
+                                  .render(**params) )
+
+            planes.append( GetTemplate(AntennaGroupPlane).render(
+                             iy_antenna=iy_antenna,
+                             centers='\n'.join(centers),
+                             sources='\n'.join(sources) ) )
+
+        outside = ' && '.join( [ f'cellIdx.y() != {iy_antenna}'
+                                 for iy_antenna in planes_iy ] )
+
+        template = {}
+        template['filename'] = 'fieldBackground.template'
+        template['Appendable'] = {}
+        template['Appendable']['\n'] = {}
+        template['Appendable']['\n']['Antenna'] = GetTemplate( \
+            AntennaGroup ).render( outside=outside,
+                phases=textwrap.indent( '\n'.join(phases), '    ' ),
+                planes=textwrap.indent( '\n'.join(planes), '    ' ) )
 
         self.templates = [template,]
@@ -0,0 +1,383 @@
+"""
+Estimation of the per-device memory footprint of a PIConGPU simulation
+from the PoGit objects. The numbers follow the layout in `memory.template`:
+fields with guard cells, `fieldTmp` slots, particle frames (one frame of
+`SuperCellSize` particles), species exchange buffers and the reserved
+device memory.
+"""
+import math
+
+from .constants import c
+from .attributes import AttributeBytes, SpeciesAttributes
+from .grid import GridSolver
+from .particle import Particle
+
+MiB = 1024**2
+
+# Values hard-coded in `memory.template`
+reservedGpuMemorySize = 350 * MiB
+fieldTmpNumSlots = 2
+GuardSize = 1
+DefaultExchangeMemCfg = { 'BYTES_EXCHANGE_X': 3 * MiB,
+                          'BYTES_EXCHANGE_Y': 6 * MiB,
+                          'BYTES_EXCHANGE_Z': 3 * MiB,
+                          'BYTES_EDGES': 128 * 1024,
+                          'BYTES_CORNER': 32 * 1024 }
+
+def ParticlesPerCell( particle, dim='3d' ):
+    """
+    Returns the number of macroparticles per cell created
+    by the `initial_positions` of the Particle object
+    """
+    if particle.initial_positions is None:
+        return 0
+
+    method = particle.initial_positions[0]
+    if method == 'Ordered':
+        NppcDim = particle.initial_positions[1][:int(dim[0])]
+        return math.prod(NppcDim)
+    else:
+        return particle.initial_positions[1]
+
+def BytesPerParticle( particle, dim='3d', float_bytes=4 ):
+    """
+    Returns the number of bytes used by a macroparticle of the
+    Particle object in a frame
+    """
+    attributes = sum( [ AttributeBytes(name, dim, float_bytes)
+                        for name in particle.attributes ] )
+
+    # frame-internal multiMask (uint8) and localCellIdx (uint16)
+    return attributes + 1 + 2
+
+def ParticleBytesReport( objs, float_bytes=None, verbose=True ):
+    """
+    Returns the dictionary of the memory of a macroparticle per species
+    name: the bytes of the 'attributes' (dictionary), the 'bytes' in
+    a frame, and the 'extra' bytes of the attributes added to the ones
+    required by the species type. The report is printed if `verbose`
+    """
+    grids = [obj for obj in objs if isinstance(obj, GridSolver)]
+    if len(grids) != 1:
+        raise ValueError('Objects should contain one GridSolver')
+    grid = grids[0]
+
+    if float_bytes is None:
+        float_bytes = grid.float_bytes
+
+    report = {}
+    for particle in [obj for obj in objs if isinstance(obj, Particle)]:
+        attributes = { name: AttributeBytes(name, grid.dim, float_bytes)
+                       for name in particle.attributes }
+        required = SpeciesAttributes(particle.species)
+        report[particle.name] = {
+            'attributes': attributes,
+            'bytes': BytesPerParticle(particle, grid.dim, float_bytes),
+            'extra': sum( [ size for name, size in attributes.items()
+                            if name not in required ] ) }
+
+    if verbose:
+        print('*** MEMORY PER MACROPARTICLE')
+        for name, item in report.items():
+            print( f"\t {name:8s} {item['bytes']:4d} bytes",
+                   f"({item['extra']} extra):",
+                   ', '.join(item['attributes']) )
+
+    return report
+
+def FilledFraction( particle, grid, base_density=None ):
+    """
+    Returns the ratio of the macroparticles created by the density
+    profile of the Particle object to the ones of all cells of the grid
+    filled with the `initial_positions` (1.0 if the profile cannot be
+    evaluated, see `pogit.profiles.DensityStatistics`)
+    """
+    Nppc = ParticlesPerCell(particle, grid.dim)
+    if Nppc == 0 or particle.density_profile is None:
+        return 1.0
+
+    try:
+        from .profiles import DensityStatistics
+        statistics = DensityStatistics( [grid, particle],
+                                        base_density=base_density )
+    except (ImportError, NotImplementedError, IndexError, ValueError):
+        return 1.0
+
+    cells = math.prod( grid.N[:int(grid.dim[0])] )
+    return statistics[particle.name]['macroparticles'] / (Nppc * cells)
+
+def ExchangeMemCfg( particle, grid, crossing_fraction=None, fill_factor=None,
+                    safety_factor=2.0, particles_per_cell=None,
+                    transverse_factor=0.5, float_bytes=None, sources=None,
+                    base_density=None ):
+    """
+    Returns the exchange buffer sizes of the species (dictionary with
+    the keys of `DefaultExchangeMemCfg`, in bytes), from the numbers of
+    macroparticles crossing the faces, edges and corners of a device
+    in a step
+
+    Parameters
+    ----------
+    particle : Particle object
+        Species of the buffers
+
+    grid : GridSolver object
+        Grid of the simulation, which gives the local domain of a device
+
+    crossing_fraction : float or tuple of three floats
+        Fraction of the macroparticles of the border cells, which leave
+        the cells per step along x, y and z. By default, given by the
+        particles moving with the speed of light, `c * dt / cell_size`.
+        With the moving window, the relativistic particles move mostly
+        along y, and the default is reduced by `transverse_factor` along
+        x and z
+
+    fill_factor : float
+        Fraction of the border cells filled with the particles. By
+        default, given by the density profile (see `FilledFraction`),
+        or 1.0 with `particles_per_cell`
+
+    safety_factor : float
+        Factor applied to the estimated numbers of the particles
+
+    particles_per_cell : integer
+        Macroparticles per cell, by default created by the
+        `initial_positions`. Should be given (or the `sources`) for the
+        species created by ionization, otherwise ValueError is raised
+
+    transverse_factor : float
+        Reduction of the default crossing fraction along x and z
+        with the moving window
+
+    float_bytes : integer
+        Size of `float_X` in bytes. By default, given by the precision
+        of GridSolver
+
+    sources : list of Particle objects
+        Ion species ionized to this species. If the species creates no
+        macroparticles itself, the macroparticles per cell are given by
+        the ones of the ions times their charge states left to ionize
+
+    base_density : float (in 1/m^3)
+        Base density used to evaluate the density profiles, if the
+        species does not define it
+    """
+    if float_bytes is None:
+        float_bytes = grid.float_bytes
+
+    def fill( species ):
+        if fill_factor is not None:
+            return fill_factor
+        return FilledFraction(species, grid, base_density)
+
+    if particles_per_cell is not None:
+        density = particles_per_cell \
+            * ( 1.0 if fill_factor is None else fill_factor )
+    elif ParticlesPerCell(particle, grid.dim) > 0:
+        density = ParticlesPerCell(particle, grid.dim) * fill(particle)
+    elif sources:
+        density = sum( [ ParticlesPerCell(ion, grid.dim) * fill(ion)
+                         * ( ion.max_charge - ion.initial_charge )
+                         for ion in sources ] )
+    else:
+        raise ValueError( f'{particle.name} creates no macroparticles, give '
+                          '`particles_per_cell` or the ionized `sources` '
+                          'to size the exchange buffers' )
+    density *= safety_factor
+
+    simDim = int(grid.dim[0])
+    SuperCellVolume = math.prod(grid.SuperCell[:simDim])
+    frame_bytes = SuperCellVolume * \
+        BytesPerParticle(particle, grid.dim, float_bytes)
+
+    N_loc = [ grid.N[i] // grid.decomposition[i] for i in range(simDim) ]
+    if simDim == 2:
+        N_loc.append(1)
+
+    if crossing_fraction is None:
+        crossing_fraction = [ min(1.0, c * grid.dt / grid.cell_size[i])
+                              for i in range(3) ]
+        if grid.movingWindow:
+            crossing_fraction[0] *= transverse_factor
+            crossing_fraction[2] *= transverse_factor
+    elif type(crossing_fraction) in (int, float):
+        crossing_fraction = [crossing_fraction, ] * 3
+
+    def buffer( particles ):
+        # whole frames, at least one
+        return max( 1, math.ceil(particles / SuperCellVolume) ) * frame_bytes
+
+    cfg = {}
+    for axis, key in enumerate( ('BYTES_EXCHANGE_X', 'BYTES_EXCHANGE_Y',
+                                 'BYTES_EXCHANGE_Z') ):
+        area = math.prod( [ N_loc[i] for i in range(3) if i != axis ] )
+        cfg[key] = buffer( density * area * crossing_fraction[axis] )
+
+    if simDim == 3:
+        # edges are along one axis and cross the two others
+        cfg['BYTES_EDGES'] = buffer( max( [ density * N_loc[axis] *
+            math.prod( [ crossing_fraction[i] for i in range(3)
+                         if i != axis ] ) for axis in range(3) ] ) )
+        cfg['BYTES_CORNER'] = buffer( density * math.prod(crossing_fraction) )
+    else:
+        cfg['BYTES_EDGES'] = buffer( density * crossing_fraction[0]
+                                     * crossing_fraction[1] )
+        cfg['BYTES_CORNER'] = buffer(0)
+
+    # the sizes are `uint32_t` constants of PIConGPU
+    for key, size in cfg.items():
+        if size >= 2**32:
+            print( f"*** WARNING: {key} of {particle.name}",
+                   f"({size/MiB:.0f} MiB) is limited to 4 GiB" )
+            cfg[key] = 2**32 - frame_bytes
+
+    return cfg
+
+def ExchangeBytes( cfg, dim='3d' ):
+    """
+    Returns the bytes of the exchange buffers of a species on a device
+    for the buffer sizes `cfg` (see `DefaultExchangeMemCfg`), for one
+    direction of the transfer
+    """
+    if int(dim[0]) == 3:
+        return 2 * ( cfg['BYTES_EXCHANGE_X'] + cfg['BYTES_EXCHANGE_Y']
+                   + cfg['BYTES_EXCHANGE_Z'] ) \
+             + 12 * cfg['BYTES_EDGES'] + 8 * cfg['BYTES_CORNER']
+    else:
+        return 2 * ( cfg['BYTES_EXCHANGE_X'] + cfg['BYTES_EXCHANGE_Y'] ) \
+             + 4 * cfg['BYTES_EDGES']
+
+def EstimateMemory( objs, device_memory=None, fill_factor=1.0,
+                    ionization_headroom=1.0, float_bytes=None ):
+    """
+    Estimates the memory used on each device by the simulation
+
+    Parameters
+    ----------
+    objs : list of PoGit objects
+        Objects of the simulation, should contain a GridSolver object
+
+    device_memory : float (in bytes)
+        Memory available on each device. If given, the configurations
+        that do not fit are flagged
+
+    fill_factor : float or dictionary
+        Fraction of the device cells filled with particles (density
+        relative to the maximum of the profile). Can be a dictionary
+        with values per species name
+
+    ionization_headroom : float
+        Fraction of the maximal number of electrons that can be produced
+        by the ionization (one macroparticle per ionization event of an
+        ion macroparticle), which is added to the target species
+
+    float_bytes : integer
+        Size of `float_X` in bytes. By default, given by the precision
+        of GridSolver
+
+    Returns
+    -------
+    report : dictionary
+        Memory use in bytes per component ('fields', 'fieldTmp', 'particles',
+        'exchange', 'reserved'), per species ('species'), the 'total',
+        number of macroparticles per device ('macroparticles') and the
+        'fits' flag (None if `device_memory` is not given)
+    """
+    grids = [obj for obj in objs if isinstance(obj, GridSolver)]
+    if len(grids) != 1:
+        raise ValueError('Objects should contain one GridSolver')
+    grid = grids[0]
+
+    if float_bytes is None:
+        float_bytes = grid.float_bytes
+
+    species = [obj for obj in objs if isinstance(obj, Particle)]
+
+    simDim = int(grid.dim[0])
+    SuperCell = grid.SuperCell[:simDim]
+    SuperCellVolume = math.prod(SuperCell)
+
+    # Local domain and number of supercells with guards
+    N_loc = [ grid.N[i] // grid.decomposition[i] for i in range(simDim) ]
+    N_guard = [ N_loc[i] + 2 * GuardSize * SuperCell[i]
+                for i in range(simDim) ]
+    cells = math.prod(N_loc)
+    cells_guard = math.prod(N_guard)
+    supercells = cells // SuperCellVolume
+
+    report = {}
+
+    # E, B and J vector fields
+    report['fields'] = 3 * 3 * float_bytes * cells_guard
+    # scalar temporary fields
+    report['fieldTmp'] = fieldTmpNumSlots * float_bytes * cells_guard
+
+    # Macroparticles created by initialization
+    macroparticles = {}
+    for particle in species:
+        if type(fill_factor) == dict:
+            fill = fill_factor.get(particle.name, 1.0)
+        else:
+            fill = fill_factor
+
+        macroparticles[particle.name] = \
+            ParticlesPerCell(particle, grid.dim) * cells * fill
+
+    # Electrons which may be produced by ionization
+    for particle in species:
+        if particle.species not in ('ion', 'generic_ionizable'):
+            continue
+        if particle.target_species is None or \
+          particle.target_species.name not in macroparticles:
+            continue
+
+        charge_left = particle.max_charge - particle.initial_charge
+        macroparticles[particle.target_species.name] += \
+            ionization_headroom * charge_left * macroparticles[particle.name]
+
+    # Frames are allocated per supercell, the partially filled
+    # frames are accounted by rounding up per supercell
+    report['species'] = {}
+    for particle in species:
+        Npart = macroparticles[particle.name]
+        frames = supercells * math.ceil(Npart / max(supercells, 1)
+                                        / SuperCellVolume)
+        report['species'][particle.name] = frames * SuperCellVolume * \
+            BytesPerParticle(particle, grid.dim, float_bytes)
+
+    report['particles'] = sum(report['species'].values())
+
+    # Species exchange buffers for the send and receive directions
+    report['exchange'] = sum( [ 2 * ExchangeBytes( particle.exchange_memory
+                                    or DefaultExchangeMemCfg, grid.dim )
+                                for particle in species ] )
+
+    report['reserved'] = reservedGpuMemorySize
+
+    report['total'] = report['fields'] + report['fieldTmp'] \
+        + report['particles'] + report['exchange'] + report['reserved']
+
+    report['macroparticles'] = macroparticles
+
+    if device_memory is None:
+        report['fits'] = None
+    else:
+        report['fits'] = report['total'] <= device_memory
+        if not report['fits']:
+            print( f"*** WARNING: estimated memory",
+                   f"{report['total']/MiB:.0f} MiB exceeds the device",
+                   f"memory {device_memory/MiB:.0f} MiB" )
+
+    return report
+
+def PrintMemory( report ):
+    """
+    Prints the memory estimate given by `EstimateMemory`
+    """
+    print('*** ESTIMATED MEMORY PER DEVICE')
+    for key in ('fields', 'fieldTmp', 'particles', 'exchange', 'reserved'):
+        print(f'\t {key:10s} {report[key]/MiB:10.1f} MiB')
+        if key == 'particles':
+            for name, size in report['species'].items():
+                print(f'\t   {name:8s} {size/MiB:10.1f} MiB')
+    print(f"\t {'total':10s} {report['total']/MiB:10.1f} MiB")
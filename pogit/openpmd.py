@@ -0,0 +1,205 @@
+"""
+Configuration of the openPMD output backends. The options are
+validated in Python and translated into the JSON configuration of
+openPMD-api, which is passed inline to PIConGPU with `--openPMD.json`.
+"""
+import json
+
+backends = ('h5', 'bp')
+engines = ('bp4', 'bp5', 'file', 'sst')
+
+# ADIOS2 operators and their parameters
+operators = { 'blosc': ( 'clevel', 'threshold', 'doshuffle', 'compressor',
+                         'blocksize', 'nthreads' ),
+              'zfp': ( 'accuracy', 'rate', 'precision' ) }
+
+blosc_compressors = ( 'blosclz', 'lz4', 'lz4hc', 'snappy', 'zlib', 'zstd' )
+blosc_shuffles = ( 'BLOSC_NOSHUFFLE', 'BLOSC_SHUFFLE', 'BLOSC_BITSHUFFLE' )
+
+def _validate_operator( compression, parameters ):
+    """
+    Checks the compression operator and its parameters
+    """
+    if compression not in operators:
+        raise ValueError( f'Unknown compression {compression}, '
+                          f'should be one of {tuple(operators)}' )
+
+    for key in parameters:
+        if key not in operators[compression]:
+            raise ValueError( f'Unknown parameter {key} of {compression}, '
+                              f'should be one of {operators[compression]}' )
+
+    if compression == 'zfp':
+        modes = [ key for key in parameters if key in operators['zfp'] ]
+        if len(modes) != 1:
+            raise ValueError( "zfp needs exactly one of 'accuracy', "
+                              "'rate' or 'precision'" )
+
+    if compression == 'blosc':
+        clevel = int( parameters.get('clevel', 1) )
+        if not 0 <= clevel <= 9:
+            raise ValueError('blosc `clevel` should be between 0 and 9')
+        if parameters.get('compressor', 'blosclz') not in blosc_compressors:
+            raise ValueError( 'blosc `compressor` should be one of '
+                              f'{blosc_compressors}' )
+        if parameters.get('doshuffle', 'BLOSC_SHUFFLE') not in blosc_shuffles:
+            raise ValueError( 'blosc `doshuffle` should be one of '
+                              f'{blosc_shuffles}' )
+
+def ValidateOpenPMD( backend='h5', engine=None, aggregators=None,
+                     compression=None, compression_parameters=None,
+                     chunks=None, datasets=None, Ndevices=None ):
+    """
+    Checks the combination of the openPMD options (see `OpenPMDConfig`)
+    and raises ValueError for the invalid ones
+    """
+    if backend not in backends:
+        raise ValueError(f'Unknown openPMD backend {backend}, use {backends}')
+
+    if backend == 'h5':
+        for option, value in ( ('engine', engine),
+                               ('aggregators', aggregators),
+                               ('compression', compression),
+                               ('datasets', datasets) ):
+            if value is not None:
+                raise ValueError( f'Option `{option}` needs the ADIOS2 '
+                                  "backend 'bp'" )
+
+        if chunks is not None and chunks not in ('auto', 'none') and \
+          not ( isinstance(chunks, (list, tuple)) and
+                all(int(size) > 0 for size in chunks) ):
+            raise ValueError( "`chunks` should be 'auto', 'none' or "
+                              "a list of positive integers" )
+
+    if backend == 'bp':
+        if chunks is not None:
+            raise ValueError( "`chunks` are used by the 'h5' backend, "
+                              "ADIOS2 writes one block per device" )
+
+        if engine is not None and engine not in engines:
+            raise ValueError(f'Unknown ADIOS2 engine {engine}, use {engines}')
+
+        if aggregators is not None:
+            if int(aggregators) < 1:
+                raise ValueError('Number of `aggregators` should be positive')
+            if Ndevices is not None and int(aggregators) > Ndevices:
+                raise ValueError( f'Number of aggregators {aggregators} '
+                                  f'exceeds the number of devices {Ndevices}' )
+
+        if compression is not None:
+            _validate_operator(compression, compression_parameters or {})
+        elif compression_parameters:
+            raise ValueError('`compression_parameters` need `compression`')
+
+        for select, options in (datasets or {}).items():
+            if 'compression' not in options:
+                raise ValueError(f'Dataset options of {select} need '
+                                 '`compression`')
+            _validate_operator( options['compression'],
+                                options.get('compression_parameters', {}) )
+
+def _operator( compression, parameters ):
+    """
+    Returns the ADIOS2 operator configuration
+    """
+    return { 'type': compression,
+             'parameters': { key: str(value)
+                             for key, value in (parameters or {}).items() } }
+
+def OpenPMDConfig( backend='h5', engine=None, aggregators=None,
+                   compression=None, compression_parameters=None,
+                   chunks=None, datasets=None, Ndevices=None ):
+    """
+    Returns the openPMD-api JSON configuration (as a dictionary)
+
+    Parameters
+    ----------
+    backend : string
+        File backend, 'h5' (HDF5) or 'bp' (ADIOS2)
+
+    engine : string
+        ADIOS2 engine, e.g. 'bp4' or 'bp5' (by default chosen by openPMD-api)
+
+    aggregators : integer
+        Number of ADIOS2 aggregators (subfiles) per output step
+
+    compression : string
+        ADIOS2 compression operator applied to all datasets,
+        'blosc' (lossless) or 'zfp' (lossy, floating point data)
+
+    compression_parameters : dictionary
+        Parameters of the operator, e.g. `{'clevel': 1,
+        'doshuffle': 'BLOSC_BITSHUFFLE'}` for blosc, or `{'accuracy': 1e-6}`
+        for zfp
+
+    chunks : string or list of integers
+        HDF5 chunking, 'auto', 'none' or chunk sizes
+
+    datasets : dictionary
+        Operators per dataset, as `{regex: {'compression': ...,
+        'compression_parameters': ...}}`, where the regular expression
+        selects the dataset paths, e.g. 'meshes/E/.*' (needs
+        openPMD-api 0.15 or later). The other datasets use `compression`
+
+    Ndevices : integer
+        Number of devices, to check the number of aggregators
+    """
+    ValidateOpenPMD( backend, engine, aggregators, compression,
+                     compression_parameters, chunks, datasets, Ndevices )
+
+    config = {}
+    if backend == 'h5':
+        if chunks is not None:
+            if isinstance(chunks, (list, tuple)):
+                chunks = [ int(size) for size in chunks ]
+            config['hdf5'] = { 'dataset': { 'chunks': chunks } }
+        return config
+
+    adios2 = {}
+    if engine is not None or aggregators is not None:
+        adios2['engine'] = {}
+        if engine is not None:
+            adios2['engine']['type'] = engine
+        if aggregators is not None:
+            adios2['engine']['parameters'] = \
+                { 'NumAggregators': str(int(aggregators)) }
+
+    default = {}
+    if compression is not None:
+        default['operators'] = [ _operator(compression,
+                                           compression_parameters), ]
+
+    if datasets:
+        adios2['dataset'] = [ { 'select': select,
+                                'cfg': { 'operators': [ _operator(
+                                    options['compression'],
+                                    options.get('compression_parameters')
+                                ), ] } }
+                              for select, options in datasets.items() ]
+        adios2['dataset'].append( { 'cfg': default } )
+    elif compression is not None:
+        adios2['dataset'] = default
+
+    if len(adios2) > 0:
+        config['adios2'] = adios2
+
+    return config
+
+def OpenPMDArguments( config ):
+    """
+    Returns the `--openPMD.json` command line argument for the
+    configuration, escaped to be placed in the double-quoted TBG variable
+    of `run.cfg` (empty string for the empty configuration)
+    """
+    if len(config) == 0:
+        return ''
+
+    text = json.dumps(config, separators=(',', ':'))
+    if "'" in text:
+        raise ValueError('openPMD configuration cannot contain quotes')
+
+    # the characters interpreted by the shell in double quotes are escaped
+    for char in ('\\', '"', '$', '`'):
+        text = text.replace(char, '\\' + char)
+
+    return " --openPMD.json '" + text + "'"
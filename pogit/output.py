@@ -0,0 +1,349 @@
+"""
+Planning of the output volume of the Plugin objects: bytes per dump,
+total bytes per run, and the average and peak bandwidth. For the given
+storage and bandwidth budgets, the periods or source subsets which fit
+are suggested.
+"""
+import numbers
+import math
+
+from .grid import GridSolver
+from .particle import Particle
+from .plugins import Plugin
+from .memory import ParticlesPerCell
+from .attributes import AttributeBytes
+
+GiB = 1024**3
+
+# momentum bins of the phase space plugin (fixed in PIConGPU)
+phaseSpaceMomentumBins = 1024
+
+# data written to the checkpoints
+checkpoint_sources = 'E, B, species_all'
+
+# sizes of the small reduced outputs (text files, in bytes)
+_text_value_bytes = 16
+_text_line_bytes = 128
+
+def OutputSteps( period, Nsteps ):
+    """
+    Returns the sorted list of the steps of the output with the `period`,
+    which is an integer or a string of comma-separated ranges in the format
+    `<start>:<end>[:<period>]` (the end is inclusive and can be empty)
+    """
+    if isinstance(period, numbers.Integral) or str(period).strip().isdigit():
+        period = int(period)
+        if period <= 0:
+            return []
+        return list( range(0, Nsteps+1, period) )
+
+    steps = set()
+    for item in str(period).split(','):
+        fields = item.strip().split(':')
+        if len(fields) == 1:
+            steps.update( OutputSteps(int(fields[0]), Nsteps) )
+            continue
+
+        start = int(fields[0]) if fields[0] != '' else 0
+        end = int(fields[1]) if fields[1] != '' else Nsteps
+        step = int(fields[2]) if len(fields) > 2 and fields[2] != '' else 1
+        if step <= 0:
+            continue
+        steps.update( range(start, min(end, Nsteps) + 1, step) )
+
+    return sorted(steps)
+
+def OutputCells( grid ):
+    """
+    Returns the number of cells in the output, i.e. without the
+    hidden devices of the moving window
+    """
+    simDim = int(grid.dim[0])
+    N = list(grid.N[:simDim])
+    if grid.movingWindow:
+        N[1] -= N[1] // grid.decomposition[1]
+
+    return math.prod(N)
+
+def OutputBytesPerParticle( particle, dim='3d', float_bytes=4 ):
+    """
+    Returns the number of bytes of a macroparticle in the openPMD
+    output: the attributes of the species and positionOffset (int32)
+    """
+    simDim = int(dim[0])
+    return sum( [ AttributeBytes(name, dim, float_bytes)
+                  for name in particle.attributes ] ) + simDim * 4
+
+def Macroparticles( objs, grid, species ):
+    """
+    Returns the dictionary of the estimated total numbers of
+    macroparticles per species name, from the density profiles if they
+    can be evaluated, or from the numbers of particles per cell otherwise
+    """
+    macroparticles = {}
+    try:
+        from .profiles import DensityStatistics
+        statistics = DensityStatistics(objs)
+        for particle in species:
+            macroparticles[particle.name] = \
+                statistics[particle.name]['macroparticles']
+    except (ImportError, NotImplementedError, IndexError, ValueError):
+        cells = math.prod( grid.N[:int(grid.dim[0])] )
+        for particle in species:
+            macroparticles[particle.name] = \
+                ParticlesPerCell(particle, grid.dim) * cells
+
+    return macroparticles
+
+def SourceBytes( source, grid, species, macroparticles, float_bytes=4 ):
+    """
+    Returns the dictionary of the bytes per dump of each data
+    source of the openPMD (or hdf5) plugin `source` string
+    """
+    cells = OutputCells(grid)
+    species = { particle.name: particle for particle in species }
+
+    sizes = {}
+    for item in [ item.strip() for item in source.split(',') ]:
+        if item == '':
+            continue
+        if item == 'fields_all':
+            for field in ('E', 'B', 'J'):
+                sizes[field] = 3 * float_bytes * cells
+        elif item in ('E', 'B', 'J'):
+            sizes[item] = 3 * float_bytes * cells
+        elif item == 'species_all':
+            for name, particle in species.items():
+                sizes[f'{name}_all'] = macroparticles[name] * \
+                    OutputBytesPerParticle(particle, grid.dim, float_bytes)
+        elif item.endswith('_all') and item[:-4] in species:
+            name = item[:-4]
+            sizes[item] = macroparticles[name] * \
+                OutputBytesPerParticle(species[name], grid.dim, float_bytes)
+        else:
+            # derived scalar fields, e.g. `e_chargeDensity`
+            sizes[item] = float_bytes * cells
+
+    return sizes
+
+def PluginBytes( plugin, grid, species, macroparticles, float_bytes=4 ):
+    """
+    Returns the dictionary of the bytes per dump of the data sources
+    (or of the species for the reduced diagnostics) of the Plugin object
+    """
+    if plugin.type in ('openPMD', 'hdf5'):
+        return SourceBytes( plugin.source, grid, species, macroparticles,
+                            float_bytes )
+    if plugin.type == 'checkpoint':
+        return SourceBytes( checkpoint_sources, grid, species,
+                            macroparticles, float_bytes )
+
+    simDim = int(grid.dim[0])
+    args = plugin.arguments
+    sizes = {}
+    for name in plugin.species:
+        key = f'{name}_{plugin.type}' if name is not None else plugin.type
+
+        if plugin.type == 'energyHistogram':
+            size = _text_value_bytes * (int(args['binCount']) + 3)
+        elif plugin.type == 'phaseSpace':
+            axis = 'xyz'.index(args['space'])
+            size = 4 * grid.N[axis] * phaseSpaceMomentumBins
+        elif plugin.type == 'calorimeter':
+            size = 4 * int(args['numBinsYaw']) * int(args['numBinsPitch']) \
+                * int(args['numBinsEnergy'])
+        elif plugin.type == 'macroParticlesPerSuperCell':
+            size = 4 * math.prod( [ grid.N[i] // grid.SuperCell[i]
+                                    for i in range(simDim) ] )
+        else:
+            size = _text_line_bytes
+
+        sizes[key] = size
+
+    return sizes
+
+def PlanOutput( objs, step_time=None, write_time=None, storage=None,
+                bandwidth=None, float_bytes=None, macroparticles=None,
+                verbose=True ):
+    """
+    Predicts the output volume and bandwidth of the Plugin objects
+
+    Parameters
+    ----------
+    objs : list of PoGit objects
+        Objects of the simulation, should contain a GridSolver object
+
+    step_time : float (in seconds)
+        Estimated compute time per step, used for the bandwidth
+
+    write_time : float (in seconds)
+        Time allowed to write the output of a step for the peak
+        bandwidth. Default is `step_time`
+
+    storage : float (in bytes)
+        Storage budget for the total output of the run
+
+    bandwidth : float (in bytes per second)
+        Budget of the peak bandwidth of the output
+
+    float_bytes : integer
+        Size of `float_X` in bytes. By default, given by the precision
+        of GridSolver
+
+    macroparticles : dictionary
+        Numbers of macroparticles per species name. By default,
+        they are estimated from the density profiles
+
+    verbose : bool
+        If True, the plan is printed
+
+    Returns
+    -------
+    plan : dictionary
+        'plugins' : list of dictionaries per plugin with the 'type',
+            'period', 'sources' (bytes per dump per source), 'bytes_per_dump',
+            'dumps' (number of dumps) and 'total' (bytes)
+        'total' : total bytes per run
+        'peak_step', 'peak_bytes' : step with the largest output and its bytes
+        'average_bandwidth', 'peak_bandwidth' : in bytes per second
+            (None without `step_time`)
+        'fits' : True if the budgets are met
+        'period_factor' : the smallest factor of the integer periods,
+            with which the budgets are met (None if not possible)
+        'drop_sources' : list of (plugin index, source), which should be
+            removed to meet the budgets with the given periods
+    """
+    grids = [obj for obj in objs if isinstance(obj, GridSolver)]
+    if len(grids) != 1:
+        raise ValueError('Objects should contain one GridSolver')
+    grid = grids[0]
+
+    if float_bytes is None:
+        float_bytes = grid.float_bytes
+
+    species = [obj for obj in objs if isinstance(obj, Particle)]
+    plugins = [obj for obj in objs if isinstance(obj, Plugin)]
+
+    if macroparticles is None:
+        macroparticles = Macroparticles(objs, grid, species)
+
+    if write_time is None:
+        write_time = step_time
+
+    plan = {'plugins': []}
+    for plugin in plugins:
+        sizes = PluginBytes( plugin, grid, species, macroparticles,
+                             float_bytes )
+        steps = OutputSteps(plugin.period, grid.Nsteps)
+        entry = {}
+        entry['type'] = plugin.type
+        entry['period'] = plugin.period
+        entry['sources'] = sizes
+        entry['bytes_per_dump'] = sum(sizes.values())
+        entry['steps'] = steps
+        entry['dumps'] = len(steps)
+        entry['total'] = entry['dumps'] * entry['bytes_per_dump']
+        plan['plugins'].append(entry)
+
+    def evaluate( entries, factor=1, dropped=() ):
+        """
+        Returns the total bytes and the peak bytes per step for the
+        integer periods multiplied by `factor` without `dropped` sources
+        """
+        per_step = {}
+        for index, entry in enumerate(entries):
+            size = sum( [ value for source, value in entry['sources'].items()
+                          if (index, source) not in dropped ] )
+            if factor == 1 or type(entry['period']) != int:
+                steps = entry['steps']
+            else:
+                steps = OutputSteps(factor * entry['period'], grid.Nsteps)
+            for step in steps:
+                per_step[step] = per_step.get(step, 0) + size
+
+        if len(per_step) == 0:
+            return 0, None, 0
+        peak_step = max(per_step, key=per_step.get)
+        return sum(per_step.values()), peak_step, per_step[peak_step]
+
+    def fits( total, peak ):
+        if storage is not None and total > storage:
+            return False
+        if bandwidth is not None and write_time is not None and \
+          peak / write_time > bandwidth:
+            return False
+        return True
+
+    total, peak_step, peak_bytes = evaluate(plan['plugins'])
+    plan['total'] = total
+    plan['peak_step'] = peak_step
+    plan['peak_bytes'] = peak_bytes
+
+    if step_time is not None:
+        plan['average_bandwidth'] = total / (grid.Nsteps * step_time)
+        plan['peak_bandwidth'] = peak_bytes / write_time
+    else:
+        plan['average_bandwidth'] = None
+        plan['peak_bandwidth'] = None
+
+    plan['fits'] = fits(total, peak_bytes)
+
+    # Smallest common factor of the periods that meets the budgets
+    plan['period_factor'] = None
+    if plan['fits']:
+        plan['period_factor'] = 1
+    else:
+        periods = [ entry['period'] for entry in plan['plugins']
+                    if type(entry['period']) == int and entry['period'] > 0 ]
+        factor = 2
+        while len(periods) > 0 and factor * min(periods) <= grid.Nsteps:
+            if fits( *evaluate(plan['plugins'], factor)[::2] ):
+                plan['period_factor'] = factor
+                break
+            factor += 1
+
+    # Sources to remove, starting from the largest total contribution
+    plan['drop_sources'] = []
+    if not plan['fits']:
+        contributions = []
+        for index, entry in enumerate(plan['plugins']):
+            for source, size in entry['sources'].items():
+                contributions.append( (size * entry['dumps'], index, source) )
+        contributions.sort(reverse=True)
+
+        dropped = []
+        for size, index, source in contributions:
+            dropped.append( (index, source) )
+            if fits( *evaluate(plan['plugins'], 1, dropped)[::2] ):
+                break
+        plan['drop_sources'] = dropped
+
+    if verbose:
+        PrintOutputPlan(plan)
+
+    return plan
+
+def PrintOutputPlan( plan ):
+    """
+    Prints the output plan given by `PlanOutput`
+    """
+    print('*** PLANNED OUTPUT')
+    for entry in plan['plugins']:
+        print( f"\t {entry['type']:26s} period {str(entry['period']):>12s}"
+               f" {entry['bytes_per_dump']/GiB:10.3f} GiB/dump"
+               f" x {entry['dumps']:6d} = {entry['total']/GiB:10.2f} GiB" )
+    print(f"\t total {plan['total']/GiB:.2f} GiB,",
+          f"peak {plan['peak_bytes']/GiB:.2f} GiB at step {plan['peak_step']}")
+
+    if plan['average_bandwidth'] is not None:
+        print( f"\t bandwidth average {plan['average_bandwidth']/GiB:.3f}",
+               f"GiB/s, peak {plan['peak_bandwidth']/GiB:.3f} GiB/s" )
+
+    if not plan['fits']:
+        print('*** WARNING: output exceeds the budget')
+        if plan['period_factor'] is not None:
+            print( '\t multiply the periods by', plan['period_factor'] )
+        if len(plan['drop_sources']) > 0:
+            print( '\t remove the sources',
+                   ', '.join( [ f'{source} (plugin {index})'
+                                for index, source in plan['drop_sources'] ] ) )
@@ -1,12 +1,22 @@
-from mako.template import Template
-import numpy as np
-from scipy.constants import c, atomic_mass, m_e, m_p
-from mendeleev import element as table_element
+import re
+from functools import partial
+
+from .templating import GetTemplate
+from .constants import atomic_mass, m_e, m_p
+from .elements import GetElement
+from .formula import ParseFormula, FoldConstants, FormulaToCpp, UsedVariables
+from .precision import ParticleWarnings
+from .decomposition import ValidateSuperCell
+from .attributes import SpeciesAttributes, AttributesCode
+from .ionization import ValidateIonizers, IonizersCode, field_ionizers
+from .ionization import LaserReachableCharge
 
 from .codelets.particle import StartPosition, Manipulators
 from .codelets.density import densityProfile
 from .codelets.species import speciesNumericalParam
 from .codelets.speciesDefinition import speciesDefinition
+from .codelets.speciesDefinition import ExchangeMemCfg, ExchangeMemFlag
+from .codelets.speciesDefinition import ParticleAttributes, Ionizers
 from .codelets.speciesInitialization import CreateDensity 
 from .codelets.speciesInitialization import SetIonCharge
 from .codelets.speciesInitialization import SetIonNeutral
@@ -32,7 +42,9 @@ class Particle:
                   target_species=None, ionizer_polarization='Lin',
                   initial_temperature=None,
                   shape_order=1, pusher='Boris',
-                  current_deposition='Esirkepov' ):
+                  current_deposition='Esirkepov', gridSolver=None,
+                  exchange_memory=None, attributes=None, ionizers=None,
+                  laser=None ):
 
         """
         Initialize the Particle object
@@ -78,7 +90,20 @@ class Particle:
         density_profile : dictionary or list of dictionaries
             Parameters for the density profile defined as a codelet
             (see example). Can be the list of profiles, in which case
-            each profile will be generated independently, i.e. summed
+            each profile will be generated independently, i.e. summed.
+            The 'Tabulated' profile is defined by the NumPy array 'data'
+            of the density relative to `base_density` (2D or 3D), and
+            optionally the 'axes' (list of 1D arrays of node coordinates
+            in meters, by default the lower corners of the cells) and the
+            'defaultDensity' used outside of the table. The table is
+            interpolated onto the grid, and written to `etc/picongpu/`
+            (needs `gridSolver` and the package `h5py`).
+            The 'FormulaXY' and 'FormulaXYZ' profiles are parsed, their
+            constant subexpressions are folded, and only the used
+            coordinates are declared. With the key 'precision' set to
+            'float_X', the formula is evaluated in `float_X`, if its error
+            relative to the double precision evaluation over the grid
+            is below 'tolerance' (default 1e-5, needs `gridSolver`)
 
         base_density : float (1/m^3)
             Base value of number density used for normalization of
@@ -129,8 +154,82 @@ class Particle:
                 "VillaBune": (1st order)
                 "EmZ": (1st to 4th order)
                 "ZigZag": (1st to 4th order)
+
+        exchange_memory : 'auto' or dictionary
+            Exchange buffers of the species between the devices. If None,
+            `DefaultExchangeMemCfg` of memory.param is used. With 'auto',
+            the buffers are computed from the particles crossing the
+            device boundaries per step (needs `gridSolver`, see
+            `pogit.memory.ExchangeMemCfg`). The dictionary can contain
+            the buffer sizes in bytes (keys of `DefaultExchangeMemCfg`,
+            e.g. 'BYTES_EXCHANGE_Y'), and the arguments of
+            `ExchangeMemCfg` (e.g. 'crossing_fraction',
+            'particles_per_cell'), with the other sizes computed if
+            `gridSolver` is given, or taken from the defaults otherwise.
+            For the species created by ionization, the buffers are
+            computed from the ion species created with this species as
+            `target_species` (or from 'particles_per_cell')
+
+        attributes : list of strings
+            Attributes of the macroparticles in addition to the ones
+            required by the species type (see `pogit.attributes`), e.g.
+            'momentumPrev1' (radiation plugin) or 'particleId' (tracking).
+            Each attribute increases the memory of a macroparticle, see
+            `pogit.memory.ParticleBytesReport`
+
+        ionizers : list of strings
+            Ionization models of the 'ion' and 'generic_ionizable' species
+            (see `pogit.ionization.ionizer_models`): 'BSI', 'BSIEffectiveZ',
+            'BSIStarkShifted', 'ADK', 'Keldysh' or 'ThomasFermi'. Default
+            is ['BSIEffectiveZ', 'ADK']. The fully ionized species and
+            the empty list get no ionizers
+
+        laser : Laser object
+            If given, the charge states reachable by the laser field are
+            estimated (see `pogit.ionization.LaserReachableCharge`), and the
+            field ionizers are not used if no charge state is reachable
+
+        gridSolver : GridSolver object
+            Grid of the simulation (needed by 'Tabulated' profiles). If
+            given, the parameters are checked for the precision of the grid,
+            and the shape for the guard size of the supercell
         """
         self.name = name
+        self.species = species
+        self.initial_positions = initial_positions
+        self.density_profile = density_profile
+        self.base_density = base_density
+        self.relative_density = relative_density
+        self.initial_charge = initial_charge
+        self.target_species = target_species
+        self.shape_order = shape_order
+        self.atomic_number = None
+
+        # files written by WriteSimulationFiles in addition to the params,
+        # as (path, function writing the file to the given path)
+        self.data_files = []
+
+        # measured errors of the formula profiles evaluated in float_X
+        self.formula_errors = {}
+
+        # charge of the physical particles in elementary charges
+        self.charge = { 'electron': -1, 'proton': 1,
+                        'ion': initial_charge,
+                        'generic_ionizable': initial_charge,
+                        'generic_nonionizable': -charge_ratio
+                      }.get(species, 0)
+
+        # attributes of the macroparticles
+        self.attributes = SpeciesAttributes(species, attributes)
+
+        # exchange buffers of the species (None for the default ones), and
+        # the ion species ionized to it, which register themselves
+        self.exchange_memory = None
+        self.ionization_sources = []
+        self._exchange_request = None
+        if exchange_memory is not None:
+            self.exchange_memory = self._exchange_memory( exchange_memory,
+                                                          gridSolver )
 
         params = {}
         params['name'] = name
@@ -180,10 +279,28 @@ class Particle:
         if species=='generic_ionizable' or species=='generic_nonionizable':
             params["MassRatio"] = mass_ratio
             params["ChargeRatio"] = charge_ratio
+            self.atomic_number = -charge_ratio
         elif species=='ion':
-            el = table_element(element)
-            params["MassRatio"] = el.mass * atomic_mass / m_e
-            params["ChargeRatio"] = -el.atomic_number
+            el = GetElement(element)
+            params["MassRatio"] = el['mass'] * atomic_mass / m_e
+            params["ChargeRatio"] = -el['atomic_number']
+            self.atomic_number = el['atomic_number']
+
+        # ionizers and the highest charge state they reach
+        self.ionizers = []
+        self.max_charge = self.atomic_number
+        params['Ionizers'] = ''
+        if species=='generic_ionizable' or species=='ion':
+            self.ionizers = self._ionizers( ionizers, laser, element )
+            if len(self.ionizers) > 0:
+                params['Ionizers'] = GetTemplate(Ionizers).render(
+                    ionizers=IonizersCode( self.ionizers, target_species.name,
+                                           ionizer_polarization ) )
+
+        params['ParticleAttributes'] = GetTemplate(ParticleAttributes).render(
+            name=name, attributes=AttributesCode(self.attributes) )
+
+        self._render_exchange_memory(params)
 
         # Converting float and integer arguments to strings
         for arg in params.keys():
@@ -200,7 +317,7 @@ class Particle:
         template_species['Appendable'] = {}
         template_species['Appendable']['\n'] = {}
         template_species['Appendable']['\n']['speciesNumericalParam']= \
-            Template(speciesNumericalParam).render(**params)
+            GetTemplate(speciesNumericalParam).render(**params)
 
         # Species definition
         template_speciesDefinition = {}
@@ -210,10 +327,14 @@ class Particle:
         template_speciesDefinition['Appendable'][',\n'] = {}
 
         template_speciesDefinition['Appendable']['\n']['SpeciesDefinition'] = \
-            Template(speciesDefinition[species]).render(**params)
+            GetTemplate(speciesDefinition[species]).render(**params)
         template_speciesDefinition['Appendable'][',\n']['SpeciesRuntimeName'] =\
             'PIC_' + name
 
+        # kept to render the definition again with the exchange buffers
+        self._definition_params = params
+        self._definition_template = template_speciesDefinition
+
         # Initialization features and manipulators
         template_particle = {}
         template_particle['filename'] = 'particle.template'
@@ -224,19 +345,19 @@ class Particle:
         template_particle['Appendable']['\n'] = {}
 
         if initial_positions is not None:
-            template_particle['Appendable']['\n']['StartPosition'] = Template( \
+            template_particle['Appendable']['\n']['StartPosition'] = GetTemplate( \
                 StartPosition[initial_positions[0]] ).render(**params)
 
         manipulator_list = []
 
         # configure initial charge manipulator for ionizable
         if species=='generic_ionizable' or species=='ion':
-            manipulator_list.append( Template( Manipulators['SetIonCharge'] )\
+            manipulator_list.append( GetTemplate( Manipulators['SetIonCharge'] )\
                 .render(**params) )
 
         # configure temperature manipulator
         if initial_temperature is not None:
-            manipulator_list.append( Template( Manipulators['Temperature'])\
+            manipulator_list.append( GetTemplate( Manipulators['Temperature'])\
                 .render(**params) )
 
         # add manipulators
@@ -257,21 +378,21 @@ class Particle:
                 # if multiple entries create with enumerated indices
                 for profile_index, prof in enumerate(density_profile):
                     params['profile_index'] = str(profile_index)
-                    createManipulate_list.append( Template(CreateDensity)\
+                    createManipulate_list.append( GetTemplate(CreateDensity)\
                                                   .render(**params))
             else:
                 # if single entry set index to 0
                 params['profile_index'] = '0'
-                createManipulate_list.append( Template(CreateDensity)\
+                createManipulate_list.append( GetTemplate(CreateDensity)\
                                               .render(**params))
 
         # apply initial charge manipulator for ionizable
         if species=='generic_ionizable' or species=='ion':
             if initial_charge==0:
-                createManipulate_list.append( Template(SetIonNeutral)\
+                createManipulate_list.append( GetTemplate(SetIonNeutral)\
                                               .render(**params))
             else:
-                createManipulate_list.append( Template(SetIonCharge)\
+                createManipulate_list.append( GetTemplate(SetIonCharge)\
                                               .render(**params))
 
         # add manipulator applications
@@ -295,15 +416,17 @@ class Particle:
                 tmpt_loc = []
                 for profile_index, prof in enumerate(density_profile):
                     params['profile_index'] = str(profile_index)
-                    tmpt_loc.append( Template(densityProfile[prof['name']] )\
+                    prof = self._profile_args(prof, gridSolver, params)
+                    tmpt_loc.append( GetTemplate(densityProfile[prof['name']] )\
                         .render(**{**prof, **params}) )
 
                 tmpt_loc = '\n'.join(tmpt_loc)
             else:
                 # if single entry set index to 0
                 params['profile_index'] = '0'
-                tmpt_loc = Template( densityProfile[density_profile['name']] )\
-                    .render(**{**density_profile, **params})
+                prof = self._profile_args(density_profile, gridSolver, params)
+                tmpt_loc = GetTemplate( densityProfile[prof['name']] )\
+                    .render(**{**prof, **params})
 
             # add density profiles
             template_density['Appendable']['\n']['densityProfile'] = tmpt_loc
@@ -315,3 +438,223 @@ class Particle:
                            template_speciesInitialization,
                            template_density,
                          ]
+
+        # the electrons of ionization get their exchange buffers sized
+        if target_species is not None and len(self.ionizers) > 0:
+            target_species._add_ionization_source(self)
+
+        if gridSolver is not None:
+            ValidateSuperCell( gridSolver.SuperCell, gridSolver.dim,
+                               shape_order )
+
+        if gridSolver is not None and gridSolver.precision != 'double':
+            for warning in ParticleWarnings(self, gridSolver):
+                print( f'*** WARNING ({gridSolver.precision} precision):',
+                       warning )
+
+    def _ionizers( self, ionizers, laser, element ):
+        """
+        Returns the ionizers of the ion species given by the `ionizers`
+        argument, without the field ionizers if the `laser` cannot
+        ionize the species further, and sets `max_charge`
+        """
+        ionizers = ValidateIonizers(ionizers)
+
+        if self.initial_charge >= self.atomic_number:
+            print( f'*** SPECIES {self.name} IS FULLY IONIZED:',
+                   'ionizers are not used' )
+            self.max_charge = self.initial_charge
+            return []
+
+        if laser is not None:
+            reachable = LaserReachableCharge( laser, element,
+                                              self.initial_charge )
+            if reachable <= self.initial_charge:
+                dropped = [ name for name in ionizers
+                            if name in field_ionizers ]
+                ionizers = [ name for name in ionizers
+                             if name not in field_ionizers ]
+                if len(dropped) > 0:
+                    print( f'*** SPECIES {self.name} IS NOT IONIZED BY',
+                           'THE LASER: ionizers', ', '.join(dropped),
+                           'are not used' )
+
+            if not any( name not in field_ionizers for name in ionizers ):
+                self.max_charge = min(reachable, self.atomic_number)
+
+        if len(ionizers) == 0:
+            self.max_charge = self.initial_charge
+
+        return ionizers
+
+    def _render_exchange_memory( self, params ):
+        """
+        Sets the codelets of the exchange buffers in `params`
+        """
+        params['ExchangeMemCfg'] = ''
+        params['ExchangeMemFlag'] = ''
+        if self.exchange_memory is not None:
+            params['ExchangeMemCfg'] = GetTemplate(ExchangeMemCfg).render(
+                name=self.name, **self.exchange_memory )
+            params['ExchangeMemFlag'] = GetTemplate(ExchangeMemFlag).render(
+                name=self.name )
+
+    def _add_ionization_source( self, ion ):
+        """
+        Registers the ion species ionized to this species. If the exchange
+        buffers wait for the sources (see `_exchange_memory`), they are
+        computed and the species definition is rendered again
+        """
+        from .memory import ExchangeMemCfg
+
+        self.ionization_sources.append(ion)
+        if self._exchange_request is None:
+            return
+
+        options, sizes, gridSolver = self._exchange_request
+        cfg = ExchangeMemCfg( self, gridSolver,
+                              sources=self.ionization_sources, **options )
+        cfg.update(sizes)
+        self.exchange_memory = cfg
+
+        params = self._definition_params
+        self._render_exchange_memory(params)
+        self._definition_template['Appendable']['\n']['SpeciesDefinition'] = \
+            GetTemplate(speciesDefinition[self.species]).render(**params)
+
+    def _exchange_memory( self, exchange_memory, gridSolver ):
+        """
+        Returns the exchange buffer sizes (in bytes) of the species
+        given by the `exchange_memory` argument. For the species, which
+        creates no macroparticles (e.g. the electrons of ionization),
+        the buffers are computed when the ion species with this
+        `target_species` are created, and None is returned
+        """
+        from .memory import ExchangeMemCfg, DefaultExchangeMemCfg
+        from .memory import ParticlesPerCell
+
+        if exchange_memory == 'auto':
+            exchange_memory = {}
+
+        sizes = { key: int(value) for key, value in exchange_memory.items()
+                  if key in DefaultExchangeMemCfg }
+        options = { key: value for key, value in exchange_memory.items()
+                    if key not in DefaultExchangeMemCfg }
+
+        if gridSolver is not None and 'particles_per_cell' not in options \
+          and not options.get('sources') \
+          and ParticlesPerCell(self, gridSolver.dim) == 0:
+            self._exchange_request = (options, sizes, gridSolver)
+            return None
+
+        if gridSolver is not None:
+            cfg = ExchangeMemCfg(self, gridSolver, **options)
+        elif len(options) > 0 or len(sizes) == 0:
+            raise ValueError( 'Exchange buffers computed from the particle '
+                              'flux need `gridSolver`' )
+        else:
+            cfg = dict(DefaultExchangeMemCfg)
+
+        cfg.update(sizes)
+        return cfg
+
+    def _profile_args( self, profile, gridSolver, params ):
+        """
+        Returns the arguments of the density profile codelet. For the
+        'Tabulated' profile, registers the data file to be written
+        """
+        if profile['name'] in ('FormulaXY', 'FormulaXYZ'):
+            return self._formula_args(profile, gridSolver, params)
+
+        if profile['name'] != 'Tabulated':
+            return profile
+
+        if gridSolver is None:
+            raise ValueError("'Tabulated' profile needs `gridSolver`")
+
+        # NumPy is imported only for the tabulated profiles
+        from .tabulated import WriteTabulatedDensity
+
+        prefix = f"density_{params['name']}_{params['profile_index']}"
+        iteration = profile.get('iteration', 0)
+
+        args = {**profile}
+        args['iteration'] = f"{iteration:d}"
+        args['datasetName'] = profile.get('datasetName', 'density')
+        args['defaultDensity'] = f"{profile.get('defaultDensity', 0.0):.15e}"
+        # the simulation runs in `simOutput/` next to the copied input
+        args['filename'] = '../input/etc/picongpu/' + prefix
+
+        path = f'./etc/picongpu/{prefix}_{iteration}.h5'
+        # bound with `partial` (not a lambda) to keep the object picklable
+        self.data_files.append( ( path, partial( WriteTabulatedDensity,
+            profile=profile, grid=gridSolver ) ) )
+
+        return args
+
+    def _formula_args( self, profile, gridSolver, params ):
+        """
+        Returns the arguments of the formula profile codelet with the
+        formula translated to C++ and the used coordinates declared
+        """
+        if profile['name'] == 'FormulaXY':
+            variables = ('x', 'y')
+        else:
+            variables = ('x', 'y', 'z')
+
+        float_type = profile.get('precision', 'float_64')
+        if float_type not in ('float_64', 'float_X'):
+            raise ValueError(f'Unknown formula precision {float_type}')
+
+        try:
+            statements = ParseFormula(profile['Formula'], variables)
+        except ValueError as error:
+            # the formulas not supported by the parser are used as given
+            print( f"*** Formula of {self.name} is used as given:", error )
+            used = [ var for var in variables if var in ('x', 'y') or
+                     re.search(rf'\b{var}\b', profile['Formula']) ]
+            float_type = 'float_64'
+            formula = profile['Formula']
+        else:
+            folded = FoldConstants(statements)
+            used = UsedVariables(folded)
+
+            if float_type == 'float_X':
+                if gridSolver is None:
+                    raise ValueError( "Formula in 'float_X' precision "
+                                      "needs `gridSolver`" )
+
+                from .profiles import SampleCoordinates
+                from .formula import FormulaPrecision
+
+                coordinates = SampleCoordinates(gridSolver, variables)
+                error = FormulaPrecision( folded, coordinates,
+                                          reference_statements=statements )
+                self.formula_errors[params['profile_index']] = error
+
+                tolerance = profile.get('tolerance', 1e-5)
+                if error > tolerance:
+                    print( f"*** Formula of {self.name} is kept in float_64:",
+                           f"error in float_X {error:.2e} exceeds",
+                           f"tolerance {tolerance:.2e}" )
+                    float_type = 'float_64'
+
+            formula = FormulaToCpp(folded, float_type)
+
+        declarations = []
+        for var in variables:
+            if var not in used:
+                continue
+            if float_type == 'float_64':
+                declarations.append( f"            const float_64 {var}"
+                                     f"( position_SI.{var}() );" )
+            else:
+                declarations.append( f"            const {float_type} {var}"
+                                     f"( {float_type}(position_SI.{var}()) );" )
+
+        args = {**profile}
+        args['Formula'] = formula
+        args['float_type'] = float_type
+        args['declarations'] = '\n'.join(declarations)
+
+        return args
@@ -1,8 +1,35 @@
-from mako.template import Template
-from scipy.constants import c
-import numpy as np
+import re
 
-from .codelets.run import plugins
+from .templating import GetTemplate
+
+from .codelets.run import plugins, plugin_defaults, checkpoint_backends
+from .openpmd import OpenPMDConfig, OpenPMDArguments, backends
+
+# period syntax of PIConGPU: `<period>` or `<start>:<end>[:<period>]`,
+# comma-separated
+_period_range = r'(\d+|\d*:\d*(:\d+)?)'
+_period_pattern = re.compile( rf'^{_period_range}(,{_period_range})*$' )
+
+def PeriodString( period ):
+    """
+    Returns the period of the output as the string of PIConGPU, from an
+    integer or from a string `<start>:<end>[:<period>]` (comma-separated
+    ranges are allowed). Raises ValueError for the invalid ones
+    """
+    if type(period) == int:
+        return str(period)
+
+    text = str(period).replace(' ', '')
+    if not _period_pattern.match(text):
+        raise ValueError( f'Invalid period {period}, should be an integer '
+                          'or `<start>:<end>[:<period>]`' )
+    return text
+
+def _period_tag( period ):
+    """
+    Returns the period string usable in the name of a TBG variable
+    """
+    return re.sub( r'\W', '_', period )
 
 class Plugin:
     """
@@ -16,14 +43,128 @@ class Plugin:
 
     def __init__( self, type="openPMD", period=0,
                   source="fields_all, species_all",
-                  name='raw', **kw_args ):
+                  name=None, species=None, **kw_args ):
+        """
+        Initialize the Plugin object
+        Parameters
+        ----------
+        type : string
+            Type of the plugin defined in `codelets/run.py`. The full
+            dumps are 'openPMD' and 'hdf5', and the reduced diagnostics
+            are 'energyHistogram', 'phaseSpace', 'energyParticles',
+            'calorimeter', 'fieldEnergy' and 'macroParticlesPerSuperCell'.
+            The checkpoints are written by 'checkpoint' and read by 'restart'
+
+        period : integer or string
+            Period of the output in steps, or the ranges of steps in the
+            format `<start>:<end>[:<period>]` (see `pogit.schedule`)
+
+        source : string
+            Data sources of the full dumps
+
+        name : string
+            Name of the output (and of the TBG variable). Default is 'raw'
+            for the dumps, and `<species>_<type>` for the reduced plugins
+
+        species : Particle object, string or list of them
+            Species of the reduced per-species plugins. For a list, one
+            plugin is added for each species
+
+        kw_args :
+            Other parameters of the plugin (see `codelets/run.py`).
+            The 'openPMD' plugin takes the options of
+            `pogit.openpmd.OpenPMDConfig`: `backend` ('h5' or 'bp'),
+            `engine`, `aggregators`, `compression`,
+            `compression_parameters`, `chunks`, `datasets` and `Ndevices`,
+            which are validated here. The 'checkpoint' and 'restart'
+            plugins take `backend` ('openPMD', 'hdf5' or 'adios') and
+            `directory`, the 'checkpoint' takes `ext` ('h5' or 'bp') of
+            openPMD, and the 'restart' takes `step` (the latest checkpoint
+            by default)
+        """
+        self.type = type
+        self.period = period
+        self.source = source
+        self.name = name
+        self.openpmd = None
+
+        # arguments of the constructor, used to reschedule the plugin
+        self.options = dict(kw_args)
+
+        period_string = PeriodString(period)
+
+        if type not in plugins:
+            raise ValueError(f'Unknown plugin type {type}')
+
+        if species is None:
+            species_list = [None, ]
+        elif isinstance(species, (list, tuple)):
+            species_list = list(species)
+        else:
+            species_list = [species, ]
+
+        if type == 'openPMD':
+            options = {}
+            for option in ( 'backend', 'engine', 'aggregators', 'compression',
+                            'compression_parameters', 'chunks', 'datasets',
+                            'Ndevices' ):
+                if option in kw_args:
+                    options[option] = kw_args.pop(option)
+
+            self.openpmd = OpenPMDConfig(**options)
+            kw_args['ext'] = options.get('backend', 'h5')
+            kw_args['json'] = OpenPMDArguments(self.openpmd)
+
+        if type in ('checkpoint', 'restart'):
+            backend = kw_args.get('backend', 'openPMD')
+            if backend not in checkpoint_backends:
+                raise ValueError( f'Unknown checkpoint backend {backend}, '
+                                  f'use {checkpoint_backends}' )
+
+            if type == 'checkpoint':
+                ext = kw_args.get('ext', 'h5')
+                if ext not in backends:
+                    raise ValueError( f'Unknown openPMD backend {ext}, '
+                                      f'use {backends}' )
+                if backend == 'openPMD':
+                    kw_args['options'] = f' --checkpoint.openPMD.ext {ext}'
+            elif kw_args.get('step') is not None:
+                kw_args['options'] = \
+                    f" --checkpoint.restart.step {int(kw_args['step'])}"
+
+        # species names from the Particle objects
+        species_list = [ getattr(sp, 'name', sp) for sp in species_list ]
+        self.species = species_list
+        self.arguments = { **plugin_defaults.get(type, {}), **kw_args }
+
+        codelets = []
+        names = []
+        for species_name in species_list:
+            if '${species}' in plugins[type] and species_name is None:
+                raise ValueError(f'Plugin {type} needs `species`')
+
+            params = { **plugin_defaults.get(type, {}) }
+            if name is not None:
+                params["name"] = name
+            elif type in ('openPMD', 'hdf5'):
+                params["name"] = 'raw'
+            elif species_name is None:
+                params["name"] = type
+            else:
+                params["name"] = f'{species_name}_{type}'
+
+            if len(species_list) > 1 and name is not None:
+                params["name"] = f'{name}_{species_name}'
+
+            params["period"] = period_string
+            params["source"] = source
+            params["species"] = species_name
 
-        params = {}
-        params["name"] = name
-        params["period"] = str(int(period))
-        params["source"] = source
+            params = { **params, **kw_args}
+            params["tag"] = f"{params['name']}_{_period_tag(period_string)}"
 
-        params = { **params, **kw_args}
+            codelets.append( GetTemplate(plugins[type]).render(**params) )
+            names.append( f"!TBG_{params['tag']}" )
 
         template_run = {}
         template_run['filename'] = 'run.template'
@@ -32,10 +173,8 @@ class Plugin:
         template_run['Appendable']['\n'] = {}
         template_run['Appendable'][' '] = {}
 
-        template_run['Appendable']['\n']['Plugin']=\
-            Template(plugins[type]).render(**params)
+        template_run['Appendable']['\n']['Plugin'] = '\n'.join(codelets)
 
-        template_run['Appendable'][' ']['PluginName'] = \
-            f"!TBG_{name}_{period:d}"
+        template_run['Appendable'][' ']['PluginName'] = ' '.join(names)
 
         self.templates = [template_run, ]
@@ -0,0 +1,158 @@
+"""
+Floating point precision of the simulation. The precision modes of
+GridSolver select the type of `float_X` and of the special functions
+in `precision.param`. For the single and mixed precision, the parameters
+of the Particle and Laser objects are checked for the values, which
+would lose accuracy (or overflow) in float32.
+"""
+import math
+
+from .constants import c, m_e, e, mu_0
+
+# modes of GridSolver: float_X and the special functions (sqrt, exp, trig)
+precision_modes = { 'single': ('precision32Bit', 'precisionPIConGPU'),
+                    'double': ('precision64Bit', 'precisionPIConGPU'),
+                    'mixed': ('precision32Bit', 'precision64Bit') }
+
+# float32 unit roundoff, largest and smallest normal values
+float32_eps = 2.0**-24
+float32_max = 3.4028235e38
+float32_tiny = 1.1754944e-38
+
+# steps, above which the step number is not exact in float32
+float32_max_steps = 2**24
+
+# tolerated error of the laser phase (in radians)
+phase_tolerance = 1e-2
+
+def PrecisionParams( precision ):
+    """
+    Returns the arguments of `precision.template` for the precision
+    mode 'single', 'double' or 'mixed' (float32 data with the special
+    functions in float64)
+    """
+    if precision not in precision_modes:
+        raise ValueError( f'Unknown precision {precision}, '
+                          f'use {tuple(precision_modes)}' )
+
+    data, special = precision_modes[precision]
+    return { 'precisionPIConGPU': data, 'precisionSqrt': special,
+             'precisionExp': special, 'precisionTrigonometric': special }
+
+def FloatBytes( precision ):
+    """
+    Returns the size of `float_X` in bytes for the precision mode
+    """
+    if precision_modes[precision][0] == 'precision64Bit':
+        return 8
+    return 4
+
+def _range_warning( name, value ):
+    """
+    Returns the warning if the value is outside of the
+    range of the normal float32 numbers
+    """
+    if value == 0 or not math.isfinite(value):
+        return None
+    if abs(value) > float32_max:
+        return f'{name} = {value:.3e} overflows float32'
+    if abs(value) < float32_tiny:
+        return f'{name} = {value:.3e} underflows float32'
+    return None
+
+def GridWarnings( grid ):
+    """
+    Returns the list of float32 warnings of the GridSolver object
+    """
+    warnings = []
+    if grid.Nsteps > float32_max_steps:
+        warnings.append( f'Nsteps = {grid.Nsteps} exceeds {float32_max_steps},'
+                         ' the time of the step is not exact in float32' )
+    return warnings
+
+def LaserWarnings( laser, grid ):
+    """
+    Returns the list of float32 warnings of the Laser object: the error
+    of the phase at the end of the run for the 'native' laser (evaluated
+    in float_X), and the range of the 'antenna' current
+    """
+    warnings = []
+    omega = 2 * math.pi * c / laser.wavelength
+    run_time = grid.Nsteps * grid.dt
+
+    if laser.method == 'native':
+        error = omega * run_time * float32_eps
+        if error > phase_tolerance:
+            warnings.append( f'laser phase error {error:.2e} rad at the '
+                             f'end of the run exceeds {phase_tolerance:.0e}' )
+
+        error = run_time * float32_eps / (laser.ctau / c)
+        if error > phase_tolerance:
+            warnings.append( f'laser envelope error {error:.2e} (of the '
+                             'duration) at the end of the run' )
+
+        # amplitude in the units of PIConGPU
+        warning = _range_warning( 'laser amplitude',
+                                  laser.a0 * omega * grid.dt )
+        if warning:
+            warnings.append(warning)
+
+    elif laser.method == 'antenna':
+        A0_to_J = 4 * math.pi * m_e * c \
+            / ( laser.wavelength * e * mu_0 * grid.cell_size[1] )
+        warning = _range_warning( 'antenna current a0 * A0_to_J',
+                                  laser.a0 * A0_to_J )
+        if warning:
+            warnings.append(warning)
+
+    return warnings
+
+def ParticleWarnings( particle, grid ):
+    """
+    Returns the list of float32 warnings of the Particle object: the
+    range of the macroparticle weighting (the formula profiles are checked
+    by Particle with `'precision': 'float_X'`)
+    """
+    from .memory import ParticlesPerCell
+
+    warnings = []
+    Nppc = ParticlesPerCell(particle, grid.dim)
+    if particle.base_density is not None and Nppc > 0:
+        weighting = particle.base_density * particle.relative_density \
+            * math.prod(grid.cell_size) / Nppc
+        warning = _range_warning( f'weighting of {particle.name}', weighting )
+        if warning:
+            warnings.append(warning)
+
+    return warnings
+
+def PrecisionWarnings( objs, verbose=True ):
+    """
+    Checks the objects of the simulation for the values which lose
+    accuracy in float32. Returns the list of warnings (empty for the
+    'double' precision of GridSolver)
+    """
+    from .grid import GridSolver
+    from .laser import Laser
+    from .particle import Particle
+
+    grids = [obj for obj in objs if isinstance(obj, GridSolver)]
+    if len(grids) != 1:
+        raise ValueError('Objects should contain one GridSolver')
+    grid = grids[0]
+
+    if grid.precision == 'double':
+        return []
+
+    warnings = GridWarnings(grid)
+    for obj in objs:
+        if isinstance(obj, Laser):
+            warnings += LaserWarnings(obj, grid)
+        elif isinstance(obj, Particle):
+            warnings += ParticleWarnings(obj, grid)
+
+    if verbose:
+        for warning in warnings:
+            print(f'*** WARNING ({grid.precision} precision): {warning}')
+
+    return warnings
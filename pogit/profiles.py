@@ -0,0 +1,212 @@
+"""
+Evaluation of the density profiles (defined as codelets in
+`pogit.codelets.density`) with NumPy on the cell grid of GridSolver.
+The grid is processed in chunks of cells along y, so that the memory use
+stays bounded for large 3D grids.
+"""
+import numpy as np
+
+from .constants import c, e
+from .formula import FormulaFunction
+from .tabulated import TabulatedProfile
+from .memory import ParticlesPerCell
+
+# minimal weighting of macroparticles (as in `particle.template`)
+MIN_WEIGHTING = 10.0
+
+def MacroparticlesPerCell( real_per_cell, Nppc ):
+    """
+    Returns the integer array of the macroparticles created in the cells
+    with `real_per_cell` physical particles: PIConGPU reduces the number
+    of macroparticles in a cell from `Nppc`, so that their weighting is
+    not below MIN_WEIGHTING (none are created if it is below for one)
+    """
+    maximum = np.floor( np.asarray(real_per_cell) / MIN_WEIGHTING )
+    return np.minimum(Nppc, maximum).astype(np.int64)
+
+def GaussianProfile( profile, cell_size ):
+    """
+    Returns the function of (x, y, z) for the 'Gaussian' profile, as
+    implemented by `GaussianImpl` of PIConGPU
+    """
+    vacuum_y = profile['vacuumCellsY'] * cell_size[1]
+    center_left = profile['gasCenterLeft']
+    center_right = profile['gasCenterRight']
+    sigma_left = profile['gasSigmaLeft']
+    sigma_right = profile['gasSigmaRight']
+    factor = profile['gasFactor']
+    power = profile['gasPower']
+
+    def density( x, y, z ):
+        y = np.broadcast_to(y, np.broadcast(x, y, z).shape)
+        dens = np.ones(y.shape)
+
+        left = y < center_left
+        dens[left] = np.exp( factor * np.abs( (y[left] - center_left)
+                                              / sigma_left )**power )
+
+        right = y >= center_right
+        dens[right] = np.exp( factor * np.abs( (y[right] - center_right)
+                                               / sigma_right )**power )
+
+        dens[y < vacuum_y] = 0.0
+        return dens
+
+    return density
+
+def ProfileFunction( profile, cell_size, dim='3d' ):
+    """
+    Returns the function of (x, y, z), which evaluates the normalized
+    density of the profile dictionary (as given to Particle)
+    """
+    name = profile['name']
+
+    if name == 'Gaussian':
+        return GaussianProfile(profile, cell_size)
+
+    elif name in ('FormulaXY', 'FormulaXYZ'):
+        if name == 'FormulaXY' or dim == '2d':
+            variables = ('x', 'y')
+        else:
+            variables = ('x', 'y', 'z')
+
+        formula = FormulaFunction(profile['Formula'], variables)
+        def density( x, y, z ):
+            coordinates = dict( zip( ('x', 'y', 'z'), (x, y, z) ) )
+            return formula( **{ name: coordinates[name]
+                                for name in variables } )
+
+        return density
+
+    elif name == 'Tabulated':
+        return TabulatedProfile(profile, cell_size, dim)
+
+    else:
+        raise NotImplementedError(f'Evaluation of {name} is not implemented')
+
+def SampleCoordinates( grid, variables=('x', 'y', 'z'),
+                       points_per_axis=64 ):
+    """
+    Returns the dictionary of the coordinate arrays (broadcastable to
+    each other) sampling the domain of the GridSolver object, including
+    the region traversed by the moving window
+    """
+    coordinates = {}
+    for i, var in enumerate(('x', 'y', 'z')):
+        if var not in variables:
+            continue
+
+        length = grid.N[i] * grid.cell_size[i]
+        if var == 'y' and grid.movingWindow:
+            length += c * grid.dt * grid.Nsteps
+
+        shape = [1, 1, 1][:len(variables)]
+        shape[variables.index(var)] = -1
+        coordinates[var] = np.linspace(0, length, points_per_axis)\
+            .reshape(shape)
+
+    return coordinates
+
+def IterateDensity( particle, grid, chunk_cells=2**24, y_offset=0.0 ):
+    """
+    Generator of the density of the Particle object (relative to the
+    base density, i.e. including its relative density) on the grid of the
+    GridSolver object. Yields tuples (iy_start, density), where density is
+    an array of shape (Nx, Ny_chunk, Nz), with Ny_chunk rows along y
+    starting from iy_start (Nz=1 in 2D). Positions are taken at the lower
+    corners of the cells, as in PIConGPU. The positions along y are
+    shifted by `y_offset` (in meters), e.g. to evaluate the density
+    in the moved window
+    """
+    profiles = particle.density_profile
+    if profiles is None:
+        return
+    if type(profiles) not in (list, tuple):
+        profiles = [profiles, ]
+
+    functions = [ ProfileFunction(profile, grid.cell_size, grid.dim)
+                  for profile in profiles ]
+
+    Nx, Ny, Nz = grid.N
+    if grid.dim == '2d':
+        Nz = 1
+
+    x = ( np.arange(Nx) * grid.cell_size[0] )[:, None, None]
+    z = ( np.arange(Nz) * grid.cell_size[2] )[None, None, :]
+    Ny_chunk = max( 1, chunk_cells // (Nx * Nz) )
+
+    for iy_start in range(0, Ny, Ny_chunk):
+        iy_end = min(Ny, iy_start + Ny_chunk)
+        y = y_offset + np.arange(iy_start, iy_end) * grid.cell_size[1]
+        y = y[None, :, None]
+
+        density = np.zeros( (Nx, iy_end-iy_start, Nz) )
+        for function in functions:
+            density += np.broadcast_to( function(x, y, z), density.shape )
+
+        yield iy_start, density * particle.relative_density
+
+def DensityStatistics( objs, chunk_cells=2**24, base_density=None ):
+    """
+    Evaluates the density profiles of all Particle objects on the grid
+    and returns the dictionary with the statistics per species name:
+        'max' : maximal density (relative to the base density)
+        'mean' : mean density over the grid
+        'cells' : number of cells with particles created
+        'particles' : total number of physical particles
+        'charge' : total charge (in Coulomb)
+        'macroparticles' : total number of macroparticles at the start,
+            with fewer macroparticles in the cells, where the weighting
+            would be below MIN_WEIGHTING (see `MacroparticlesPerCell`)
+        'valid' : False if the profile has NaN, infinite or negative values
+
+    The base density is taken from the species which defines it,
+    unless `base_density` (in 1/m^3) is given
+    """
+    from .grid import GridSolver
+    from .particle import Particle
+
+    grid = [obj for obj in objs if isinstance(obj, GridSolver)][0]
+    species = [obj for obj in objs if isinstance(obj, Particle)]
+
+    if base_density is None:
+        base_density = [ particle.base_density for particle in species
+                         if particle.base_density is not None ][0]
+
+    # in 2D the cell depth `dz` is used as in PIConGPU
+    cell_volume = np.prod(grid.cell_size)
+
+    statistics = {}
+    for particle in species:
+        Nppc = ParticlesPerCell(particle, grid.dim)
+
+        stats = { 'max': 0.0, 'mean': 0.0, 'cells': 0, 'particles': 0.0,
+                  'charge': 0.0, 'macroparticles': 0, 'valid': True }
+        cells_total = 0
+
+        for iy_start, density in IterateDensity(particle, grid, chunk_cells):
+            if not np.all(np.isfinite(density)) or np.any(density < 0):
+                stats['valid'] = False
+                density = np.nan_to_num(density, nan=0.0, posinf=0.0)
+                density = np.maximum(density, 0.0)
+
+            real_per_cell = density * base_density * cell_volume
+            macroparticles = MacroparticlesPerCell(real_per_cell, Nppc)
+
+            stats['max'] = max(stats['max'], density.max())
+            stats['mean'] += density.sum()
+            stats['cells'] += int( np.count_nonzero(macroparticles) )
+            stats['macroparticles'] += int( macroparticles.sum() )
+            stats['particles'] += real_per_cell.sum()
+            cells_total += density.size
+
+        stats['mean'] /= max(cells_total, 1)
+        stats['charge'] = stats['particles'] * particle.charge * e
+
+        if not stats['valid']:
+            print( f'*** WARNING: density of {particle.name} has',
+                   'invalid (NaN, infinite or negative) values' )
+
+        statistics[particle.name] = stats
+
+    return statistics
@@ -0,0 +1,229 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import multiprocessing
+import itertools
+import shutil
+import time
+import csv
+import os
+
+from .writer import WriteAndSubmit
+from .telemetry import ParseRun
+
+# Semaphore limiting the concurrent builds in the worker processes
+_build_lock = None
+
+def _init_worker( build_lock ):
+    """
+    Initializer of the scan worker processes
+    """
+    global _build_lock
+    _build_lock = build_lock
+
+def _run_point( point_dir, objs, submit_args ):
+    """
+    Renders, builds and submits a single scan point in its
+    folder `point_dir`. Returns the status of `WriteAndSubmit`
+    """
+    os.chdir(point_dir)
+    time_start = time.time()
+
+    with open('pogit.log', mode='w') as log, redirect_stdout(log):
+        try:
+            status = WriteAndSubmit( objs, build_lock=_build_lock,
+                                     **submit_args )
+        except Exception as err:
+            print(f'*** SCAN POINT FAILED: {err!r}')
+            status = {'report': None, 'build': None, 'run': None,
+                      'error': repr(err)}
+
+    status['time'] = time.time() - time_start
+    return status
+
+class Scan:
+    """
+    Class that runs the series of simulations (scan) over a grid of
+    parameters. Each scan point is prepared in its own copy of the
+    PIConGPU input folder, and the points are rendered, built and
+    submitted in parallel by a pool of processes.
+
+    Main attributes
+    ---------------
+        `points` : list of dictionaries with parameters of each point
+
+        `results` : list of dictionaries with parameters, folders, logs
+            and exit codes of each point (filled by `run`)
+    """
+    def __init__( self, make_objects, grid, path_input='./',
+                  path_scan='./scan', sim_name='scan', processes=4,
+                  max_builds=1, **submit_args ):
+        """
+        Initialize the Scan object
+        Parameters
+        ----------
+        make_objects : callable
+            Function which takes the parameters of a point as keyword
+            arguments and returns the list of PoGit objects (GridSolver,
+            Particle, Laser, Plugin etc) for this point
+
+        grid : dictionary or list of dictionaries
+            Parameters of the scan. If dictionary, its values are the lists
+            of parameter values and the scan is done over all combinations.
+            If list, each element defines the parameters of one point
+
+        path_input : string
+            PIConGPU input folder (e.g. created by `pic-create`), which
+            is copied for each point, excluding `.build` and `bin`
+
+        path_scan : string
+            Folder where the scan point folders are created
+
+        sim_name : string
+            Base name of the simulations, the point index is appended
+
+        processes : integer
+            Number of worker processes
+
+        max_builds : integer
+            Maximal number of PIConGPU builds running at the same time
+
+        submit_args : keyword arguments
+            Passed to `WriteAndSubmit` (e.g. `output_path`, `s`, `t`,
+            `build_cache`, `build_command`, `submit_command`)
+        """
+        self.make_objects = make_objects
+        self.path_input = os.path.abspath(path_input)
+        self.path_scan = os.path.abspath(path_scan)
+        self.sim_name = sim_name
+        self.processes = processes
+        self.max_builds = max_builds
+
+        self.submit_args = { 'build_log': 'build.log', 'run_log': 'log',
+                             'background': False, **submit_args }
+
+        if type(grid) == dict:
+            keys = list(grid.keys())
+            self.points = [ dict(zip(keys, values)) for values in \
+                            itertools.product(*[grid[key] for key in keys]) ]
+        else:
+            self.points = [ dict(point) for point in grid ]
+
+        self.results = []
+
+    def prepare( self ):
+        """
+        Creates the folders of the scan points, and returns the list
+        of (folder, objects, submit arguments) for each point
+        """
+        tasks = []
+        for index, point in enumerate(self.points):
+            point_name = f'{self.sim_name}_{index:04d}'
+            point_dir = os.path.join(self.path_scan, point_name)
+
+            if os.path.exists(point_dir):
+                shutil.rmtree(point_dir)
+            shutil.copytree( self.path_input, point_dir, symlinks=True,
+                             ignore=self._ignore )
+
+            submit_args = { **self.submit_args, 'sim_name': point_name }
+            tasks.append( (point_dir, self.make_objects(**point),
+                           submit_args) )
+
+        return tasks
+
+    def _ignore( self, folder, names ):
+        """
+        Returns the names, which are not copied to the point folders
+        """
+        ignored = ['.build', 'bin']
+        for name in names:
+            if os.path.join(os.path.abspath(folder), name) == self.path_scan:
+                ignored.append(name)
+        return ignored
+
+    def run( self ):
+        """
+        Runs all scan points and returns the list of results
+        """
+        if not os.path.exists(self.path_scan):
+            os.makedirs(self.path_scan)
+
+        print(f'*** PREPARE {len(self.points)} SCAN POINTS')
+        tasks = self.prepare()
+
+        build_lock = multiprocessing.Semaphore(self.max_builds)
+        with ProcessPoolExecutor( max_workers=self.processes,
+                                  initializer=_init_worker,
+                                  initargs=(build_lock,) ) as executor:
+            futures = [ executor.submit(_run_point, *task) for task in tasks ]
+
+            self.results = []
+            for point, task, future in zip(self.points, tasks, futures):
+                point_dir, objs, submit_args = task
+                status = future.result()
+
+                result = { **point }
+                result['sim_name'] = submit_args['sim_name']
+                result['path'] = point_dir
+                result['log'] = os.path.join(point_dir, 'pogit.log')
+                result['build'] = status['build']
+                result['run'] = status['run']
+                result['time'] = status['time']
+                result['error'] = status.get('error', '')
+                self.results.append(result)
+
+                print( f"\t {result['sim_name']}: build {result['build']},",
+                       f"run {result['run']} ({result['time']:.1f} s)" )
+
+        return self.results
+
+    def failed( self ):
+        """
+        Returns the results of the points with non-zero exit codes
+        """
+        return [ result for result in self.results
+                 if result['error'] or result['build'] not in (0, None)
+                 or result['run'] not in (0, None) ]
+
+    def write_table( self, filename='scan.csv' ):
+        """
+        Writes the results table to a CSV file
+        """
+        if len(self.results) == 0:
+            raise ValueError('No results, call `run` first')
+
+        with open(filename, mode='w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=self.results[0].keys())
+            writer.writeheader()
+            writer.writerows(self.results)
+
+    def telemetry( self, store=None ):
+        """
+        Parses the performance telemetry of the finished scan points (see
+        `pogit.telemetry.ParseRun`) and returns the list of records. If
+        `store` (`pogit.telemetry.TelemetryStore` object) is given, the
+        records are added to it with the point parameters as tags
+        """
+        output_path = self.submit_args.get('output_path', '$PIC_SCRATCH')
+
+        records = []
+        for result in self.results:
+            # the points are submitted from their folders, so the relative
+            # output paths are resolved against them
+            path = os.path.join( result['path'],
+                                 os.path.expandvars(output_path),
+                                 result['sim_name'] )
+            try:
+                record = ParseRun( path,
+                    cfg=os.path.join(result['path'], 'etc/picongpu/run.cfg'),
+                    sim_name=result['sim_name'] )
+            except ValueError as err:
+                print(f"*** NO TELEMETRY OF {result['sim_name']}: {err}")
+                continue
+
+            point = { key: result[key] for key in self.points[0] }
+            if store is not None:
+                record['id'] = store.add(record, **point)
+            records.append( {**point, **record} )
+
+        return records
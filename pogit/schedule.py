@@ -0,0 +1,222 @@
+"""
+Scheduling of the heavy Plugin outputs. The periods of the dumps are
+turned into the `<start>:<end>:<period>` syntax of PIConGPU with the
+offsets chosen so that no two heavy outputs are written at the same step,
+and the compatible dumps are merged into one plugin.
+"""
+from .grid import GridSolver
+from .particle import Particle
+from .plugins import Plugin, PeriodString
+from .output import OutputSteps, PluginBytes, Macroparticles
+
+# plugin types treated as heavy outputs by default
+heavy_types = ('openPMD', 'hdf5', 'checkpoint')
+
+def _sources( source ):
+    """
+    Returns the list of the data sources of the `source` string
+    """
+    return [ item.strip() for item in source.split(',') if item.strip() ]
+
+def _integer_period( plugin ):
+    """
+    Returns the period of the plugin as an integer, or None if it is
+    given by ranges of steps
+    """
+    period = PeriodString(plugin.period)
+    if period.isdigit() and int(period) > 0:
+        return int(period)
+    return None
+
+def _compatible( plugin, other ):
+    """
+    Checks if two dumps can be written by one plugin instance: same type,
+    name and options (backend, compression, etc.)
+    """
+    return plugin.type in heavy_types and plugin.type == other.type \
+        and plugin.name == other.name and plugin.options == other.options
+
+def _rebuild( plugin, period=None, sources=None ):
+    """
+    Returns the copy of the Plugin object with the new period and sources
+    """
+    if period is None:
+        period = plugin.period
+    if sources is None:
+        source = plugin.source
+    else:
+        source = ', '.join(sources)
+
+    species = [ name for name in plugin.species if name is not None ]
+
+    return Plugin( type=plugin.type, period=period, source=source,
+                   name=plugin.name, species=species or None,
+                   **plugin.options )
+
+def MergePlugins( plugins ):
+    """
+    Merges the compatible dumps of the list of Plugin objects. The dumps
+    with the same period are written by one plugin with the union of the
+    sources (one file and one write per step instead of several), and the
+    dumps, whose sources are all written by another dump at each of their
+    steps, are removed. The dumps with different periods are not merged,
+    as it would increase the output volume.
+    Returns the new list of Plugin objects
+    """
+    merged = []
+    for plugin in plugins:
+        period = _integer_period(plugin)
+        for index, other in enumerate(merged):
+            if period is None or not _compatible(plugin, other):
+                continue
+            other_period = _integer_period(other)
+            if other_period is None:
+                continue
+
+            sources = _sources(plugin.source)
+            other_sources = _sources(other.source)
+
+            if period == other_period:
+                union = other_sources + [ item for item in sources
+                                          if item not in other_sources ]
+                merged[index] = _rebuild(other, period, union)
+                break
+            if period % other_period == 0 and \
+              all( item in other_sources for item in sources ):
+                break
+            if other_period % period == 0 and \
+              all( item in sources for item in other_sources ):
+                merged[index] = plugin
+                break
+        else:
+            merged.append(plugin)
+
+    return merged
+
+def _collisions( steps, occupied, spacing ):
+    """
+    Returns the number of the `steps` closer than `spacing`
+    to the `occupied` steps
+    """
+    return sum( [ any( step + shift in occupied
+                       for shift in range(1-spacing, spacing) )
+                  for step in steps ] )
+
+def ScheduleOutputs( objs, heavy_bytes=None, merge=True, spacing=1,
+                     float_bytes=None, macroparticles=None, verbose=True ):
+    """
+    Staggers the heavy outputs of the Plugin objects
+
+    Parameters
+    ----------
+    objs : list of PoGit objects
+        Objects of the simulation, should contain a GridSolver object
+
+    heavy_bytes : float (in bytes)
+        Plugins writing at least this number of bytes per dump (estimated
+        by `pogit.output.PluginBytes`) are heavy. By default, all the
+        plugins of the types in `heavy_types` are heavy
+
+    merge : bool
+        If True, the compatible dumps are merged (see `MergePlugins`)
+
+    spacing : integer
+        Minimal number of steps between two heavy outputs
+
+    float_bytes : integer
+        Size of `float_X` in bytes, used with `heavy_bytes`. By default,
+        given by the precision of GridSolver
+
+    macroparticles : dictionary
+        Numbers of macroparticles per species name, used with
+        `heavy_bytes` (by default estimated from the density profiles)
+
+    verbose : bool
+        If True, the schedule is printed
+
+    Returns
+    -------
+    objs : list of PoGit objects
+        The objects with the Plugin objects replaced by the scheduled ones.
+        The integer periods of the heavy plugins are given with the offsets
+        as `<offset>:<Nsteps>:<period>`
+    """
+    grids = [obj for obj in objs if isinstance(obj, GridSolver)]
+    if len(grids) != 1:
+        raise ValueError('Objects should contain one GridSolver')
+    grid = grids[0]
+
+    if float_bytes is None:
+        float_bytes = grid.float_bytes
+
+    if int(spacing) < 1:
+        raise ValueError('`spacing` should be a positive integer')
+
+    others = [obj for obj in objs if not isinstance(obj, Plugin)]
+    plugins = [obj for obj in objs if isinstance(obj, Plugin)]
+    if merge:
+        plugins = MergePlugins(plugins)
+
+    sizes = {}
+    if heavy_bytes is not None:
+        species = [obj for obj in objs if isinstance(obj, Particle)]
+        if macroparticles is None:
+            macroparticles = Macroparticles(objs, grid, species)
+        for plugin in plugins:
+            sizes[id(plugin)] = sum( PluginBytes( plugin, grid, species,
+                macroparticles, float_bytes ).values() )
+        heavy = [ plugin for plugin in plugins
+                  if sizes[id(plugin)] >= heavy_bytes ]
+    else:
+        heavy = [ plugin for plugin in plugins if plugin.type in heavy_types ]
+
+    # the steps of the heavy plugins given with ranges are kept
+    occupied = set()
+    movable = []
+    for plugin in heavy:
+        if _integer_period(plugin) is None:
+            occupied.update( OutputSteps(plugin.period, grid.Nsteps) )
+        else:
+            movable.append(plugin)
+
+    # the largest (or the most frequent) outputs are placed first
+    if heavy_bytes is not None:
+        movable.sort( key=lambda plugin: -sizes[id(plugin)] )
+    else:
+        movable.sort( key=_integer_period )
+
+    scheduled = {}
+    collisions = 0
+    for plugin in movable:
+        period = _integer_period(plugin)
+        best = None
+        for offset in range( 0, min(period, grid.Nsteps+1) ):
+            steps = range(offset, grid.Nsteps+1, period)
+            count = _collisions(steps, occupied, spacing)
+            if best is None or count < best[0]:
+                best = (count, offset, steps)
+            if count == 0:
+                break
+
+        count, offset, steps = best
+        collisions += count
+        occupied.update(steps)
+
+        if offset > 0:
+            scheduled[id(plugin)] = _rebuild( plugin,
+                f'{offset}:{grid.Nsteps}:{period}' )
+
+    heavy = [ scheduled.get(id(plugin), plugin) for plugin in heavy ]
+    plugins = [ scheduled.get(id(plugin), plugin) for plugin in plugins ]
+
+    if verbose:
+        print('*** SCHEDULED OUTPUT')
+        for plugin in plugins:
+            label = 'heavy' if any(plugin is item for item in heavy) else ''
+            print( f'\t {plugin.type:26s} period {str(plugin.period):>20s}',
+                   label )
+        if collisions > 0:
+            print( f'*** WARNING: {collisions} heavy outputs cannot be '
+                   'separated, change the periods to avoid it' )
+
+    return others + plugins
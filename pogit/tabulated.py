@@ -0,0 +1,191 @@
+"""
+Tabulated density profiles given as NumPy arrays. The table is
+interpolated onto the cell grid of GridSolver and written (in chunks
+along y) as an HDF5 file with libSplash layout, which is read by the
+`FromHDF5Impl` density profile of PIConGPU at the initialization.
+The file is placed in `etc/picongpu/`, so changing the data does not
+change the param files and does not require to recompile PIConGPU.
+"""
+import numpy as np
+
+# libSplash format written by PIConGPU (read by `FromHDF5Impl`)
+splashVersion = '1.7.0'
+splashFormat = '4.0'
+
+def _axis_weights( axis, coords ):
+    """
+    Returns the lower node indices, the weights of the upper nodes and
+    the mask of the points inside the axis for linear interpolation
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    coords = np.asarray(coords, dtype=np.float64)
+
+    if axis.size == 1:
+        inside = coords == axis[0]
+        return np.zeros(coords.shape, dtype=int), \
+               np.zeros(coords.shape), inside
+
+    inside = (coords >= axis[0]) & (coords <= axis[-1])
+    i0 = np.clip( np.searchsorted(axis, coords, side='right') - 1,
+                  0, axis.size-2 )
+    weight = (coords - axis[i0]) / (axis[i0+1] - axis[i0])
+
+    return i0, np.clip(weight, 0.0, 1.0), inside
+
+def InterpolateTable( data, axes, coords, default=0.0 ):
+    """
+    Returns the multilinear interpolation of the `data` array (2D or 3D)
+    defined on the nodes `axes` (list of 1D arrays in meters) onto the
+    rectilinear grid given by the 1D `coords` along each axis. The points
+    outside of the table get the `default` value
+    """
+    indices, weights, insides = [], [], []
+    for axis, coord in zip(axes, coords):
+        i0, weight, inside = _axis_weights(axis, coord)
+        indices.append(i0)
+        weights.append(weight)
+        insides.append(inside)
+
+    dim = len(axes)
+    shape = tuple(len(coord) for coord in coords)
+    result = np.zeros(shape)
+
+    # sum over the corners of the interpolation cells
+    for corner in range(2**dim):
+        shifts = [ (corner >> i) & 1 for i in range(dim) ]
+        index = []
+        weight = np.ones(shape)
+        for i in range(dim):
+            index.append( np.minimum(indices[i] + shifts[i],
+                                     len(axes[i]) - 1) )
+            w = weights[i] if shifts[i] else 1.0 - weights[i]
+            weight = weight * w.reshape( [-1 if j == i else 1
+                                          for j in range(dim)] )
+
+        result += weight * np.asarray(data)[np.ix_(*index)]
+
+    mask = np.ones(shape, dtype=bool)
+    for i in range(dim):
+        mask = mask & insides[i].reshape( [-1 if j == i else 1
+                                           for j in range(dim)] )
+
+    return np.where(mask, result, default)
+
+def TabulatedAxes( profile, cell_size, dim='3d' ):
+    """
+    Returns the axes of the table of the 'Tabulated' profile. If not
+    given in the profile (key 'axes'), the table is assumed to be defined
+    at the lower corners of the simulation cells
+    """
+    data = profile['data']
+    simDim = int(dim[0])
+
+    if np.ndim(data) != simDim:
+        raise ValueError( f"Table of dimension {np.ndim(data)} cannot be "
+                          f"used in {dim} simulation" )
+
+    if profile.get('axes') is not None:
+        axes = [ np.asarray(axis, dtype=np.float64)
+                 for axis in profile['axes'] ]
+        for axis, size in zip(axes, np.shape(data)):
+            if axis.size != size or np.any(np.diff(axis) <= 0):
+                raise ValueError( 'Axes of the table should be increasing '
+                                  'and match the shape of the data' )
+    else:
+        axes = [ np.arange(size) * cell_size[i]
+                 for i, size in enumerate(np.shape(data)) ]
+
+    return axes
+
+def TabulatedProfile( profile, cell_size, dim='3d' ):
+    """
+    Returns the function of (x, y, z), which interpolates the table of
+    the 'Tabulated' profile. The coordinates should be axis-aligned arrays
+    broadcastable to the grid, e.g. of shapes (Nx,1,1), (1,Ny,1), (1,1,Nz)
+    """
+    axes = TabulatedAxes(profile, cell_size, dim)
+    default = profile.get('defaultDensity', 0.0)
+    data = profile['data']
+
+    def density( x, y, z ):
+        coords = [np.ravel(x), np.ravel(y), np.ravel(z)][:len(axes)]
+        dens = InterpolateTable(data, axes, coords, default)
+        if len(axes) == 2:
+            dens = dens[:, :, None]
+        return dens
+
+    return density
+
+def WriteTabulatedDensity( path, profile, grid, chunk_cells=2**24 ):
+    """
+    Interpolates the 'Tabulated' profile onto the grid of the
+    GridSolver object and writes it to the HDF5 file `path` in the
+    layout of libSplash, with the dataset written by slabs along y
+
+    Parameters
+    ----------
+    path : string
+        Path to the file to be written
+
+    profile : dictionary
+        The 'Tabulated' profile (see `pogit.particle.Particle`)
+
+    grid : GridSolver object
+        Grid of the simulation
+
+    chunk_cells : integer
+        Maximal number of cells evaluated at once
+    """
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError( "Package `h5py` is needed to write "
+                           "the 'Tabulated' density profiles" )
+
+    simDim = int(grid.dim[0])
+    Nx, Ny, Nz = grid.N
+    if simDim == 2:
+        Nz = 1
+
+    function = TabulatedProfile(profile, grid.cell_size, grid.dim)
+    iteration = profile.get('iteration', 0)
+    datasetName = profile.get('datasetName', 'density')
+
+    x = ( np.arange(Nx) * grid.cell_size[0] )[:, None, None]
+    z = ( np.arange(Nz) * grid.cell_size[2] )[None, None, :]
+    Ny_chunk = max( 1, chunk_cells // (Nx * Nz) )
+
+    # libSplash stores the arrays with the reversed order of axes
+    if simDim == 3:
+        shape = (Nz, Ny, Nx)
+    else:
+        shape = (Ny, Nx)
+
+    with h5py.File(path, mode='w') as file:
+        header = file.create_group('header')
+        header.attrs['splashVersion'] = np.bytes_(splashVersion)
+        header.attrs['splashFormat'] = np.bytes_(splashFormat)
+        header.attrs['sim_dim'] = np.uint32(simDim)
+
+        dataset = file.create_dataset( f'data/{iteration}/{datasetName}',
+                                       shape=shape, dtype=np.float32,
+                                       track_times=False )
+
+        for iy_start in range(0, Ny, Ny_chunk):
+            iy_end = min(Ny, iy_start + Ny_chunk)
+            y = ( np.arange(iy_start, iy_end) * grid.cell_size[1] )\
+                [None, :, None]
+
+            dens = function(x, y, z).astype(np.float32)
+            if simDim == 3:
+                dataset[:, iy_start:iy_end, :] = dens.transpose(2, 1, 0)
+            else:
+                dataset[iy_start:iy_end, :] = dens[:, :, 0].T
+
+        # domain attributes of libSplash DomainCollector (x, y, z order)
+        size = np.array([Nx, Ny, Nz], dtype=np.uint64)
+        dataset.attrs['_size'] = size
+        dataset.attrs['_start'] = np.zeros(3, dtype=np.uint64)
+        dataset.attrs['_global_size'] = size
+        dataset.attrs['_global_start'] = np.zeros(3, dtype=np.uint64)
+        dataset.attrs['_data_class'] = np.uint32(1)
@@ -0,0 +1,379 @@
+"""
+Performance telemetry of the PIConGPU runs. The standard output of
+PIConGPU (the `output` file of the simulation folder or the log of
+`WriteAndSubmit`) is parsed for the initialization time, the progress
+lines and the total run time, and the `run.cfg` for the numbers of
+devices and cells. The records are kept in a CSV table indexed by the
+record `id`, to compare the throughput of the runs and find regressions.
+"""
+import datetime
+import glob
+import math
+import csv
+import re
+import os
+
+# fields of the records stored in TelemetryStore (followed by the tags)
+record_fields = ( 'id', 'date', 'sim_name', 'path', 'devices', 'Nx', 'Ny',
+                  'Nz', 'Nsteps', 'steps_done', 'init_time',
+                  'simulation_time', 'total_time', 'time_per_step',
+                  'throughput', 'complete' )
+
+_time_units = { 'h': 3600.0, 'min': 60.0, 'sec': 1.0, 'msec': 1e-3 }
+_time_pattern = re.compile(r'(\d+)\s*(msec|sec|min|h)\b')
+_progress_pattern = re.compile(
+    r'^\s*(\d+)\s*%\s*=\s*(\d+)\s*\|\s*time elapsed:\s*([^|]*)' )
+
+def ParseTime( text ):
+    """
+    Returns the time in seconds from the PIConGPU time interval text,
+    e.g. ' 1min  2sec 345msec' or '... = 62.345 sec' (the exact
+    value after '=' is used if present)
+    """
+    if '=' in text:
+        match = re.search(r'=\s*([\d.]+)\s*sec', text)
+        if match:
+            return float(match.group(1))
+
+    return sum( [ int(value) * _time_units[unit]
+                  for value, unit in _time_pattern.findall(text) ] )
+
+def ParseLog( text ):
+    """
+    Parses the standard output of PIConGPU
+
+    Parameters
+    ----------
+    text : string
+        Content of the output, or the path to the file
+
+    Returns
+    -------
+    record : dictionary
+        'init_time' : initialization time (in seconds, None if not found)
+        'progress' : list of (percent, step, elapsed time) of the progress
+            lines (elapsed time since the start of the calculation)
+        'simulation_time' : time of the calculation (in seconds)
+        'total_time' : full run time including the initialization
+        'steps_done' : the last step in the progress lines
+        'complete' : True if PIConGPU reported the full simulation time
+    """
+    if os.path.exists(text):
+        with open(text, errors='replace') as file:
+            text = file.read()
+
+    record = { 'init_time': None, 'progress': [], 'simulation_time': None,
+               'total_time': None, 'steps_done': 0, 'complete': False }
+
+    for line in text.splitlines():
+        match = _progress_pattern.match(line)
+        if match:
+            record['progress'].append( ( int(match.group(1)),
+                                         int(match.group(2)),
+                                         ParseTime(match.group(3)) ) )
+        elif line.strip().startswith('initialization time:'):
+            record['init_time'] = ParseTime(line.split(':', 1)[1])
+        elif 'calculation' in line and 'simulation time:' in line:
+            record['simulation_time'] = ParseTime(line.split(':', 1)[1])
+        elif line.strip().startswith('full simulation time:'):
+            record['total_time'] = ParseTime(line.split(':', 1)[1])
+            record['complete'] = True
+
+    if len(record['progress']) > 0:
+        record['steps_done'] = record['progress'][-1][1]
+        if record['simulation_time'] is None:
+            record['simulation_time'] = record['progress'][-1][2]
+
+    if record['total_time'] is None and \
+      record['simulation_time'] is not None:
+        record['total_time'] = ( record['init_time'] or 0.0 ) \
+            + record['simulation_time']
+
+    return record
+
+def ParseConfig( path ):
+    """
+    Returns the dictionary with the numbers of 'devices' and cells
+    ('Nx', 'Ny', 'Nz') and the 'Nsteps' from the `run.cfg` file
+    """
+    with open(path) as file:
+        text = file.read()
+
+    def value( name ):
+        match = re.search(rf'^{name}="?([^"\n]*)"?', text, re.MULTILINE)
+        return match.group(1).strip() if match else None
+
+    config = { 'devices': None, 'Nx': None, 'Ny': None, 'Nz': None,
+               'Nsteps': None }
+
+    devices = [ value(f'TBG_devices_{axis}') for axis in 'xyz' ]
+    if all( item is not None and item.isdigit() for item in devices ):
+        config['devices'] = math.prod( [int(item) for item in devices] )
+
+    size = value('TBG_gridSize')
+    if size is not None:
+        size = size.split()
+        for axis, item in zip( ('Nx', 'Ny', 'Nz'), size ):
+            config[axis] = int(item)
+
+    steps = value('TBG_steps')
+    if steps is not None and steps.isdigit():
+        config['Nsteps'] = int(steps)
+
+    return config
+
+def StepTimes( record ):
+    """
+    Returns the list of (start step, end step, time per step) between
+    the progress lines of the parsed record
+    """
+    intervals = []
+    progress = record['progress']
+    for (p0, step0, time0), (p1, step1, time1) in \
+      zip(progress[:-1], progress[1:]):
+        if step1 > step0:
+            intervals.append( (step0, step1, (time1-time0) / (step1-step0)) )
+    return intervals
+
+def SlowIntervals( record, factor=1.5 ):
+    """
+    Returns the progress intervals (see `StepTimes`), in which the time
+    per step exceeds the median by more than `factor`
+    """
+    intervals = StepTimes(record)
+    if len(intervals) == 0:
+        return []
+
+    times = sorted( [ interval[2] for interval in intervals ] )
+    median = times[len(times) // 2]
+    return [ interval for interval in intervals
+             if interval[2] > factor * median ]
+
+def ProgressArray( record ):
+    """
+    Returns the NumPy structured array of the progress intervals with
+    the fields 'start', 'end' and 'step_time'
+    """
+    import numpy as np
+
+    return np.array( StepTimes(record),
+                     dtype=[ ('start', np.int64), ('end', np.int64),
+                             ('step_time', np.float64) ] )
+
+def ParseRun( path, log=None, cfg=None, sim_name=None ):
+    """
+    Parses the telemetry of a run
+
+    Parameters
+    ----------
+    path : string
+        Simulation folder (the destination of `tbg`)
+
+    log : string
+        Path of the standard output. By default, the `output` file in
+        `path` or in `path/simOutput` is used
+
+    cfg : string
+        Path of the `run.cfg`. By default, the one copied by `tbg` to
+        `path/tbg/` or `./etc/picongpu/run.cfg` is used
+
+    sim_name : string
+        Name of the run. Default is the name of the folder
+
+    Returns
+    -------
+    record : dictionary
+        The record of `ParseLog` completed with the 'devices', 'Nx', 'Ny',
+        'Nz', 'Nsteps', 'time_per_step' (average in seconds),
+        'throughput' (cell updates per second per device) and 'date'
+        (modification time of the log)
+    """
+    path = os.path.expandvars(path)
+
+    if log is None:
+        for candidate in ( os.path.join(path, 'simOutput', 'output'),
+                           os.path.join(path, 'output') ):
+            if os.path.exists(candidate):
+                log = candidate
+                break
+        else:
+            raise ValueError(f'No output of PIConGPU found in {path}')
+
+    if cfg is None:
+        candidates = sorted( glob.glob(os.path.join(path, 'tbg', '*.cfg')) )
+        candidates.append('./etc/picongpu/run.cfg')
+        cfg = [ item for item in candidates if os.path.exists(item) ]
+        cfg = cfg[0] if len(cfg) > 0 else None
+
+    if not os.path.exists(log):
+        raise ValueError(f'No output of PIConGPU found at {log}')
+
+    record = ParseLog(log)
+    if cfg is not None:
+        record.update( ParseConfig(cfg) )
+    else:
+        record.update( { 'devices': None, 'Nx': None, 'Ny': None,
+                         'Nz': None, 'Nsteps': None } )
+
+    record['path'] = os.path.abspath(path)
+    record['sim_name'] = sim_name or os.path.basename(record['path'])
+    # the run is dated by its log, so that parsing it again gives the same id
+    record['date'] = datetime.datetime.fromtimestamp( os.path.getmtime(log) )\
+        .isoformat(timespec='seconds')
+
+    record['time_per_step'] = None
+    record['throughput'] = None
+    if record['steps_done'] > 0 and record['simulation_time']:
+        record['time_per_step'] = record['simulation_time'] \
+            / record['steps_done']
+
+        if record['devices'] and record['Nx']:
+            cells = record['Nx'] * record['Ny'] * ( record['Nz'] or 1 )
+            record['throughput'] = cells / record['time_per_step'] \
+                / record['devices']
+
+    return record
+
+class TelemetryStore:
+    """
+    Class that keeps the telemetry records in a CSV table, indexed by
+    the record `id`, with the user tags (e.g. the parameters of the scan
+    points) as the extra columns
+
+    Main attributes
+    ---------------
+        `filename` : path of the CSV table
+
+        `records` : dictionary of the records (as dictionaries) by `id`
+    """
+    def __init__( self, filename='telemetry.csv' ):
+        """
+        Initialize the TelemetryStore object and read the existing table
+        Parameters
+        ----------
+        filename : string
+            Path of the CSV table
+        """
+        self.filename = filename
+        self.records = {}
+
+        if os.path.exists(filename):
+            with open(filename, newline='') as file:
+                for row in csv.DictReader(file):
+                    self.records[row['id']] = self._convert(row)
+
+    def _convert( self, row ):
+        """
+        Converts the numeric values of the CSV row
+        """
+        record = {}
+        for key, value in row.items():
+            if value == '' or value is None:
+                record[key] = None
+            elif value in ('True', 'False'):
+                record[key] = value == 'True'
+            else:
+                try:
+                    record[key] = int(value)
+                except ValueError:
+                    try:
+                        record[key] = float(value)
+                    except ValueError:
+                        record[key] = value
+        return record
+
+    def __getitem__( self, key ):
+        return self.records[key]
+
+    def __len__( self ):
+        return len(self.records)
+
+    def add( self, record, **tags ):
+        """
+        Adds the record of `ParseRun` with the `tags` to the table,
+        writes the table and returns the record `id`. The `id` is given
+        by the name, the folder and the date of the run, so that adding
+        the same run again replaces its record
+        """
+        row = { field: record.get(field) for field in record_fields }
+        row['date'] = record.get('date') or \
+            datetime.datetime.now().isoformat(timespec='microseconds')
+        row['id'] = record.get('id') or \
+            f"{row['sim_name']}@{row['path'] or ''}@{row['date']}"
+        row.update(tags)
+
+        self.records[row['id']] = row
+        self.write()
+        return row['id']
+
+    def fields( self ):
+        """
+        Returns the columns of the table: the record fields and the tags
+        """
+        fields = list(record_fields)
+        for row in self.records.values():
+            fields += [ key for key in row if key not in fields ]
+        return fields
+
+    def write( self ):
+        """
+        Writes the table to the CSV file
+        """
+        with open(self.filename, mode='w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=self.fields())
+            writer.writeheader()
+            for row in self.records.values():
+                writer.writerow( { key: '' if value is None else value
+                                   for key, value in row.items() } )
+
+    def select( self, **tags ):
+        """
+        Returns the list of the records with the given values of
+        the fields or tags, sorted by date
+        """
+        rows = [ row for row in self.records.values()
+                 if all( row.get(key) == value for key, value in tags.items() ) ]
+        return sorted( rows, key=lambda row: row['date'] )
+
+    def compare( self, key='throughput', by=None ):
+        """
+        Returns the list of (tags, value) of the `key` field for the
+        records with the same values of the `by` fields (list), sorted
+        by the value, e.g. the throughput across the scan points
+        """
+        values = []
+        for row in self.records.values():
+            if row.get(key) is None:
+                continue
+            tags = { name: row.get(name) for name in (by or ('id',)) }
+            values.append( (tags, row[key]) )
+        return sorted( values, key=lambda item: item[1], reverse=True )
+
+    def regressions( self, tolerance=0.1, match=('sim_name', 'devices',
+                                                 'Nx', 'Ny', 'Nz') ):
+        """
+        Returns the list of (record, reference) of the records, whose
+        throughput is lower by more than `tolerance` (fraction) than the
+        best previous record with the same values of the `match` fields
+        """
+        found = []
+        groups = {}
+        for row in sorted( self.records.values(),
+                           key=lambda row: row['date'] ):
+            if row.get('throughput') is None:
+                continue
+            group = tuple( row.get(name) for name in match )
+            reference = groups.get(group)
+            if reference is not None and row['throughput'] < \
+              (1 - tolerance) * reference['throughput']:
+                found.append( (row, reference) )
+            if reference is None or \
+              row['throughput'] > reference['throughput']:
+                groups[group] = row
+
+        for row, reference in found:
+            print( f"*** REGRESSION: {row['id']} throughput",
+                   f"{row['throughput']:.4g} vs {reference['throughput']:.4g}",
+                   f"of {reference['id']}" )
+
+        return found
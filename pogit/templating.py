@@ -0,0 +1,91 @@
+import hashlib
+import os
+
+# Module-level cache of compiled Mako templates
+_templates = {}
+_stats = {'hits': 0, 'misses': 0}
+_module_directory = None
+
+def SetModuleDirectory( path=None ):
+    """
+    Sets the folder where Mako stores the compiled template modules,
+    so they are reused between the processes. If `path` is None, the
+    templates are compiled in memory only
+    """
+    global _module_directory
+
+    if path is not None:
+        path = os.path.abspath( os.path.expanduser(path) )
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+    _module_directory = path
+
+def GetTemplate( text=None, filename=None ):
+    """
+    Returns the compiled Mako template for the given codelet `text`
+    or template `filename`. The templates are cached by the hash of
+    the text, or by the file path and modification time
+    """
+    if filename is not None:
+        filename = os.path.abspath(filename)
+        key = ('file', filename, os.path.getmtime(filename))
+    elif text is not None:
+        key = ('text', hashlib.sha256(text.encode()).hexdigest())
+    else:
+        raise ValueError('Either `text` or `filename` should be given')
+
+    key = key + (_module_directory, )
+    if key in _templates:
+        _stats['hits'] += 1
+        return _templates[key]
+
+    _stats['misses'] += 1
+
+    # Mako is imported at the first compilation
+    from mako.template import Template
+
+    if _module_directory is None:
+        template = Template(text=text, filename=filename)
+    else:
+        if filename is None:
+            # Mako only keeps on-disk modules of file templates
+            filename = os.path.join(_module_directory, 'codelets',
+                                    key[1] + '.mako')
+            if not os.path.exists(filename):
+                _write_codelet(filename, text)
+
+        template = Template( filename=filename,
+                             module_directory=_module_directory )
+
+    _templates[key] = template
+    return template
+
+def _write_codelet( filename, text ):
+    """
+    Writes the codelet text to a file via a temporary file, so
+    that concurrent processes never read a partial codelet
+    """
+    folder = os.path.dirname(filename)
+    if not os.path.exists(folder):
+        os.makedirs(folder, exist_ok=True)
+
+    filename_tmp = filename + f'.tmp{os.getpid()}'
+    with open(filename_tmp, mode='w') as file:
+        file.write(text)
+    os.replace(filename_tmp, filename)
+
+def CacheInfo():
+    """
+    Returns the dictionary with numbers of cache `hits`, `misses`
+    and `size` of the cache
+    """
+    return { **_stats, 'size': len(_templates) }
+
+def ClearCache():
+    """
+    Removes all templates from the cache and resets the counters
+    """
+    _templates.clear()
+    _stats['hits'] = 0
+    _stats['misses'] = 0
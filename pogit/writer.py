@@ -1,16 +1,149 @@
-from mako.template import Template
+from .templating import GetTemplate
+import subprocess
+import hashlib
+import tempfile
+import stat
 import os
 
 from pogit import __path__ as src_path
 templatePath = src_path[0] + '/templates/'
 
-def WriteSimulationFiles( objs ):
+def _content_hash( data ):
+    """
+    Returns SHA-256 hex digest of the bytes `data`, or of the
+    content of the file if `data` is a path (None if it does not exist)
+    """
+    if type(data) == str:
+        if not os.path.exists(data):
+            return None
+        # large data files are hashed in blocks
+        digest = hashlib.sha256()
+        with open(data, mode='rb') as file:
+            for block in iter(lambda: file.read(2**24), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    return hashlib.sha256(data).hexdigest()
+
+def _replace( path_tmp, path ):
+    """
+    Replaces `path` by the temporary file, with the permissions of the
+    replaced file, or the default ones for a new file (`mkstemp`
+    creates the temporary files readable only by the owner)
+    """
+    if os.path.exists(path):
+        mode = stat.S_IMODE( os.stat(path).st_mode )
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    os.chmod(path_tmp, mode)
+    os.replace(path_tmp, path)
+
+def _write_if_changed( path, text, incremental ):
+    """
+    Writes `text` to `path` and returns the status of the file,
+    which can be 'added', 'changed' or 'unchanged'. In `incremental`
+    mode the text is first written to a temporary file in the same folder,
+    which only replaces the destination if the content hashes differ,
+    so the unchanged files keep their modification times
+    """
+    data = text.encode()
+    hash_old = _content_hash(path)
+    hash_new = _content_hash(data)
+
+    if hash_old is None:
+        status = 'added'
+    elif hash_old == hash_new:
+        status = 'unchanged'
+    else:
+        status = 'changed'
+
+    if not incremental:
+        with open(path, mode='wb') as file:
+            file.write(data)
+        return status
+
+    if status == 'unchanged':
+        return status
+
+    fd, path_tmp = tempfile.mkstemp( dir=os.path.dirname(path),
+                                     prefix='.pogit-', suffix='.tmp' )
+    try:
+        with os.fdopen(fd, mode='wb') as file:
+            file.write(data)
+        _replace(path_tmp, path)
+    except BaseException:
+        if os.path.exists(path_tmp):
+            os.remove(path_tmp)
+        raise
+
+    return status
+
+def _write_data_if_changed( path, write ):
+    """
+    Writes the data file with the function `write(path)` to a temporary
+    file, which replaces `path` only if the content differs. Returns the
+    status of the file ('added', 'changed' or 'unchanged')
+    """
+    fd, path_tmp = tempfile.mkstemp( dir=os.path.dirname(path),
+                                     prefix='.pogit-', suffix='.tmp' )
+    os.close(fd)
+    try:
+        write(path_tmp)
+        hash_old = _content_hash(path)
+        if hash_old is None:
+            status = 'added'
+        elif hash_old == _content_hash(path_tmp):
+            status = 'unchanged'
+        else:
+            status = 'changed'
+
+        if status == 'unchanged':
+            os.remove(path_tmp)
+        else:
+            _replace(path_tmp, path)
+    except BaseException:
+        if os.path.exists(path_tmp):
+            os.remove(path_tmp)
+        raise
+
+    return status
+
+def WriteSimulationFiles( objs, incremental=False ):
     """
     Method which renders all temaplates from the given objects
     and writes the files. Must be called in the directory, where
     `./include/picongpu/param/` and `./etc/picongpu/` exist
+
+    Parameters
+    ----------
+    objs : list of PoGit objects
+        Objects (GridSolver, Particle, Laser, Plugin etc) to be rendered
+
+    incremental : bool
+        If True, the files whose content did not change are not rewritten,
+        so their modification times are kept and CMake does not
+        recompile PIConGPU because of them
+
+    Returns
+    -------
+    report : dict
+        Dictionary with keys 'added', 'changed' and 'unchanged', containing
+        lists of the written files (paths relative to the current folder)
     """
 
+    # The exchange buffers of the ionization electrons are computed
+    # from the ion species, which must be given
+    for obj in objs:
+        if getattr(obj, '_exchange_request', None) is not None \
+          and obj.exchange_memory is None:
+            raise ValueError( f'{obj.name} creates no macroparticles, create '
+                              'the ion species with it as `target_species` '
+                              'or give `particles_per_cell` to size the '
+                              'exchange buffers' )
+
     # Define the output folders
     path_include = './include/picongpu/param/'
     path_etc = './etc/picongpu/'
@@ -30,10 +163,12 @@ def WriteSimulationFiles( objs ):
             if objectTemplate['filename'] not in FilesList:
                 FilesList.append(objectTemplate['filename'])
 
+    report = {'added': [], 'changed': [], 'unchanged': []}
+
     # Render all listed template files from all objects
     for filename in FilesList:
         # create Mako template
-        template = Template( filename=templatePath+filename )
+        template = GetTemplate( filename=templatePath+filename )
 
         # define dictionaries for main and appendable arguments
         templateMain = {}
@@ -92,44 +227,171 @@ def WriteSimulationFiles( objs ):
         # render the template and write the files
         if filename.split('.')[0] == 'run':
             filename_dest = filename.replace('template', 'cfg')
-            with open(path_etc + filename_dest, mode='w') as file:
-                file.writelines(template.render(**templateArgs))
+            path_dest = path_etc + filename_dest
         else:
             filename_dest = filename.replace('template', 'param')
-            with open(path_include+filename_dest, mode='w') as file:
-                file.writelines(template.render(**templateArgs))
+            path_dest = path_include + filename_dest
+
+        status = _write_if_changed( path_dest,
+            template.render(**templateArgs), incremental )
+        report[status].append(path_dest)
 
         # print the name of the file
-        print('\t', filename_dest)
+        print('\t', filename_dest, f'({status})')
+
+    # Write the data files of the objects (e.g. tabulated profiles),
+    # which are read by PIConGPU at runtime
+    for obj in objs:
+        for path_dest, write in getattr(obj, 'data_files', []):
+            status = _write_data_if_changed(path_dest, write)
+            report[status].append(path_dest)
+            print('\t', os.path.basename(path_dest), f'({status})')
+
+    return report
+
+def _execute( command, log='/dev/null', background=False ):
+    """
+    Runs the shell `command` with the output written to the `log` file.
+    Returns the exit code, or None if the command is run in background
+    """
+    with open(log, mode='w') as file:
+        process = subprocess.Popen( command, shell=True, stdout=file,
+                                    stderr=subprocess.STDOUT )
+    if background:
+        return None
+
+    return process.wait()
 
 def WriteAndSubmit( objs, sim_name='run', output_path="$PIC_SCRATCH",
                     write_input=True, build=True, run=True, s='bash',
-                    t='etc/picongpu/bash/mpiexec.tpl' ):
+                    t='etc/picongpu/bash/mpiexec.tpl', incremental=False,
+                    build_cache=None, build_lock=None,
+                    build_command='pic-build', submit_command='tbg',
+                    build_log='/dev/null', run_log='log', background=True,
+                    restart=False ):
     """
     Convenience method to generate the simulation files, build the code and
     runs the simulation locally
     NB: this method does some forced folders removal, should be used
     with care!
+
+    With `incremental=True` only the modified files are rewritten, the
+    previous build is kept for CMake to update, and the build is skipped
+    if no param file was modified and the `bin/picongpu` binary exists
+
+    If `build_cache` (`pogit.build.BuildCache` object) is given, the
+    binaries built with the same compile-time parameters are reused
+    from the cache instead of rebuilding
+
+    If `build_lock` (e.g. `multiprocessing.Semaphore`) is given, it is
+    held while PIConGPU is compiled, to limit the concurrent builds
+
+    The `build_command` and `submit_command` replace `pic-build` and `tbg`,
+    e.g. by local scripts for testing. Their outputs are written to
+    `build_log` and `run_log`. If `background` is False, the method waits
+    for the submission command to finish
+
+    With `restart=True` the simulation is resumed from the latest
+    checkpoint in `<output_path>/<sim_name>/simOutput/<directory>` of the
+    'checkpoint' Plugin (or starts from the beginning if there are none),
+    and with an integer `restart` from the checkpoint at this step. The
+    output folder is kept, and `run.cfg` gets the 'restart' Plugin. The
+    restart is always written incrementally: the previous build is kept,
+    and, as only `run.cfg` changes, the existing `bin/picongpu` is reused
+
+    Returns
+    -------
+    status : dict
+        Dictionary with the files `report` of `WriteSimulationFiles` and
+        exit codes of the `build` and `run` commands (None if not executed)
     """
+    status = {'report': None, 'build': None, 'run': None}
+
+    # Find the checkpoint to restart from
+    if restart is not None and restart is not False:
+        from .plugins import Plugin
+        from .checkpoint import LatestCheckpoint
+
+        checkpoints = [ obj for obj in objs if isinstance(obj, Plugin)
+                        and obj.type == 'checkpoint' ]
+        if len(checkpoints) > 0:
+            directory = checkpoints[0].arguments['directory']
+            backend = checkpoints[0].arguments['backend']
+        else:
+            directory = 'checkpoints'
+            backend = 'openPMD'
+
+        if restart is True:
+            step = LatestCheckpoint(
+                f'{output_path}/{sim_name}/simOutput/{directory}' )
+        else:
+            step = int(restart)
+
+        if step is None:
+            print('*** NO CHECKPOINTS FOUND: START FROM THE BEGINNING')
+            restart = False
+        elif not write_input:
+            raise ValueError('Restart needs `write_input` to add it to run.cfg')
+        else:
+            print(f'*** RESTART FROM THE CHECKPOINT AT STEP {step}')
+            objs = list(objs) + [ Plugin( 'restart', step=step,
+                                          directory=directory,
+                                          backend=backend ), ]
+            # Resume with the same binary instead of rebuilding it
+            incremental = True
 
     # Generate the param files
+    params_modified = True
     if write_input:
         print('*** GENERATE THE SIMULATION INPUT')
-        WriteSimulationFiles( objs )
+        report = WriteSimulationFiles( objs, incremental=incremental )
+        params_modified = any( path.endswith('.param')
+                               for path in report['added']+report['changed'] )
+        status['report'] = report
 
     # Build PIConGPU
     if build:
-        print('*** BUILD PIConGPU')
-        # Clean the previous build
-        os.system(f'rm -rf .build')
-        os.system('pic-build >/dev/null 2>&1')
+        if build_cache is not None:
+            build_key = build_cache.key()
+
+        if incremental and not params_modified \
+          and os.path.exists('./bin/picongpu'):
+            print('*** PARAM FILES ARE NOT MODIFIED: SKIP THE BUILD')
+            status['build'] = 0
+        elif build_cache is not None and build_cache.restore(build_key):
+            print(f'*** REUSE PIConGPU BUILD FROM CACHE ({build_key[:12]})')
+            status['build'] = 0
+        else:
+            if build_lock is not None:
+                build_lock.acquire()
+
+            try:
+                print('*** BUILD PIConGPU')
+                # Clean the previous build
+                if not incremental:
+                    os.system(f'rm -rf .build')
+                status['build'] = _execute(build_command, log=build_log)
+            finally:
+                if build_lock is not None:
+                    build_lock.release()
+
+            if build_cache is not None and status['build'] == 0:
+                build_cache.store(build_key)
 
     # Run the simulation using local bash submission
     if run:
-        # Clean the previous output folders
-        print('*** REMOVE THE USED FOLDERS')
-        os.system(f'rm -rf {output_path}/{sim_name}')
+        if restart is not None and restart is not False:
+            # Keep the output folder with the checkpoints
+            force = '-f '
+        else:
+            # Clean the previous output folders
+            print('*** REMOVE THE USED FOLDERS')
+            os.system(f'rm -rf {output_path}/{sim_name}')
+            force = ''
 
         print('*** RUN THE SIMULATION')
-        os.system( f'tbg -s {s} -c etc/picongpu/run.cfg -t {t} '+\
-                   f'{output_path}/{sim_name} > log &' )
+        status['run'] = _execute(
+            f'{submit_command} {force}-s {s} -c etc/picongpu/run.cfg -t {t} ' + \
+            f'{output_path}/{sim_name}', log=run_log, background=background )
+
+    return status
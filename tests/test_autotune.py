@@ -0,0 +1,93 @@
+"""
+Checks of the supercell autotuning with the stub runners, and of the
+scan runner with a stub submission script, which copies the recorded
+sample of a PIConGPU run (`data/output`)
+"""
+import math
+import os
+import stat
+
+import pytest
+
+from pogit.autotune import SuperCellCandidates, TuneSuperCell, ScanRunner
+from pogit.decomposition import ShapeMargin, max_supercell_volume
+from pogit.grid import GridSolver
+from pogit.plugins import Plugin
+
+data = os.path.join( os.path.dirname(os.path.abspath(__file__)), 'data' )
+
+def test_candidates():
+    volumes = (128, 256, 512, 1024, 2048)
+    candidates = SuperCellCandidates('3d', volumes=volumes)
+    assert (8, 8, 4) in candidates
+    for SuperCell in candidates:
+        assert math.prod(SuperCell) <= max_supercell_volume
+        assert max(SuperCell) <= 4 * min(SuperCell)
+
+    # the larger shapes need thicker guards
+    margin = ShapeMargin(3)
+    assert margin > ShapeMargin(1)
+    thick = SuperCellCandidates('3d', shape_order=3, volumes=volumes)
+    assert 0 < len(thick) < len(candidates)
+    assert all( min(SuperCell) >= margin for SuperCell in thick )
+
+    candidates = SuperCellCandidates('2d', volumes=volumes, max_aspect=1)
+    assert candidates == [ (16, 16, 1), (32, 32, 1) ]
+
+def test_tune_with_stub_runner():
+    candidates = [ (8, 8, 4), (16, 8, 2), (4, 4, 8) ]
+    times = { '8x8x4': 2e-3, '16x8x2': None, '4x4x8': 1e-3 }
+    names = []
+
+    def runner( variants ):
+        names.extend( name for name, objs in variants )
+        assert [ objs for name, objs in variants ] == candidates
+        return [ times[name] for name, objs in variants ]
+
+    results = TuneSuperCell( lambda SuperCell: SuperCell, candidates,
+                             runner=runner, verbose=False )
+    assert names == list(times)
+    assert [ result['super_cell'] for result in results ] \
+        == [ (4, 4, 8), (8, 8, 4), (16, 8, 2) ]
+    assert results[-1]['time_per_step'] is None
+
+    with pytest.raises(ValueError):
+        TuneSuperCell( lambda SuperCell: SuperCell, candidates,
+                       runner=lambda variants: [1e-3], verbose=False )
+
+def _script( path, text ):
+    with open(path, 'w') as file:
+        file.write('#!/bin/bash\n' + text)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    return path
+
+def _grid( SuperCell ):
+    return [ GridSolver( 50e-6, 60e-6, 50e-6, 128, 256, 128, 100, (2, 2, 2),
+                         super_cell=SuperCell ), Plugin(period=100) ]
+
+def test_scan_runner( tmp_path, monkeypatch ):
+    """
+    The variants run as a scan, with the times read from their outputs
+    """
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('input')
+    build = _script( str(tmp_path / 'build.sh'), 'exit 0\n' )
+    # the second variant fails, the others copy the sample output
+    submit = _script( str(tmp_path / 'submit.sh'),
+        'run="${@: -1}"\n'
+        '[[ "$run" == *tune_0001 ]] && exit 1\n'
+        'mkdir -p "$run"\n'
+        f'cp {data}/output "$run"/\n' )
+
+    runner = ScanRunner( path_input='input', path_scan='tune',
+                         output_path='runs', build_command=build,
+                         submit_command=submit )
+    candidates = [ (8, 8, 4), (16, 8, 2), (4, 4, 8) ]
+    results = TuneSuperCell( _grid, candidates, runner=runner,
+                             verbose=False )
+
+    assert [ result['run'] for result in runner.scan.results ] == [0, 1, 0]
+    assert [ result['super_cell'] for result in results ][-1] == (16, 8, 2)
+    assert [ result['time_per_step'] for result in results ] \
+        == [ pytest.approx(28.812 / 2000), pytest.approx(28.812 / 2000),
+             None ]
@@ -0,0 +1,46 @@
+"""
+Checks of the build cache
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from pogit.build import BuildCache
+
+def _make_input( path, content ):
+    os.makedirs( os.path.join(path, 'bin') )
+    with open( os.path.join(path, 'bin', 'picongpu'), 'w' ) as file:
+        file.write(content)
+    return path
+
+def _store( path_cache, path_input ):
+    BuildCache(path_cache).store('key', path_input)
+
+def test_concurrent_store( tmp_path ):
+    """
+    Workers storing the same key do not fail, and leave one full entry
+    """
+    path_cache = str(tmp_path / 'cache')
+    inputs = [ _make_input( str(tmp_path / f'input{i}'), 'binary' )
+               for i in range(4) ]
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        for future in [ executor.submit(_store, path_cache, path)
+                        for path in inputs ]:
+            future.result()
+
+    cache = BuildCache(path_cache)
+    assert os.listdir(path_cache) == ['key']
+    assert [ entry[0] for entry in cache.entries() ] == ['key']
+
+    path_restored = str(tmp_path / 'restored')
+    assert cache.restore('key', path_restored)
+    with open( os.path.join(path_restored, 'bin', 'picongpu') ) as file:
+        assert file.read() == 'binary'
+
+def test_evicted_entry_is_a_miss( tmp_path ):
+    cache = BuildCache( str(tmp_path / 'cache'), max_size=0 )
+    cache.store( 'key', _make_input( str(tmp_path / 'input'), 'binary' ) )
+    cache.evict()
+
+    assert os.listdir(cache.path) == []
+    assert not cache.restore( 'key', str(tmp_path / 'restored') )
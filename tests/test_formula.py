@@ -0,0 +1,31 @@
+"""
+Checks of the translation of the C++ density formulas
+"""
+import pytest
+
+from pogit.formula import ParseFormula, FoldConstants, FormulaToCpp
+from pogit.formula import FormulaFunction
+
+@pytest.mark.parametrize( 'text, value', [
+    ('dens = 1/2*x;', 0.0),
+    ('dens = 1.0/2*x;', 1.0),
+    ('dens = float_X(1)/2*x;', 1.0),
+    ('dens = x*1/2;', 1.0),
+    ('dens = -7/2 + 7%-2 + 4 + (1+1)/4*x;', 2.0),
+] )
+def test_integer_division( text, value ):
+    """
+    Integer literals are divided as in C++, in the NumPy evaluation
+    and in the folded C++ code
+    """
+    assert FormulaFunction(text)(x=2.0, y=0.0, z=0.0) == value
+
+    code = FormulaToCpp( FoldConstants(ParseFormula(text)) )
+    if value == 0.0:
+        assert '0.5' not in code
+
+def test_integer_errors():
+    with pytest.raises(ValueError):
+        ParseFormula('dens = 1/0*x;')
+    with pytest.raises(ValueError):
+        ParseFormula('const auto a = 3/2; dens = a*x;')
@@ -0,0 +1,14 @@
+"""
+Checks of the GridSolver object
+"""
+import numpy as np
+
+from pogit.grid import GridSolver
+
+def test_decomposition_from_numpy_integer():
+    """
+    The device counts of the scan grids are often NumPy integers
+    """
+    for devices in np.arange(4, 9, 4):
+        grid = GridSolver( 50e-6, 60e-6, 50e-6, 128, 256, 128, 100, devices )
+        assert np.prod(grid.decomposition) == devices
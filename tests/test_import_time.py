@@ -0,0 +1,52 @@
+"""
+Regression check of the start-up time: the modules used by the generator
+scripts should import quickly and without the heavy dependencies
+"""
+import os
+import subprocess
+import sys
+
+# modules imported by the generator scripts
+modules = ( 'pogit', 'pogit.grid', 'pogit.particle', 'pogit.laser',
+            'pogit.plugins', 'pogit.writer' )
+
+# dependencies which should be imported only when needed
+deferred = ( 'mendeleev', 'scipy', 'mako', 'numpy', 'h5py' )
+
+# budget of the cumulative import time (in seconds)
+import_budget = 0.5
+
+def ImportTime( modules=modules ):
+    """
+    Returns the cumulative import time (in seconds) of the modules and
+    the list of the `deferred` modules loaded by them, measured with
+    `python -X importtime` in a fresh interpreter
+    """
+    code = f'import {", ".join(modules)}; import sys; ' \
+        f'print(",".join(m for m in {deferred!r} if m in sys.modules))'
+    root = os.path.dirname( os.path.dirname(os.path.abspath(__file__)) )
+    result = subprocess.run( [sys.executable, '-X', 'importtime', '-c', code],
+                             capture_output=True, text=True, cwd=root,
+                             check=True )
+
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        # top-level imports are not indented
+        if name.startswith(' pogit') and cumulative.strip().isdigit():
+            total += int(cumulative)
+
+    loaded = [ name for name in result.stdout.strip().split(',') if name ]
+    return total * 1e-6, loaded
+
+def test_import_time():
+    time, loaded = ImportTime()
+    assert loaded == []
+    assert time < import_budget, f'import takes {time:.3f} s'
+
+if __name__ == '__main__':
+    time, loaded = ImportTime()
+    print(f'*** IMPORT TIME {time*1e3:.1f} ms, deferred modules loaded:',
+          ', '.join(loaded) or 'none')
@@ -0,0 +1,19 @@
+"""
+Checks of the laser codelets
+"""
+from pogit.grid import GridSolver
+from pogit.laser import Laser, LaserAntennas
+
+def test_antenna_group_does_not_return():
+    """
+    The group should not end the current functor, since other antennas
+    can be rendered after it
+    """
+    grid = GridSolver( 50e-6, 60e-6, 50e-6, 64, 128, 64, 100, (1, 1, 1) )
+    lasers = [ Laser( 1.0, 4e-6, 5e-6, 1e-5, iy_antenna=iy,
+                      method='antenna', gridSolver=grid )
+               for iy in (10, 20) ]
+    code = LaserAntennas(lasers).templates[0]['Appendable']['\n']['Antenna']
+
+    assert 'return' not in code
+    assert code.count('{') == code.count('}')
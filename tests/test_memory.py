@@ -0,0 +1,68 @@
+"""
+Checks of the memory estimates
+"""
+import pytest
+
+from pogit.grid import GridSolver
+from pogit.particle import Particle
+from pogit.memory import ExchangeMemCfg
+
+profile = { 'name': 'Gaussian', 'gasCenterLeft': 20e-6,
+            'gasCenterRight': 40e-6, 'gasSigmaLeft': 1e-6,
+            'gasSigmaRight': 1e-6, 'gasFactor': -1.0, 'gasPower': 2.0,
+            'vacuumCellsY': 10 }
+
+def make_grid():
+    return GridSolver( 50e-6, 60e-6, 50e-6, 128, 256, 128, 100, (2, 2, 2) )
+
+def test_exchange_needs_particles(tmp_path, monkeypatch):
+    """
+    The species created by ionization do not get one-frame buffers
+    """
+    from pogit.writer import WriteSimulationFiles
+
+    monkeypatch.chdir(tmp_path)
+    grid = make_grid()
+    electrons = Particle( 'e', species='electron', gridSolver=grid,
+                          exchange_memory='auto' )
+    with pytest.raises(ValueError):
+        WriteSimulationFiles([grid, electrons])
+
+def test_exchange_of_ionization_electrons():
+    """
+    The ion species size the 'auto' buffers of their target species
+    """
+    grid = make_grid()
+    electrons = Particle( 'e', species='electron', gridSolver=grid,
+                          exchange_memory='auto' )
+    definition = electrons.templates[2]['Appendable']['\n']
+    assert 'exchangeMemCfg' not in definition['SpeciesDefinition']
+
+    ions = Particle( 'N', species='ion', element='N', initial_charge=5,
+                     target_species=electrons, typicalNppc=4,
+                     initial_positions=('Random', 4), density_profile=profile,
+                     base_density=1e24, gridSolver=grid )
+
+    assert electrons.ionization_sources == [ions]
+    expected = ExchangeMemCfg(electrons, grid, sources=[ions])
+    assert electrons.exchange_memory == expected
+
+    rendered = definition['SpeciesDefinition']
+    assert 'exchangeMemCfg< ExchangeMemCfge >' in rendered
+    assert f"BYTES_EXCHANGE_Y = {expected['BYTES_EXCHANGE_Y']};" in rendered
+
+def test_exchange_from_sources_and_profile():
+    grid = make_grid()
+    electrons = Particle( 'e', species='electron', typicalNppc=4 )
+    ions = Particle( 'N', species='ion', element='N', initial_charge=5,
+                     target_species=electrons, typicalNppc=4,
+                     initial_positions=('Random', 4), density_profile=profile,
+                     base_density=1e24, gridSolver=grid )
+
+    filled = ExchangeMemCfg(ions, grid)
+    full = ExchangeMemCfg(ions, grid, fill_factor=1.0)
+    assert filled['BYTES_EXCHANGE_Y'] < full['BYTES_EXCHANGE_Y']
+
+    # two charge states left to ionize
+    ionized = ExchangeMemCfg(electrons, grid, sources=[ions])
+    assert ionized['BYTES_EXCHANGE_Y'] > filled['BYTES_EXCHANGE_Y']
@@ -0,0 +1,12 @@
+"""
+Checks of the output planning
+"""
+import numpy as np
+
+from pogit.output import OutputSteps
+
+def test_output_steps():
+    assert OutputSteps(100, 300) == [0, 100, 200, 300]
+    assert OutputSteps(np.int64(100), 300) == [0, 100, 200, 300]
+    assert OutputSteps('100', 300) == [0, 100, 200, 300]
+    assert OutputSteps(0, 300) == []
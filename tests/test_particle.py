@@ -0,0 +1,29 @@
+"""
+Regression checks of the Particle objects
+"""
+import pickle
+
+import numpy as np
+
+from pogit.grid import GridSolver
+from pogit.particle import Particle
+
+def test_tabulated_particle_pickles( tmp_path ):
+    """
+    The Particle objects are sent to the workers of `Scan.run`, so the
+    'Tabulated' profile should not make them unpicklable
+    """
+    grid = GridSolver( 20e-6, 20e-6, 20e-6, 32, 32, 32, 100, (1, 1, 1) )
+    profile = { 'name': 'Tabulated', 'data': np.ones((8, 8, 8)) }
+    particle = Particle( 'e', species='electron', typicalNppc=2,
+                         initial_positions=('Random', 2),
+                         density_profile=profile, base_density=1e25,
+                         gridSolver=grid )
+
+    copy = pickle.loads( pickle.dumps(particle) )
+    assert len(copy.data_files) == 1
+
+    path, write = copy.data_files[0]
+    assert path == particle.data_files[0][0]
+    write( str(tmp_path / 'density.h5') )
+    assert (tmp_path / 'density.h5').exists()
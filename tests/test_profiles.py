@@ -0,0 +1,52 @@
+"""
+Checks of the density statistics and the load prediction
+"""
+import numpy as np
+
+from pogit.grid import GridSolver
+from pogit.particle import Particle
+from pogit.profiles import DensityStatistics, MacroparticlesPerCell
+from pogit.profiles import MIN_WEIGHTING
+from pogit.balance import SupercellLoad, PredictLoad
+
+def test_macroparticles_per_cell():
+    real = np.array([0.0, 5.0, 25.0, 40.0, 1e6]) * MIN_WEIGHTING / 10
+    assert list( MacroparticlesPerCell(real, 4) ) == [0, 0, 2, 4, 4]
+
+def test_low_density_cells_reduced():
+    """
+    The cells of a low density get fewer macroparticles, instead
+    of all or none of them
+    """
+    grid = GridSolver( 16e-6, 16e-6, 16e-6, 16, 16, 16, 10, (1, 1, 1) )
+    cell_volume = np.prod(grid.cell_size)
+    Nppc = 8
+    # 2.5 * MIN_WEIGHTING physical particles per cell
+    base_density = 2.5 * MIN_WEIGHTING / cell_volume
+    particle = Particle( 'e', species='electron', typicalNppc=Nppc,
+                         initial_positions=('Random', Nppc),
+                         density_profile={ 'name': 'FormulaXYZ',
+                                           'Formula': 'dens = 1.0;' },
+                         base_density=base_density )
+
+    stats = DensityStatistics([grid, particle])['e']
+    assert stats['cells'] == 16**3
+    assert stats['macroparticles'] == 2 * 16**3
+
+    load = SupercellLoad(particle, grid, base_density)
+    assert load.sum() == 2 * 16**3
+
+def test_numpy_integer_shift():
+    """
+    The shifts of the moving window may be NumPy integers
+    """
+    grid = GridSolver( 16e-6, 16e-6, 16e-6, 16, 16, 16, 10, (1, 1, 1) )
+    particle = Particle( 'e', species='electron', typicalNppc=2,
+                         initial_positions=('Random', 2),
+                         density_profile={ 'name': 'FormulaXYZ',
+                                           'Formula': 'dens = 1.0;' },
+                         base_density=1e24 )
+
+    report = PredictLoad( [grid, particle], shift=np.int64(4),
+                          verbose=False )
+    assert [ item['shift'] for item in report ] == [4]
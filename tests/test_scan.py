@@ -0,0 +1,76 @@
+"""
+Checks of the parallel scans with the stub build and submission scripts
+"""
+import csv
+import os
+import stat
+
+from pogit.scan import Scan
+from pogit.grid import GridSolver
+from pogit.plugins import Plugin
+
+def _script( path, text ):
+    with open(path, 'w') as file:
+        file.write('#!/bin/bash\n' + text)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    return path
+
+def make_objects( Nsteps ):
+    return [ GridSolver( 50e-6, 60e-6, 50e-6, 128, 256, 128, Nsteps,
+                         (2, 2, 2) ), Plugin(period=100) ]
+
+def _scan( tmp_path, submit ):
+    os.makedirs( tmp_path / 'input' / 'bin' )
+    build = _script( str(tmp_path / 'build.sh'),
+                     'mkdir -p bin\necho built > bin/picongpu\n' )
+    return Scan( make_objects, {'Nsteps': [100, 200]},
+                 path_input=str(tmp_path / 'input'),
+                 path_scan=str(tmp_path / 'scan'), processes=2,
+                 max_builds=1, output_path='runs', build_command=build,
+                 submit_command=submit )
+
+def test_scan( tmp_path, monkeypatch ):
+    monkeypatch.chdir(tmp_path)
+    submit = _script( str(tmp_path / 'submit.sh'),
+                      'mkdir -p "${@: -1}"\necho "$@"\n' )
+    scan = _scan(tmp_path, submit)
+
+    results = scan.run()
+    assert [ result['sim_name'] for result in results ] \
+        == ['scan_0000', 'scan_0001']
+    assert [ result['Nsteps'] for result in results ] == [100, 200]
+    assert [ (result['build'], result['run'], result['error'])
+             for result in results ] == [ (0, 0, ''), (0, 0, '') ]
+    assert scan.failed() == []
+
+    for result in results:
+        path = result['path']
+        assert path == str(tmp_path / 'scan' / result['sim_name'])
+        assert os.path.exists( os.path.join(path, 'bin', 'picongpu') )
+        assert os.path.exists( os.path.join(path, 'etc', 'picongpu',
+                                            'run.cfg') )
+        assert os.path.isdir( os.path.join(path, 'runs', result['sim_name']) )
+        with open(result['log']) as file:
+            log = file.read()
+        assert '*** BUILD PIConGPU' in log
+        assert '*** RUN THE SIMULATION' in log
+        with open( os.path.join(path, 'log') ) as file:
+            assert file.read().strip().endswith(f"runs/{result['sim_name']}")
+
+    scan.write_table('scan.csv')
+    with open('scan.csv', newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert [ (row['Nsteps'], row['sim_name'], row['build'], row['run'])
+             for row in rows ] \
+        == [ ('100', 'scan_0000', '0', '0'), ('200', 'scan_0001', '0', '0') ]
+
+def test_scan_failed( tmp_path, monkeypatch ):
+    monkeypatch.chdir(tmp_path)
+    submit = _script( str(tmp_path / 'submit.sh'),
+                      '[[ "${@: -1}" == *scan_0001 ]] && exit 3\nexit 0\n' )
+    scan = _scan(tmp_path, submit)
+
+    scan.run()
+    assert [ result['run'] for result in scan.results ] == [0, 3]
+    assert [ result['sim_name'] for result in scan.failed() ] \
+        == ['scan_0001']
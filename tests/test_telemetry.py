@@ -0,0 +1,90 @@
+"""
+Checks of the telemetry parser on the recorded sample of a PIConGPU
+run (`data/output` and its trimmed `data/run.cfg`)
+"""
+import os
+import shutil
+
+import pytest
+
+from pogit.telemetry import ParseLog, ParseConfig, ParseRun, StepTimes
+from pogit.telemetry import SlowIntervals, TelemetryStore
+
+data = os.path.join( os.path.dirname(os.path.abspath(__file__)), 'data' )
+
+def test_parse_log():
+    record = ParseLog( os.path.join(data, 'output') )
+
+    assert record['init_time'] == pytest.approx(4.102)
+    assert record['simulation_time'] == pytest.approx(28.812)
+    assert record['total_time'] == pytest.approx(33.120)
+    assert record['steps_done'] == 2000
+    assert record['complete']
+    assert len(record['progress']) == 11
+    assert record['progress'][1] == (10, 200, pytest.approx(2.4))
+
+def test_step_times():
+    record = ParseLog( os.path.join(data, 'output') )
+
+    intervals = StepTimes(record)
+    assert len(intervals) == 10
+    assert intervals[1] == (200, 400, pytest.approx(0.012))
+    assert SlowIntervals(record) == [ (800, 1000, pytest.approx(0.036)) ]
+
+def test_parse_config():
+    config = ParseConfig( os.path.join(data, 'run.cfg') )
+    assert config == { 'devices': 4, 'Nx': 256, 'Ny': 2048, 'Nz': 256,
+                       'Nsteps': 2000 }
+
+def _run( path, name ):
+    run = os.path.join(path, name)
+    os.makedirs( os.path.join(run, 'tbg') )
+    shutil.copy( os.path.join(data, 'output'), run )
+    shutil.copy( os.path.join(data, 'run.cfg'), os.path.join(run, 'tbg') )
+    return run
+
+def test_store_regressions( tmp_path ):
+    store = TelemetryStore( str(tmp_path / 'telemetry.csv') )
+
+    record = ParseRun( _run(tmp_path, 'a'), sim_name='lwfa' )
+    assert record['time_per_step'] == pytest.approx(28.812 / 2000)
+    first = store.add(record, tag=1)
+
+    # the same run parsed again replaces its record
+    again = ParseRun( os.path.join(tmp_path, 'a'), sim_name='lwfa' )
+    assert store.add(again, tag=1) == first
+    assert len(store) == 1
+
+    # another run of the same setup, 20% slower
+    slow = ParseRun( _run(tmp_path, 'b'), sim_name='lwfa' )
+    slow['throughput'] *= 0.8
+    second = store.add(slow, tag=2)
+    assert second != first
+    assert len(store) == 2
+
+    # the stored table is read back
+    store = TelemetryStore( str(tmp_path / 'telemetry.csv') )
+    found = store.regressions(tolerance=0.1)
+    assert [ (row['id'], reference['id']) for row, reference in found ] \
+        == [ (second, first) ]
+
+def test_scan_relative_output( tmp_path, monkeypatch ):
+    """
+    The relative `output_path` of a scan is found from the point folders
+    """
+    from pogit.scan import Scan
+
+    monkeypatch.chdir(tmp_path)
+    scan = Scan( lambda a: [], {'a': [1]}, path_scan='scan',
+                 output_path='runs' )
+    point = tmp_path / 'scan' / 'scan_0000'
+    _run( point / 'runs', 'scan_0000' )
+    os.makedirs( point / 'etc' / 'picongpu' )
+    shutil.copy( os.path.join(data, 'run.cfg'), point / 'etc' / 'picongpu' )
+    scan.results = [ { 'a': 1, 'sim_name': 'scan_0000',
+                       'path': str(point) } ]
+
+    records = scan.telemetry()
+    assert len(records) == 1
+    assert records[0]['a'] == 1
+    assert records[0]['steps_done'] == 2000
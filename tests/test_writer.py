@@ -0,0 +1,60 @@
+"""
+Checks of the incremental writing of the files
+"""
+import os
+import stat
+
+from pogit.writer import _write_if_changed, _write_data_if_changed
+
+def _mode( path ):
+    return stat.S_IMODE( os.stat(path).st_mode )
+
+def test_permissions_kept( tmp_path ):
+    path = str(tmp_path / 'grid.param')
+
+    umask = os.umask(0o022)
+    try:
+        assert _write_if_changed(path, 'a', incremental=True) == 'added'
+        assert _mode(path) == 0o644
+
+        os.chmod(path, 0o664)
+        assert _write_if_changed(path, 'b', incremental=True) == 'changed'
+        assert _mode(path) == 0o664
+
+        data = str(tmp_path / 'density.h5')
+        write = lambda path_tmp: open(path_tmp, 'w').write('data')
+        assert _write_data_if_changed(data, write) == 'added'
+        assert _mode(data) == 0o644
+    finally:
+        os.umask(umask)
+
+def test_restart_keeps_build( tmp_path, monkeypatch ):
+    """
+    The restart reuses the binary of the previous run
+    """
+    from pogit.grid import GridSolver
+    from pogit.plugins import Plugin
+    from pogit.writer import WriteAndSubmit
+
+    monkeypatch.chdir(tmp_path)
+    build = str(tmp_path / 'build.sh')
+    with open(build, 'w') as file:
+        file.write( '#!/bin/bash\nmkdir -p bin .build\n'
+                    'echo built >> builds\ntouch bin/picongpu\n' )
+    os.chmod(build, 0o755)
+
+    objs = [ GridSolver( 50e-6, 60e-6, 50e-6, 128, 256, 128, 100,
+                         (2, 2, 2) ), Plugin(period=100) ]
+    args = dict( output_path=str(tmp_path / 'runs'), build_command=build,
+                 submit_command='true', background=False )
+
+    status = WriteAndSubmit(objs, **args)
+    assert (status['build'], status['run']) == (0, 0)
+
+    status = WriteAndSubmit(objs, restart=100, **args)
+    assert (status['build'], status['run']) == (0, 0)
+    assert os.path.isdir('.build')
+    with open('builds') as file:
+        assert file.read() == 'built\n'
+    with open('etc/picongpu/run.cfg') as file:
+        assert '--checkpoint.restart.step 100' in file.read()